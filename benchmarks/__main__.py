@@ -0,0 +1,118 @@
+"""
+Benchmarks of the model, battle and rendering hot paths.
+
+Usage:
+    python -m benchmarks run
+    python -m benchmarks run --save
+    python -m benchmarks compare --threshold 0.3
+    python -m benchmarks check
+
+`run --save` stores the results as the baseline. `compare` runs the
+suite and exits with status 1 if a metric is slower than the baseline
+beyond the threshold. `check` compares the module effects tracked by
+the board to their computation from scratch on random boards, and
+exits with status 1 on a mismatch. Times are compared relative to a calibration
+workload timed alongside each benchmark. Run from the root of the repository.
+"""
+import argparse
+import os
+import sys
+
+from benchmarks.cases import get_benchmarks
+from benchmarks.checks import check_module_effects
+from benchmarks.suite import (compare_results,
+                            load_results,
+                            run_suite,
+                            save_results
+                        )
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Times the hot paths of the game."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the suite")
+    run_parser.add_argument("-o", "--output", default=None,
+                            help="JSON file the results are written to")
+    run_parser.add_argument("--save", action="store_true",
+                            help="store the results as the baseline")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="run the suite and compare it to a baseline")
+    compare_parser.add_argument("-b", "--baseline", default=BASELINE_PATH,
+                                help="baseline results (default: "
+                                    "benchmarks/baseline.json)")
+    compare_parser.add_argument("-c", "--current", default=None,
+                                help="results to compare instead of "
+                                    "running the suite")
+    compare_parser.add_argument("-t", "--threshold", type=float,
+                                default=0.3,
+                                help="relative slowdown failing the "
+                                    "comparison (default: 0.3)")
+
+    check_parser = subparsers.add_parser(
+        "check", help="check the module effects on random boards")
+    check_parser.add_argument("-n", "--boards", type=int, default=200,
+                            help="number of random boards (default: 200)")
+    check_parser.add_argument("-s", "--seed", type=int, default=0,
+                            help="seed of the boards (default: 0)")
+
+    for subparser in [run_parser, compare_parser]:
+        subparser.add_argument("-k", "--filter", default=None,
+                            help="only run the benchmarks whose name "
+                                "contains this")
+        subparser.add_argument("-r", "--repeat", type=int, default=15,
+                            help="timed batches per benchmark "
+                                "(default: 15)")
+    args = parser.parse_args()
+
+    if args.command == "check":
+        checked, mismatches = check_module_effects(args.boards,
+                                                seed=args.seed)
+        for mismatch in mismatches:
+            print(mismatch)
+        print(f"{checked} board changes checked, "
+            f"{len(mismatches)} mismatches.")
+        if mismatches:
+            sys.exit(1)
+        return
+
+    if args.command == "run":
+        results = run_suite(get_benchmarks(), args.filter, args.repeat)
+        if args.output is not None:
+            save_results(args.output, results)
+        if args.save:
+            save_results(BASELINE_PATH, results)
+        return
+
+    baseline = load_results(args.baseline)
+    if args.current is not None:
+        current = load_results(args.current)
+    else:
+        current = run_suite(get_benchmarks(),
+                            args.filter,
+                            args.repeat,
+                            verbose=False)
+    if args.filter is not None:
+        baseline["results"] = {name: value for name, value
+                            in baseline["results"].items()
+                            if args.filter in name}
+
+    regressions, missing = compare_results(baseline, current, args.threshold)
+    if missing:
+        print(f"{len(missing)} metrics of the baseline were not run.")
+    if regressions:
+        print(f"{len(regressions)} metrics regressed beyond "
+            f"{args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print("No regression.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+import itertools
+import os
+import random
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.suite import Benchmark
+from scripts.controllers.gameengine import GameEngine
+from scripts.model.model import Deck
+from scripts.sim.policies import RandomPolicy
+from scripts.sim.tournament import play_game
+from scripts.utils.functions import (calculate_position,
+                                    coordinates_cube_to_pixel,
+                                    coordinates_pixel_to_cube,
+                                    get_board_hexes,
+                                    get_neighbors_hex_positions
+                                )
+from scripts.utils.config import CUBE_DIRECTION_VECTORS
+
+
+# Seeds of the canned full boards
+BOARD_SEEDS = (0, 1, 2, 3)
+# Player turns played before the canned mid-game states
+MID_GAME_TURNS = 8
+
+
+def full_board(seed: int,
+            armies: Tuple[str, str] = ("borgo", "moloch")
+        ) -> Tuple[GameEngine, Tuple]:
+    """
+    Builds a canned full board: the HQs, then units and modules of
+    both armies in turn on every free hex, at seeded positions and
+    rotations. No battle is resolved.
+
+    Args:
+        seed (int): Seed of the board
+        armies (Tuple[str, str], optional):
+            Army names of the players. Defaults to ("borgo", "moloch").
+
+    Returns:
+        Tuple[GameEngine, Tuple]:
+            The engine and the snapshot of its full board
+    """
+    rng = random.Random(seed)
+    engine = GameEngine(armies, rng=rng)
+    board = engine.board
+    for player in engine.players:
+        engine.place_hq(player, rng.choice(engine.free_positions()))
+
+    decks = itertools.cycle([[tile for tile in player.deck.tiles
+                            if tile.kind in ["unite", "module"]]
+                            for player in engine.players])
+    for position in rng.sample(engine.free_positions(),
+                            len(engine.free_positions())):
+        tile = next(decks).pop()
+        tile.rotate_tile(rng.randint(0, 5)) # type: ignore
+        tile.set_attribute("board_position", position)
+        board.add_tile_to_board(tile)
+    engine._update_netted_tiles()
+    return engine, engine.snapshot()
+
+
+def mid_game(seed: int,
+            armies: Tuple[str, str] = ("borgo", "moloch")
+        ) -> GameEngine:
+    """
+    Plays the first MID_GAME_TURNS turns of a seeded game between two
+    random policies: the state a search clones, a partly filled board
+    and tiles left in the decks.
+
+    Args:
+        seed (int): Seed of the game
+        armies (Tuple[str, str], optional):
+            Army names of the players. Defaults to ("borgo", "moloch").
+
+    Returns:
+        GameEngine: The engine, tiles of the next turn drawn
+    """
+    engine = GameEngine(armies, rng=random.Random(seed))
+    engine.set_up()
+    policies = {player.name: RandomPolicy(seed + index)
+                for index, player in enumerate(engine.players)}
+    for player in engine.players:
+        policies[player.name].place_hq(engine, player)
+    for _ in range(MID_GAME_TURNS):
+        engine.draw_tiles()
+        engine.end_turn(
+            policies[engine.current_player.name].play_turn(engine))
+    engine.draw_tiles()
+    return engine
+
+
+def tile_rotate() -> Callable[[], Any]:
+    """Rotates a unit through its 6 rotational indexes."""
+    tile = next(tile for tile in Deck("borgo", random.Random(0)).tiles
+                if tile.kind == "unite")
+    rotations = itertools.cycle(range(6))
+    return lambda: tile.rotate_tile(next(rotations)) # type: ignore
+
+
+def deck_construction() -> Callable[[], Any]:
+    """Builds and shuffles the deck of an army."""
+    return lambda: Deck("borgo", random.Random(0))
+
+
+def board_add_remove() -> Callable[[], Any]:
+    """Removes a unit from a canned full board, then adds it back."""
+    engine, _ = full_board(0)
+    board = engine.board
+    tile = board.tiles["borgo"][-1]
+    position = tile.board_position
+
+    def add_remove() -> None:
+        board.remove_tile_from_board(tile.id_tile)
+        tile.set_attribute("board_position", position)
+        board.add_tile_to_board(tile)
+    return add_remove
+
+
+def battle_full_board() -> Callable[[], Any]:
+    """Resolves the battle of the canned full boards, restored first."""
+    boards = itertools.cycle([full_board(seed) for seed in BOARD_SEEDS])
+
+    def battle() -> None:
+        engine, state = next(boards)
+        engine.restore(state)
+        engine.battleevaluator.resolve_battle()
+    return battle
+
+
+def battle_full_board_stats() -> Callable[[], Any]:
+    """Resolves the battle of the canned full boards, recording stats."""
+    boards = itertools.cycle([full_board(seed) for seed in BOARD_SEEDS])
+
+    def battle() -> None:
+        engine, state = next(boards)
+        engine.restore(state)
+        engine.battleevaluator.record_stats = True
+        engine.battleevaluator.resolve_battle()
+    return battle
+
+
+def board_restore() -> Callable[[], Any]:
+    """Restores the canned full boards, to subtract from the battle."""
+    boards = itertools.cycle([full_board(seed) for seed in BOARD_SEEDS])
+
+    def restore() -> None:
+        engine, state = next(boards)
+        engine.restore(state)
+    return restore
+
+
+def board_snapshot() -> Callable[[], Any]:
+    """Takes the snapshot of the boards of canned mid-game states."""
+    boards = itertools.cycle([mid_game(seed).board for seed in BOARD_SEEDS])
+    return lambda: next(boards).snapshot()
+
+
+def snapshot_restore() -> Callable[[], Any]:
+    """Clones canned mid-game states: snapshot, then restore."""
+    engines = itertools.cycle([mid_game(seed) for seed in BOARD_SEEDS])
+
+    def clone() -> None:
+        engine = next(engines)
+        engine.restore(engine.snapshot())
+    return clone
+
+
+def module_effects() -> Callable[[], Any]:
+    """Recomputes the module effects of a canned full board."""
+    engine, _ = full_board(0)
+    return engine.moduleevaluator.apply_all_effect_modules
+
+
+def cube_to_pixel() -> Callable[[], Any]:
+    """Converts every hex of the board to pixels."""
+    hexes = get_board_hexes()
+    return lambda: [coordinates_cube_to_pixel(x) for x in hexes]
+
+
+def pixel_to_cube() -> Callable[[], Any]:
+    """Converts the pixel position of every hex of the board to cube."""
+    pixels = [coordinates_cube_to_pixel(x) for x in get_board_hexes()]
+    return lambda: [coordinates_pixel_to_cube(x) for x in pixels]
+
+
+def neighbors() -> Callable[[], Any]:
+    """Lists the neighbors of every hex of the board."""
+    hexes = get_board_hexes()
+    return lambda: [get_neighbors_hex_positions(x) for x in hexes]
+
+
+def positions() -> Callable[[], Any]:
+    """Moves every hex of the board in every direction."""
+    moves = [(x, direction) for x in get_board_hexes()
+            for direction in CUBE_DIRECTION_VECTORS]
+    return lambda: [calculate_position(x, direction)
+                    for x, direction in moves]
+
+
+def random_game() -> Callable[[], Any]:
+    """Plays a whole seeded game between two random policies."""
+    return lambda: play_game(("borgo", "moloch"), 0)
+
+
+def tileview_creation() -> Callable[[], Any]:
+    """Creates a tile sprite, its images being in the asset cache."""
+    from scripts.view.view import TileView
+    return lambda: TileView("borgo-mutant1")
+
+
+def tileview_creation_uncached() -> Callable[[], Any]:
+    """Creates a tile sprite, loading and scaling its images."""
+    from scripts.view.assets import get_assets
+    create = tileview_creation()
+
+    def create_uncached() -> None:
+        get_assets().clear()
+        create()
+    return create_uncached
+
+
+def tileview_rotation() -> Callable[[], Any]:
+    """Builds the rotated images of a tile sprite."""
+    from scripts.view.view import TileManipulator, TileView
+    tileview = TileView("borgo-mutant1")
+    manipulator = TileManipulator(tileview)
+    angles = itertools.cycle(range(6))
+
+    def rotate() -> None:
+        tileview.angle_index = next(angles) # type: ignore
+        manipulator._preload_rotated_image()
+    return rotate
+
+
+def tileview_rotation_uncached() -> Callable[[], Any]:
+    """Loads and renders the rotated images of a tile sprite."""
+    from scripts.view.assets import get_assets
+    from scripts.view.view import get_rotated_image
+    rotate = tileview_rotation()
+
+    def rotate_uncached() -> None:
+        get_assets().clear()
+        get_rotated_image.cache_clear()
+        rotate()
+    return rotate_uncached
+
+
+def get_benchmarks() -> List[Benchmark]:
+    """
+    Returns the benchmarks of the suite. The rendering ones need pygame
+    and the images, they run without display.
+
+    Returns:
+        List[Benchmark]: The benchmarks
+    """
+    benchmarks = [
+        Benchmark("model.tile_rotate", tile_rotate),
+        Benchmark("model.deck_construction", deck_construction),
+        Benchmark("model.board_add_remove", board_add_remove),
+        Benchmark("model.board_restore", board_restore),
+        Benchmark("model.board_snapshot", board_snapshot),
+        Benchmark("model.snapshot_restore", snapshot_restore),
+        Benchmark("battle.full_board", battle_full_board),
+        Benchmark("battle.full_board_stats", battle_full_board_stats),
+        Benchmark("battle.module_effects", module_effects),
+        Benchmark("functions.cube_to_pixel", cube_to_pixel),
+        Benchmark("functions.pixel_to_cube", pixel_to_cube),
+        Benchmark("functions.neighbors", neighbors),
+        Benchmark("functions.calculate_position", positions),
+        Benchmark("sim.random_game", random_game),
+    ]
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        import pygame # noqa: F401
+    except ImportError:
+        return benchmarks
+    return benchmarks + [
+        Benchmark("render.tileview_creation", tileview_creation),
+        Benchmark("render.tileview_creation_uncached",
+                tileview_creation_uncached),
+        Benchmark("render.tileview_rotation", tileview_rotation),
+        Benchmark("render.tileview_rotation_uncached",
+                tileview_rotation_uncached),
+    ]
@@ -0,0 +1,98 @@
+import random
+from typing import List, Tuple
+
+from scripts.controllers.gameengine import GameEngine
+from scripts.sim.tournament import ARMIES
+
+
+def module_effects_mismatches(engine: GameEngine) -> List[str]:
+    """
+    Compares the module effects tracked incrementally by the board to
+    `ModuleEvaluator.apply_all_effect_modules`, computing them from
+    scratch. The board is refreshed after a mismatch.
+
+    Args:
+        engine (GameEngine): Engine of the board
+
+    Returns:
+        List[str]: Descriptions of the mismatches
+    """
+    board = engine.board
+
+    def effects() -> dict:
+        return {tile.id_tile: (sorted(tile.module_effects),
+                            board.get_controlling_army(tile),
+                            tile.effective_initiative)
+                for army in board.armies
+                for tile in board.tiles[army]}
+
+    tracked = effects()
+    engine.moduleevaluator.apply_all_effect_modules()
+    expected = effects()
+    mismatches = [f"{id_tile}: tracked {tracked[id_tile]}, "
+                f"expected {expected[id_tile]}"
+                for id_tile in expected
+                if tracked[id_tile] != expected[id_tile]]
+    if mismatches:
+        board.refresh_module_effects()
+    return mismatches
+
+
+def check_module_effects(boards: int = 200,
+                        changes: int = 60,
+                        seed: int = 0
+                    ) -> Tuple[int, List[str]]:
+    """
+    Checks the module effects of random boards: tiles of two armies,
+    the same army for mirror matches, are added, moved, rotated and
+    removed at random, and the effects are compared to
+    `apply_all_effect_modules` after each change.
+
+    Args:
+        boards (int, optional): Number of boards. Defaults to 200.
+        changes (int, optional): Changes per board. Defaults to 60.
+        seed (int, optional): Seed of the boards. Defaults to 0.
+
+    Returns:
+        Tuple[int, List[str]]:
+            Number of checked changes and descriptions of the
+            mismatches
+    """
+    rng = random.Random(seed)
+    checked = 0
+    mismatches = []
+    for board_index in range(boards):
+        armies = (rng.choice(ARMIES), rng.choice(ARMIES))
+        engine = GameEngine(armies, rng=random.Random(rng.random())) # type: ignore
+        board = engine.board
+        tiles = [tile
+                for player in engine.players
+                for tile in player.deck.tiles + [player.deck.hq_tile]
+                if tile.kind != "action"]
+        for _ in range(changes):
+            on_board = [tile for tile in tiles
+                        if board.is_tile_on_board(tile.id_tile)]
+            free_positions = board.get_free_positions()
+            change = rng.choice(["add", "add", "move", "rotate", "remove"])
+            if change == "add" and free_positions \
+                    and len(on_board) < len(tiles):
+                tile = rng.choice([tile for tile in tiles
+                                if tile not in on_board])
+                tile.rotate_tile(rng.randint(0, 5)) # type: ignore
+                tile.set_attribute("board_position",
+                                rng.choice(free_positions))
+                board.add_tile_to_board(tile)
+            elif change == "move" and free_positions and on_board:
+                board.move_tile_on_board(rng.choice(on_board),
+                                        rng.choice(free_positions))
+            elif change == "rotate" and on_board:
+                board.rotate_tile_on_board(rng.choice(on_board),
+                                        rng.randint(0, 5)) # type: ignore
+            elif change == "remove" and on_board:
+                board.remove_tile_from_board(rng.choice(on_board).id_tile)
+            else:
+                continue
+            checked += 1
+            mismatches.extend(f"board {board_index} {armies}: {mismatch}"
+                            for mismatch in module_effects_mismatches(engine))
+    return checked, mismatches
@@ -0,0 +1,211 @@
+import json
+import platform
+import timeit
+from dataclasses import dataclass
+from statistics import median
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A timed operation of the suite.
+
+    Attributes
+    ----------
+    name (str):
+        Name of the metric, "<area>.<operation>".
+    setup (Callable[[], Callable[[], Any]]):
+        Builds the fixed, seeded inputs and returns the operation to
+        time. Not timed.
+    """
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+# Minimum duration of a timed batch, in seconds
+BATCH_TIME = 0.05
+
+
+def calibration() -> None:
+    """
+    Fixed pure Python workload, timed alongside each benchmark. The
+    results are compared relative to it, so that a slower or busier
+    machine does not read as a regression.
+    """
+    table: Dict[int, int] = {}
+    for i in range(2000):
+        table[i % 97] = table.get(i % 97, 0) + i * i
+    sorted(table.items(), key=lambda x: x[1])
+
+
+def batch_size(timer: timeit.Timer) -> int:
+    """
+    Returns the number of calls of a batch lasting at least BATCH_TIME.
+
+    Args:
+        timer (timeit.Timer): Timer of the operation
+
+    Returns:
+        int: Number of calls
+    """
+    number = 1
+    while True:
+        for multiple in (1, 2, 5):
+            if timer.timeit(number * multiple) >= BATCH_TIME:
+                return number * multiple
+        number *= 10
+
+
+def measure(operation: Callable[[], Any], repeat: int = 15
+        ) -> Tuple[float, float]:
+    """
+    Times an operation in batches alternated with batches of the
+    calibration workload, so that both see the same load of the
+    machine. The medians over `repeat` batches are kept.
+
+    Args:
+        operation (Callable[[], Any]): The operation
+        repeat (int, optional): Number of timed batches. Defaults to 15.
+
+    Returns:
+        Tuple[float, float]:
+            Time of one call in microseconds, and time of one call
+            relative to one call of the calibration workload
+    """
+    timer = timeit.Timer(operation)
+    calibration_timer = timeit.Timer(calibration)
+    number = batch_size(timer)
+    calibration_number = batch_size(calibration_timer)
+    times: List[float] = []
+    ratios: List[float] = []
+    for _ in range(repeat):
+        time = timer.timeit(number) / number
+        calibration_time = (calibration_timer.timeit(calibration_number)
+                            / calibration_number)
+        times.append(time)
+        ratios.append(time / calibration_time)
+    return median(times) * 1e6, median(ratios)
+
+
+def run_suite(benchmarks: List[Benchmark],
+            pattern: Optional[str] = None,
+            repeat: int = 15,
+            verbose: bool = True
+        ) -> Dict[str, Any]:
+    """
+    Runs the benchmarks of the suite.
+
+    Args:
+        benchmarks (List[Benchmark]): The benchmarks
+        pattern (Optional[str], optional):
+            Only runs the benchmarks whose name contains it. Defaults
+            to None, all the benchmarks.
+        repeat (int, optional):
+            Number of timed batches. Defaults to 15.
+        verbose (bool, optional):
+            True to print each result. Defaults to True.
+
+    Returns:
+        Dict[str, Any]:
+            The results: the platform, the time of one call of each
+            benchmark in microseconds, and relative to the calibration
+            workload, by name
+    """
+    results: Dict[str, float] = {}
+    relative: Dict[str, float] = {}
+    for benchmark in benchmarks:
+        if pattern is not None and pattern not in benchmark.name:
+            continue
+        time, ratio = measure(benchmark.setup(), repeat)
+        results[benchmark.name] = round(time, 3)
+        relative[benchmark.name] = float(f"{ratio:.6g}")
+        if verbose:
+            print(f"{benchmark.name:<32} {time:>12.2f} us "
+                f"{ratio:>12.5f} cal")
+
+    return {"python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+            "relative": relative}
+
+
+def compare_results(baseline: Dict[str, Any],
+                    current: Dict[str, Any],
+                    threshold: float = 0.3
+                ) -> Tuple[List[str], List[str]]:
+    """
+    Compares the results of two runs of the suite, and prints each
+    metric with its ratio to the baseline. The ratio compares the
+    times relative to the calibration workload when both runs have
+    them, the absolute times otherwise.
+
+    Args:
+        baseline (Dict[str, Any]): Results of the reference run
+        current (Dict[str, Any]): Results of the new run
+        threshold (float, optional):
+            Relative slowdown above which a metric regresses. Defaults
+            to 0.3, i.e. 30% slower.
+
+    Returns:
+        Tuple[List[str], List[str]]:
+            Names of the regressed metrics, names of the metrics of the
+            baseline missing in the new run
+    """
+    regressions: List[str] = []
+    missing: List[str] = []
+    baseline_relative = baseline.get("relative", {})
+    current_relative = current.get("relative", {})
+    for name, reference in baseline["results"].items():
+        value = current["results"].get(name)
+        if value is None:
+            missing.append(name)
+            print(f"{name:<32} {'missing':>12}")
+            continue
+
+        if name in baseline_relative and name in current_relative:
+            ratio = current_relative[name] / baseline_relative[name]
+        else:
+            ratio = value / reference if reference else 1.0
+        status = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            status = "REGRESSION"
+        elif ratio < 1 - threshold:
+            status = "faster"
+        print(f"{name:<32} {reference:>10.2f} us {value:>10.2f} us "
+            f"{ratio:>6.2f}x {status}")
+    return regressions, missing
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Reads results saved by `save_results`.
+
+    Args:
+        path (str): Path of the JSON file
+
+    Returns:
+        Dict[str, Any]: The results
+
+    Raises:
+        ValueError: If the file does not hold results of the suite
+    """
+    with open(path, encoding="utf-8") as file:
+        results = json.load(file)
+    if not isinstance(results.get("results"), dict):
+        raise ValueError(f"{path} does not hold benchmark results.")
+    return results
+
+
+def save_results(path: str, results: Dict[str, Any]) -> None:
+    """
+    Writes results of the suite in a JSON file.
+
+    Args:
+        path (str): Path of the JSON file
+        results (Dict[str, Any]): The results
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
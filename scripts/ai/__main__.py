@@ -0,0 +1,73 @@
+"""
+Games between a search bot and the random policy.
+
+Usage:
+    python -m scripts.ai borgo moloch --games 10 --time 1.0 --workers 4
+    python -m scripts.ai borgo moloch --bot alphabeta --depth 3
+"""
+import argparse
+from typing import Union
+
+from scripts.ai.alphabeta import AlphaBetaPolicy
+from scripts.ai.mcts import MCTSPolicy
+from scripts.sim.tournament import ARMIES, play_game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.ai",
+        description="Plays a search bot against the random policy."
+    )
+    parser.add_argument("army", choices=ARMIES,
+                        help="army of the bot")
+    parser.add_argument("enemy_army", choices=ARMIES,
+                        help="army of the random policy")
+    parser.add_argument("-n", "--games", type=int, default=10,
+                        help="number of games (default: 10)")
+    parser.add_argument("-t", "--time", type=float, default=1.0,
+                        help="search time per turn, in seconds "
+                            "(default: 1.0)")
+    parser.add_argument("-b", "--bot", choices=["mcts", "alphabeta"],
+                        default="mcts", help="search of the bot "
+                            "(default: mcts)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="MCTS search processes (default: 1)")
+    parser.add_argument("-d", "--depth", type=int, default=3,
+                        help="alpha-beta maximum depth, in plies "
+                            "(default: 3)")
+    parser.add_argument("-s", "--seed", type=int, default=0,
+                        help="seed of the first game (default: 0)")
+    args = parser.parse_args()
+
+    armies = (args.army, args.enemy_army)
+    policy: Union[MCTSPolicy, AlphaBetaPolicy]
+    if args.bot == "mcts":
+        policy = MCTSPolicy(time_budget=args.time,
+                            workers=args.workers,
+                            seed=args.seed)
+    else:
+        policy = AlphaBetaPolicy(max_depth=args.depth,
+                                time_budget=args.time,
+                                seed=args.seed)
+    wins = draws = 0
+    try:
+        for seed in range(args.seed, args.seed + args.games):
+            record = play_game(armies, seed, {args.army: policy})
+            wins += record.winner == args.army
+            draws += record.winner is None
+    finally:
+        policy.close()
+
+    turns = max(len(policy.stats), 1)
+    nodes = sum(x.nodes for x in policy.stats)
+    elapsed = sum(x.elapsed for x in policy.stats)
+    print(f"{args.games} games, {len(policy.stats)} turns searched in "
+        f"{elapsed:.2f}s ({1000 * elapsed / turns:.1f} ms per turn)")
+    print(f"{args.bot:>10}: {wins} wins, {draws} draws, "
+        f"{args.games - wins - draws} losses")
+    print(f"{nodes / elapsed if elapsed else 0:.0f} nodes/sec, "
+        f"{nodes / turns:.0f} nodes per turn")
+
+
+if __name__ == "__main__":
+    main()
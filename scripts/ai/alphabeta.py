@@ -0,0 +1,542 @@
+import math
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from scripts.ai.mcts import Decision, apply_decision, complete_turn
+from scripts.model.model import ChangeJournal, Player, Tile
+from scripts.model.transposition import TranspositionTable
+from scripts.controllers.gameengine import GameEngine
+from scripts.utils.functions import get_neighbors_hex_positions
+
+
+# Value of one HQ life point, against the value of the units
+HQ_LIFE_WEIGHT = 10.0
+# Value of a won game
+WIN_SCORE = 10000.0
+# Decision ending the turn: the tiles left in hand are discarded
+END_TURN: Decision = ("end", "", ())
+# Kinds of the bounds stored in the transposition table
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """Raised when the time budget of a search is spent."""
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Outcome of the search of one turn.
+
+    Attributes
+    ----------
+    decisions (Tuple[Decision, ...]):
+        Best decisions of the turn, in order.
+    value (float):
+        Evaluation of the best line, for the searching army.
+    depth (int):
+        Depth of the last completed iteration.
+    nodes (int):
+        Number of nodes searched, all iterations together.
+    elapsed (float):
+        Time of the search, in seconds.
+    ends_turn (bool):
+        True if the best line ends the turn after the decisions, the
+        tiles left in hand being discarded.
+    """
+    decisions: Tuple[Decision, ...]
+    value: float
+    depth: int
+    nodes: int
+    elapsed: float
+    ends_turn: bool = False
+
+    @property
+    def nodes_per_sec(self) -> float:
+        """Nodes searched per second."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+def unit_value(tile: Tile) -> float:
+    """
+    Returns the value of a unit on the board: its life points, the
+    power of its attacks, its initiatives, nets and shields.
+
+    Args:
+        tile (Tile): The unit
+
+    Returns:
+        float: Value of the unit
+    """
+    return (tile.life_point
+            + sum(tile.cac_attacks_power or ())
+            + sum(tile.range_attacks_power or ())
+            + len(tile.initiative or ())
+            + len(tile.net_directions or ())
+            + len(tile.shields_directions or ()))
+
+
+def evaluate(engine: GameEngine, army: str) -> float:
+    """
+    Evaluates a position for an army: the HQ life difference, then the
+    value of the surviving units of each side.
+
+    Args:
+        engine (GameEngine): The game engine
+        army (str): Army name of the evaluating side
+
+    Returns:
+        float: The evaluation, positive when the army is ahead
+    """
+    if engine.game_over:
+        winner = engine.winner()
+        if winner is not None:
+            return WIN_SCORE if winner == army else -WIN_SCORE
+
+    score = 0.0
+    for army_name, life in engine.get_hq_life().items():
+        sign = 1 if army_name == army else -1
+        score += sign * HQ_LIFE_WEIGHT * life
+        score += sign * sum(unit_value(tile)
+                            for tile in engine.board.tiles[army_name]
+                            if tile.kind == "unite")
+    return score
+
+
+class AlphaBetaSearch:
+    """
+    Depth-limited expectimax search with alpha-beta pruning over the
+    tile placements leading to the next battle.
+
+    Battles are deterministic once the board is fixed, so the
+    placements of a turn are searched exactly: a max node for the
+    searching player, a min node for the opponent, the battles being
+    resolved by the `BattleEvaluator` when a battle tile is played, the
+    board gets full or the final round ends. The unknown draws are
+    chance nodes: each distinct tile left in the deck of the player, at
+    its frequency. A turn after the current one is modeled with a
+    single drawn tile.
+
+    A ply is one tile played, or the end of a turn. Iterative deepening
+    searches depth 1, 2... until the time budget or the maximum depth,
+    and the transposition table keyed by `HexBoard.zobrist_hash` gives
+    the best move of the previous iteration first. The other moves are
+    ordered by the number of enemy tiles next to the position. Moves
+    are played in place and undone with a `ChangeJournal`.
+
+    Attributes
+    ----------
+    max_depth (int):
+        Maximum depth of the search, in plies.
+    time_budget (float):
+        Search time of a turn, in seconds.
+    table (TranspositionTable):
+        Values and best moves of the searched positions.
+    nodes (int):
+        Number of nodes of the current search.
+
+    Methods
+    ----------
+    search(engine: GameEngine) -> SearchResult:
+        Searches the best decisions of the current player's turn.
+
+    Private Methods
+    ----------
+    _value(depth: int, alpha: float, beta: float, to_draw: bool)\
+            -> float:
+        Returns the value of the position, for the searching army.
+    _chance_value(depth: int) -> float:
+        Returns the expected value over the draws of the player.
+    _moves(best_move: Optional[Decision]) -> List[Decision]:
+        Returns the ordered moves of the current player.
+    _play(move: Decision) -> None:
+        Plays a move on the engine.
+    _position_key() -> int:
+        Returns the key of the position in the transposition table.
+    _principal_variation() -> Tuple[List[Decision], bool]:
+        Returns the best decisions of the turn from the table.
+    """
+
+    def __init__(self,
+                max_depth: int = 3,
+                time_budget: float = 1.0,
+                table_size: int = 1 << 16
+            ) -> None:
+        """
+        Initializes the search.
+
+        Args:
+            max_depth (int, optional):
+                Maximum depth of the search, in plies. Defaults to 3.
+            time_budget (float, optional):
+                Search time of a turn, in seconds. Defaults to 1.0.
+            table_size (int, optional):
+                Number of slots of the transposition table, a power of
+                2. Defaults to 65536.
+
+        Raises:
+            ValueError: If max_depth is lower than 1
+        """
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1.")
+
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0
+        self._engine: GameEngine
+        self._journal = ChangeJournal()
+        self._army = ""
+        self._deadline = 0.0
+
+    def search(self, engine: GameEngine) -> SearchResult:
+        """
+        Searches the best decisions of the current player's turn. Tiles
+        must be drawn before. The engine is left unchanged.
+
+        Args:
+            engine (GameEngine): The game engine
+
+        Returns:
+            SearchResult: Best decisions and statistics of the search
+        """
+        start = time.perf_counter()
+        self._engine = engine
+        self._army = engine.current_player.deck.army_name
+        self._deadline = start + self.time_budget
+        self.nodes = 0
+        self.table.new_generation()
+
+        previous_journal = engine.journal
+        engine.attach_journal(self._journal)
+        # Searched moves are not recorded in the replay of the game
+        replay, engine.replay = engine.replay, None
+        mark = self._journal.mark()
+        decisions: List[Decision] = []
+        ends_turn = False
+        value = 0.0
+        depth = 0
+        try:
+            for iteration_depth in range(1, self.max_depth + 1):
+                try:
+                    value = self._value(iteration_depth,
+                                        -math.inf,
+                                        math.inf,
+                                        False)
+                except SearchTimeout:
+                    self._journal.undo(mark)
+                    break
+                depth = iteration_depth
+                decisions, ends_turn = self._principal_variation()
+        finally:
+            engine.attach_journal(previous_journal)
+            engine.replay = replay
+
+        return SearchResult(decisions=tuple(decisions),
+                            value=value,
+                            depth=depth,
+                            nodes=self.nodes,
+                            elapsed=time.perf_counter() - start,
+                            ends_turn=ends_turn
+                        )
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _value(self,
+            depth: int,
+            alpha: float,
+            beta: float,
+            to_draw: bool
+        ) -> float:
+        """
+        Returns the value of the position for the searching army, with
+        alpha-beta pruning: the value is exact inside (alpha, beta), a
+        bound outside.
+
+        Args:
+            depth (int): Remaining plies
+            alpha (float): Value the searching army is assured of
+            beta (float): Value the opponent is assured of
+            to_draw (bool): True if the current player draws first
+
+        Returns:
+            float: The value of the position
+
+        Raises:
+            SearchTimeout: If the time budget is spent
+        """
+        self.nodes += 1
+        if not self.nodes & 255 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        engine = self._engine
+        if depth == 0 or engine.game_over:
+            return evaluate(engine, self._army)
+        if to_draw:
+            return self._chance_value(depth)
+
+        key = self._position_key()
+        entry = self.table.get(key)
+        best_move = None
+        if entry is not None:
+            entry_depth, entry_value, bound, best_move = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return entry_value
+                if bound == LOWER_BOUND:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if alpha >= beta:
+                    return entry_value
+
+        maximizing = engine.current_player.deck.army_name == self._army
+        original_alpha, original_beta = alpha, beta
+        best_value = -math.inf if maximizing else math.inf
+        journal = self._journal
+        for move in self._moves(best_move):
+            mark = journal.mark()
+            try:
+                self._play(move)
+            except ValueError:
+                journal.undo(mark)
+                continue
+            if move[0] == "discard":
+                value = self._value(depth, alpha, beta, False)
+            else:
+                value = self._value(depth - 1,
+                                    alpha,
+                                    beta,
+                                    move == END_TURN)
+            journal.undo(mark)
+
+            if maximizing and value > best_value:
+                best_value, best_move = value, move
+                alpha = max(alpha, value)
+            elif not maximizing and value < best_value:
+                best_value, best_move = value, move
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_value >= original_beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.table.store(key, (depth, best_value, bound, best_move), depth)
+        return best_value
+
+    def _chance_value(self, depth: int) -> float:
+        """
+        Returns the expected value over the draws of the current
+        player: each distinct tile of the deck, at its frequency.
+
+        Args:
+            depth (int): Remaining plies
+
+        Returns:
+            float: The expected value, for the searching army
+        """
+        deck_tiles = self._engine.current_player.deck.tiles
+        if not deck_tiles:
+            return self._value(depth, -math.inf, math.inf, False)
+
+        draws: Dict[str, List[Tile]] = defaultdict(list)
+        for tile in deck_tiles:
+            draws[tile.url_image].append(tile)
+
+        expected_value = 0.0
+        for tiles in draws.values():
+            mark = self._journal.mark()
+            self._engine.draw_tile(tiles[0].id_tile)
+            expected_value += (len(tiles)
+                            * self._value(depth, -math.inf, math.inf, False))
+            self._journal.undo(mark)
+        return expected_value / len(deck_tiles)
+
+    def _moves(self, best_move: Optional[Decision]) -> List[Decision]:
+        """
+        Returns the moves of the current player: discard a tile when 3
+        are in hand, else place a tile, play a battle tile or end the
+        turn. The best move found before comes first, then battles,
+        then the placements closest to the enemy tiles.
+
+        Args:
+            best_move (Optional[Decision]): Best move found before
+
+        Returns:
+            List[Decision]: The ordered moves
+        """
+        engine = self._engine
+        board = engine.board
+        hand_tiles = engine.current_player.hand.hand_tiles
+        if len(hand_tiles) == 3:
+            moves = [("discard", tile.id_tile, ()) for tile in hand_tiles]
+        else:
+            army = engine.current_player.deck.army_name
+            enemy_positions = {position
+                            for army_name in board.armies
+                            if army_name != army
+                            for position in board.occupied[army_name]}
+            contacts = {position: len(enemy_positions.intersection(
+                            get_neighbors_hex_positions(position)))
+                        for position in board.get_free_positions()}
+            placements = [("place", tile.id_tile, placement)
+                        for tile in hand_tiles
+                        for placement in board.legal_placements(tile)]
+            placements.sort(key=lambda x: -contacts[x[2][0]])
+            moves = [("action", tile.id_tile, ())
+                    for tile in hand_tiles if tile.action == "battle"]
+            moves += placements
+            moves.append(END_TURN)
+
+        if best_move in moves:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        return moves # type: ignore
+
+    def _play(self, move: Decision) -> None:
+        """
+        Plays a move on the engine.
+
+        Args:
+            move (Decision): The move
+
+        Raises:
+            ValueError: If the move is not legal
+        """
+        if move == END_TURN:
+            self._engine.end_turn()
+        else:
+            apply_decision(self._engine, move)
+
+    def _position_key(self) -> int:
+        """
+        Returns the key of the position in the transposition table: the
+        board, the hands and the decks, from their incremental hashes,
+        the round and the final round.
+
+        Returns:
+            int: The key
+        """
+        engine = self._engine
+        tiles_hash = engine.board.zobrist_hash
+        for player in engine.players:
+            tiles_hash ^= player.hand.zobrist_hash ^ player.deck.zobrist_hash
+        return hash((tiles_hash,
+                    engine.round_iteration,
+                    engine.final_round,
+                    engine.game_over))
+
+    def _principal_variation(self) -> Tuple[List[Decision], bool]:
+        """
+        Returns the best decisions of the searching player's turn,
+        following the best moves stored in the table.
+
+        Returns:
+            Tuple[List[Decision], bool]:
+                The decisions, the end of the turn excluded, and True
+                if the line ends the turn
+        """
+        engine = self._engine
+        mark = self._journal.mark()
+        decisions: List[Decision] = []
+        ends_turn = False
+        while (not engine.game_over
+                and engine.current_player.deck.army_name == self._army):
+            entry = self.table.get(self._position_key())
+            if entry is None or entry[3] is None:
+                break
+            if entry[3] == END_TURN:
+                ends_turn = True
+                break
+            decisions.append(entry[3])
+            self._play(entry[3])
+        self._journal.undo(mark)
+        return decisions, ends_turn
+
+
+class AlphaBetaPolicy:
+    """
+    Policy choosing the placements of a turn with `AlphaBetaSearch`.
+
+    Attributes
+    ----------
+    searcher (AlphaBetaSearch):
+        The search.
+    rng (random.Random):
+        Random generator, for the HQ placement and the decisions left
+        after the search.
+    stats (List[SearchResult]):
+        Results of the searches of the policy, one per turn.
+
+    Methods
+    ----------
+    place_hq(engine: GameEngine, player: Player) -> None:
+        Places the HQ of the player on a random free position.
+    play_turn(engine: GameEngine) -> List[str]:
+        Searches and plays the turn of the current player.
+    close() -> None:
+        Releases the resources of the policy.
+    """
+
+    def __init__(self,
+                max_depth: int = 3,
+                time_budget: float = 1.0,
+                seed: Optional[int] = None
+            ) -> None:
+        """
+        Initializes the policy.
+
+        Args:
+            max_depth (int, optional):
+                Maximum depth of the search, in plies. Defaults to 3.
+            time_budget (float, optional):
+                Search time of a turn, in seconds. Defaults to 1.0.
+            seed (Optional[int], optional):
+                Seed of the random generator. Defaults to None.
+        """
+        self.searcher = AlphaBetaSearch(max_depth, time_budget)
+        self.rng = random.Random(seed)
+        self.stats: List[SearchResult] = []
+
+    def place_hq(self, engine: GameEngine, player: Player) -> None:
+        """
+        Places the HQ of the player on a random free position.
+
+        Args:
+            engine (GameEngine): The game engine
+            player (Player): Player placing his HQ
+        """
+        engine.place_hq(player, self.rng.choice(engine.free_positions()))
+
+    def play_turn(self, engine: GameEngine) -> List[str]:
+        """
+        Searches and plays the turn of the current player. Tiles must
+        be drawn before.
+
+        Args:
+            engine (GameEngine): The game engine
+
+        Returns:
+            List[str]: IDs of the tiles kept in hand for the next turn
+        """
+        hand_ids = tuple(tile.id_tile
+                        for tile in engine.current_player.hand.hand_tiles)
+        result = self.searcher.search(engine)
+        self.stats.append(result)
+        decisions = list(result.decisions)
+        for decision in decisions:
+            apply_decision(engine, decision)
+        if not result.ends_turn:
+            # Tiles the search did not decide are completed at random
+            complete_turn(engine, hand_ids, decisions, self.rng)
+        return [id_tile for kind, id_tile, _ in decisions if kind == "keep"]
+
+    def close(self) -> None:
+        """Releases the resources of the policy. Nothing to release."""
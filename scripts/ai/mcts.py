@@ -0,0 +1,517 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from scripts.model.model import Player, Tile
+from scripts.controllers.gameengine import GameEngine
+from scripts.sim.policies import RandomPolicy
+from scripts.utils.config import INNER_BOARD_CUBE_POSITIONS
+from scripts.utils.functions import get_neighbors_hex_positions
+
+
+# Decision of a turn: (kind, tile ID, arguments). Kinds are "discard",
+# "keep", "place" (arguments: position, rotation) and "action"
+# (arguments: keyword arguments of `GameEngine.play_action_tile`).
+Decision = Tuple[str, str, Tuple]
+# Visits and total reward of the nodes of a search, by decision path
+TreeStats = Dict[Tuple[Decision, ...], Tuple[int, float]]
+
+
+@dataclass(frozen=True)
+class SearchStats:
+    """
+    Statistics of the search of one turn, summed over the workers.
+
+    Attributes
+    ----------
+    iterations (int):
+        Number of simulated games.
+    nodes (int):
+        Number of tree nodes created.
+    elapsed (float):
+        Wall time of the search, in seconds.
+    workers (int):
+        Number of processes searching in parallel.
+    """
+    iterations: int
+    nodes: int
+    elapsed: float
+    workers: int
+
+    @property
+    def nodes_per_sec(self) -> float:
+        """Tree nodes created per second, all workers together."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def iterations_per_sec(self) -> float:
+        """Games simulated per second, all workers together."""
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+
+class MCTSNode:
+    """
+    Node of the search tree: a decision of the turn of the searching
+    player.
+
+    Attributes
+    ----------
+    decision (Optional[Decision]):
+        Decision leading to the node. None for the root.
+    parent (Optional[MCTSNode]):
+        Parent node. None for the root.
+    children (List[MCTSNode]):
+        Expanded children.
+    untried (Optional[List[Decision]]):
+        Decisions not expanded yet. None until the node is expanded.
+    visits (int):
+        Number of simulations through the node.
+    value (float):
+        Sum of the rewards of these simulations.
+    """
+
+    __slots__ = ("decision", "parent", "children", "untried", "visits",
+                "value")
+
+    def __init__(self,
+                decision: Optional[Decision] = None,
+                parent: Optional["MCTSNode"] = None
+            ) -> None:
+        self.decision = decision
+        self.parent = parent
+        self.children: List[MCTSNode] = []
+        self.untried: Optional[List[Decision]] = None
+        self.visits = 0
+        self.value = 0.0
+
+    def path(self) -> Tuple[Decision, ...]:
+        """
+        Returns the decisions from the root to the node.
+
+        Returns:
+            Tuple[Decision, ...]: The decisions, in order
+        """
+        decisions = []
+        node: Optional[MCTSNode] = self
+        while node is not None and node.decision is not None:
+            decisions.append(node.decision)
+            node = node.parent
+        return tuple(reversed(decisions))
+
+    def select_child(self, exploration: float) -> "MCTSNode":
+        """
+        Returns the child maximizing the UCB1 score.
+
+        Args:
+            exploration (float): Exploration constant
+
+        Returns:
+            MCTSNode: The child
+        """
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                key=lambda child: child.value / child.visits
+                    + exploration * math.sqrt(log_visits / child.visits))
+
+
+class MCTSPolicy:
+    """
+    Policy choosing the decisions of a turn by Monte-Carlo Tree Search.
+
+    The tree holds the decisions of the current turn: the tile to
+    discard when 3 tiles are drawn, then for each tile of the hand,
+    keep it or play it (every legal placement and rotation from
+    `HexBoard.legal_placements`, every target of an action tile).
+    Leaves are evaluated by playing the rest of the game with random
+    policies on the headless engine, the battles being resolved by the
+    `BattleEvaluator`. The decks are shuffled at each simulation: the
+    search does not know the order of the tiles.
+
+    With several workers, each process searches its own tree from the
+    same position (root parallelism). The visits of the trees are
+    summed to choose the decisions.
+
+    Attributes
+    ----------
+    time_budget (float):
+        Search time of a turn, in seconds.
+    workers (int):
+        Number of processes searching in parallel.
+    max_iterations (Optional[int]):
+        Maximum number of simulations of a turn, all workers together.
+    exploration (float):
+        Exploration constant of UCB1.
+    rng (random.Random):
+        Random generator of the policy.
+    stats (List[SearchStats]):
+        Statistics of the searches of the policy, one per turn.
+
+    Methods
+    ----------
+    place_hq(engine: GameEngine, player: Player) -> None:
+        Places the HQ of the player on a random free position.
+    play_turn(engine: GameEngine) -> List[str]:
+        Searches and plays the turn of the current player.
+    close() -> None:
+        Shuts the worker processes down.
+
+    Private Methods
+    ----------
+    _search(engine: GameEngine) -> List[Decision]:
+        Searches the decisions of the turn.
+    """
+
+    def __init__(self,
+                time_budget: float = 1.0,
+                workers: int = 1,
+                max_iterations: Optional[int] = None,
+                exploration: float = 1.4,
+                seed: Optional[int] = None
+            ) -> None:
+        """
+        Initializes the policy.
+
+        Args:
+            time_budget (float, optional):
+                Search time of a turn, in seconds. Defaults to 1.0.
+            workers (int, optional):
+                Number of processes searching in parallel. With 1, the
+                search runs in the current process. Defaults to 1.
+            max_iterations (Optional[int], optional):
+                Maximum number of simulations of a turn. Defaults to
+                None, only the time budget stops the search.
+            exploration (float, optional):
+                Exploration constant of UCB1. Defaults to 1.4.
+            seed (Optional[int], optional):
+                Seed of the random generator. Defaults to None.
+
+        Raises:
+            ValueError: If workers is lower than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+
+        self.time_budget = time_budget
+        self.workers = workers
+        self.max_iterations = max_iterations
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.stats: List[SearchStats] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def place_hq(self, engine: GameEngine, player: Player) -> None:
+        """
+        Places the HQ of the player on a random free position.
+
+        Args:
+            engine (GameEngine): The game engine
+            player (Player): Player placing his HQ
+        """
+        engine.place_hq(player, self.rng.choice(engine.free_positions()))
+
+    def play_turn(self, engine: GameEngine) -> List[str]:
+        """
+        Searches and plays the turn of the current player. Tiles must
+        be drawn before.
+
+        Args:
+            engine (GameEngine): The game engine
+
+        Returns:
+            List[str]: IDs of the tiles kept in hand for the next turn
+        """
+        hand_ids = tuple(tile.id_tile
+                        for tile in engine.current_player.hand.hand_tiles)
+        decisions = self._search(engine)
+        # Decisions not searched enough are completed at random
+        complete_turn(engine, hand_ids, decisions, self.rng)
+        return [id_tile for kind, id_tile, _ in decisions if kind == "keep"]
+
+    def close(self) -> None:
+        """Shuts the worker processes down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _search(self, engine: GameEngine) -> List[Decision]:
+        """
+        Searches the decisions of the turn, and plays them on the
+        engine.
+
+        Args:
+            engine (GameEngine): The game engine
+
+        Returns:
+            List[Decision]: Decisions played, in order
+        """
+        start = time.perf_counter()
+        seeds = [self.rng.getrandbits(32) for _ in range(self.workers)]
+        max_iterations = (None if self.max_iterations is None
+                        else -(-self.max_iterations // self.workers))
+
+        if self.workers == 1:
+            results = [search_turn(engine,
+                                self.time_budget,
+                                max_iterations,
+                                seeds[0],
+                                self.exploration)]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers)
+            futures = [self._executor.submit(search_turn,
+                                            engine,
+                                            self.time_budget,
+                                            max_iterations,
+                                            seed,
+                                            self.exploration)
+                    for seed in seeds]
+            results = [future.result() for future in futures]
+
+        tree: TreeStats = {}
+        for worker_tree, _, _ in results:
+            for path, (visits, value) in worker_tree.items():
+                total_visits, total_value = tree.get(path, (0, 0.0))
+                tree[path] = (total_visits + visits, total_value + value)
+        self.stats.append(SearchStats(
+            iterations=sum(result[1] for result in results),
+            nodes=sum(result[2] for result in results),
+            elapsed=time.perf_counter() - start,
+            workers=self.workers
+        ))
+
+        decisions: List[Decision] = []
+        children: Dict[Tuple[Decision, ...], List[Decision]] = {}
+        for path in tree:
+            children.setdefault(path[:-1], []).append(path[-1])
+        while tuple(decisions) in children:
+            path = tuple(decisions)
+            decisions.append(max(children[path],
+                                key=lambda x: tree[path + (x,)][0]))
+        for decision in decisions:
+            apply_decision(engine, decision)
+        return decisions
+
+
+def search_turn(engine: GameEngine,
+                time_budget: float,
+                max_iterations: Optional[int],
+                seed: int,
+                exploration: float
+            ) -> Tuple[TreeStats, int, int]:
+    """
+    Searches the turn of the current player with MCTS. The engine is
+    restored in its state at the end. Runs in the worker processes.
+
+    Args:
+        engine (GameEngine): The game engine, tiles drawn
+        time_budget (float): Search time, in seconds
+        max_iterations (Optional[int]): Maximum number of simulations
+        seed (int): Seed of the simulations
+        exploration (float): Exploration constant of UCB1
+
+    Returns:
+        Tuple[TreeStats, int, int]:
+            Visits and rewards by decision path, number of simulations
+            and number of nodes created
+    """
+    rng = random.Random(seed)
+    rollout_policy = RandomPolicy(rng.getrandbits(32))
+    army = engine.current_player.deck.army_name
+    hand_ids = tuple(tile.id_tile
+                    for tile in engine.current_player.hand.hand_tiles)
+    root_state = engine.snapshot()
+    # Simulated games are not recorded in the replay of the game
+    replay, engine.replay = engine.replay, None
+    root = MCTSNode()
+    iterations = nodes = 0
+    deadline = time.perf_counter() + time_budget
+
+    while (time.perf_counter() < deadline
+            and (max_iterations is None or iterations < max_iterations)):
+        engine.restore(root_state)
+        for player in engine.players:
+            rng.shuffle(player.deck.tiles)
+
+        # Selection
+        node = root
+        while node.untried == [] and node.children:
+            node = node.select_child(exploration)
+            apply_decision(engine, node.decision) # type: ignore
+
+        # Expansion
+        path = list(node.path())
+        if node.untried is None:
+            node.untried = turn_decisions(engine, hand_ids, path)
+            rng.shuffle(node.untried)
+        if node.untried:
+            decision = node.untried.pop()
+            try:
+                apply_decision(engine, decision)
+            except ValueError:
+                # Illegal action target, the decision is dropped
+                continue
+            child = MCTSNode(decision, node)
+            node.children.append(child)
+            node = child
+            path.append(decision)
+            nodes += 1
+
+        # Simulation
+        complete_turn(engine, hand_ids, path, rng)
+        engine.end_turn([id_tile for kind, id_tile, _ in path
+                        if kind == "keep"])
+        while not engine.game_over:
+            engine.draw_tiles()
+            engine.end_turn(rollout_policy.play_turn(engine))
+        winner = engine.winner()
+        reward = 1.0 if winner == army else 0.5 if winner is None else 0.0
+
+        # Backpropagation
+        backpropagated: Optional[MCTSNode] = node
+        while backpropagated is not None:
+            backpropagated.visits += 1
+            backpropagated.value += reward
+            backpropagated = backpropagated.parent
+        iterations += 1
+
+    engine.restore(root_state)
+    engine.replay = replay
+    tree: TreeStats = {}
+    stack = list(root.children)
+    while stack:
+        node = stack.pop()
+        if node.visits:
+            tree[node.path()] = (node.visits, node.value)
+        stack.extend(node.children)
+    return tree, iterations, nodes
+
+
+def turn_decisions(engine: GameEngine,
+                hand_ids: Tuple[str, ...],
+                path: List[Decision]
+            ) -> List[Decision]:
+    """
+    Returns the next decisions of the turn: the tile to discard if 3
+    tiles were drawn, then keep or play the next tile of the hand.
+    Some action targets may be illegal, the engine checks them.
+
+    Args:
+        engine (GameEngine): The game engine
+        hand_ids (Tuple[str, ...]): IDs of the tiles drawn this turn
+        path (List[Decision]): Decisions already taken this turn
+
+    Returns:
+        List[Decision]: The decisions. Empty once the turn is decided.
+    """
+    if engine.game_over:
+        return []
+    if len(hand_ids) == 3 and not any(kind == "discard"
+                                    for kind, _, _ in path):
+        return [("discard", id_tile, ()) for id_tile in hand_ids]
+
+    decided = {id_tile for _, id_tile, _ in path}
+    remaining = [id_tile for id_tile in hand_ids if id_tile not in decided]
+    if not remaining:
+        return []
+    tile = next(tile for tile in engine.current_player.hand.hand_tiles
+                if tile.id_tile == remaining[0])
+    return [("keep", tile.id_tile, ())] + tile_decisions(engine, tile)
+
+
+def tile_decisions(engine: GameEngine, tile: Tile) -> List[Decision]:
+    """
+    Returns the ways to play a tile of the hand: every legal placement
+    and rotation of a unit or a module, every target of an action.
+
+    Args:
+        engine (GameEngine): The game engine
+        tile (Tile): Tile of the hand
+
+    Returns:
+        List[Decision]: The decisions
+    """
+    board = engine.board
+    if tile.kind != "action":
+        return [("place", tile.id_tile, placement)
+                for placement in board.legal_placements(tile)]
+
+    own_tiles = board.tiles[tile.army_name]
+    enemy_tiles = [enemy_tile
+                for army in board.armies if army != tile.army_name
+                for enemy_tile in board.tiles[army]]
+    targets: List[Tuple] = []
+    if tile.action == "battle":
+        targets = [()]
+    elif tile.action in ["sniper", "grenade"]:
+        targets = [(("id_target", x.id_tile),) for x in enemy_tiles]
+    elif tile.action == "airstrike":
+        targets = [(("position", x),) for x in INNER_BOARD_CUBE_POSITIONS]
+    elif tile.action == "movement":
+        free_positions = set(board.get_free_positions())
+        targets = [(("id_target", x.id_tile),
+                    ("position", position),
+                    ("rotation", rotation))
+                for x in own_tiles if not x.is_netted
+                for position in get_neighbors_hex_positions(x.board_position)
+                if position in free_positions
+                for rotation in x.template.distinct_rotations]
+    elif tile.action == "push":
+        free_positions = set(board.get_free_positions())
+        targets = [(("id_target", x.id_tile), ("position", position))
+                for x in enemy_tiles
+                for position in get_neighbors_hex_positions(x.board_position)
+                if position in free_positions]
+    return [("action", tile.id_tile, target) for target in targets]
+
+
+def apply_decision(engine: GameEngine, decision: Decision) -> None:
+    """
+    Plays a decision on the engine.
+
+    Args:
+        engine (GameEngine): The game engine
+        decision (Decision): The decision
+
+    Raises:
+        ValueError: If the decision is not legal
+    """
+    kind, id_tile, arguments = decision
+    if kind == "discard":
+        engine.discard_tiles([id_tile])
+    elif kind == "place":
+        engine.place_tile(id_tile, *arguments)
+    elif kind == "action":
+        engine.play_action_tile(id_tile, **dict(arguments))
+
+
+def complete_turn(engine: GameEngine,
+                hand_ids: Tuple[str, ...],
+                path: List[Decision],
+                rng: random.Random
+            ) -> None:
+    """
+    Takes random decisions until the turn is decided. The decisions
+    are played on the engine and appended to the path.
+
+    Args:
+        engine (GameEngine): The game engine
+        hand_ids (Tuple[str, ...]): IDs of the tiles drawn this turn
+        path (List[Decision]): Decisions already taken this turn
+        rng (random.Random): Random generator
+    """
+    decisions = turn_decisions(engine, hand_ids, path)
+    while decisions:
+        rng.shuffle(decisions)
+        for decision in decisions:
+            try:
+                apply_decision(engine, decision)
+            except ValueError:
+                continue
+            path.append(decision)
+            break
+        decisions = turn_decisions(engine, hand_ids, path)
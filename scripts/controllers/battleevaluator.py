@@ -2,15 +2,143 @@
 # import issue
 from __future__ import annotations
 
-import pygame
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field
+from time import perf_counter
+from types import SimpleNamespace
+from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
 import operator
-import copy
 
-from scripts.model.model import  Tile
-from scripts.controllers import gamecontroller
+from scripts.model.model import  Tile, HexBoard
 from scripts.utils.functions import *
-from scripts.utils.config import BOARD_LIMIT
+
+# Only needed for type hints. Importing them at runtime would load
+# pygame and the view in processes resolving battles headlessly.
+if TYPE_CHECKING:
+    import pygame
+    from scripts.controllers import gamecontroller
+
+
+# Outcomes of an attack
+MISS, HIT, SHIELDED_HIT = 0, 1, 2
+
+
+@dataclass
+class PhaseStats:
+    """
+    Counters of one initiative phase of a battle.
+
+    Attributes
+    ----------
+        initiative (int):
+            Initiative of the phase.
+        acting_tiles (int):
+            Number of tiles firing during the phase.
+        melee_hits (int):
+            Number of close-quarters attacks hitting an enemy tile.
+        ranged_hits (int):
+            Number of ranged attacks hitting an enemy tile.
+        shield_absorptions (int):
+            Number of ranged hits reduced by a shield.
+        destroyed_tiles (int):
+            Number of tiles removed at the end of the phase.
+        attack_time (float):
+            Wall time of the attacks, in seconds.
+        removal_time (float):
+            Wall time of the removal of the destroyed tiles, in
+            seconds, the destroyed modules excepted.
+        module_time (float):
+            Wall time of the module effect updates, in seconds: the
+            removal of the destroyed modules, withdrawing their effects
+            from the tiles they reached, and the "quartiermaitre"
+            effects applied again after their conversions.
+    """
+    initiative: int
+    acting_tiles: int = 0
+    melee_hits: int = 0
+    ranged_hits: int = 0
+    shield_absorptions: int = 0
+    destroyed_tiles: int = 0
+    attack_time: float = 0.0
+    removal_time: float = 0.0
+    module_time: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time of the phase, in seconds."""
+        return self.attack_time + self.removal_time + self.module_time
+
+
+@dataclass
+class BattleStats:
+    """
+    Instrumentation of a battle, recorded when the `BattleEvaluator`
+    has `record_stats` set.
+
+    Attributes
+    ----------
+        phases (List[PhaseStats]):
+            Counters of each initiative phase, in order of play.
+        elapsed (float):
+            Wall time of the whole battle, in seconds.
+    """
+    phases: List[PhaseStats] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def acting_tiles(self) -> int:
+        """Number of tile activations over all phases."""
+        return sum(x.acting_tiles for x in self.phases)
+
+    @property
+    def melee_hits(self) -> int:
+        """Number of close-quarters hits over all phases."""
+        return sum(x.melee_hits for x in self.phases)
+
+    @property
+    def ranged_hits(self) -> int:
+        """Number of ranged hits over all phases."""
+        return sum(x.ranged_hits for x in self.phases)
+
+    @property
+    def shield_absorptions(self) -> int:
+        """Number of ranged hits reduced by a shield over all phases."""
+        return sum(x.shield_absorptions for x in self.phases)
+
+    @property
+    def destroyed_tiles(self) -> int:
+        """Number of tiles removed over all phases."""
+        return sum(x.destroyed_tiles for x in self.phases)
+
+    def slowest_phase(self) -> Optional[PhaseStats]:
+        """
+        Returns the phase with the longest wall time.
+
+        Returns:
+            Optional[PhaseStats]: The phase. None without any phase.
+        """
+        return max(self.phases, key=lambda x: x.elapsed, default=None)
+
+
+@dataclass
+class BattleResult:
+    """
+    Outcome of a battle resolved on a `HexBoard`.
+
+    Attributes
+    ----------
+        hq_life_deltas (Dict[str, int]):
+            Life points variation of each HQ on the board during the
+            battle. Keys are army names, negative values are damages.
+        destroyed_tiles (List[str]):
+            IDs of the tiles removed from the board during the battle,
+            in order of destruction.
+        stats (Optional[BattleStats]):
+            Timings and counters of the battle. None unless the
+            evaluator records them.
+    """
+    hq_life_deltas: Dict[str, int] = field(default_factory=dict)
+    destroyed_tiles: List[str] = field(default_factory=list)
+    stats: Optional[BattleStats] = None
 
 
 class BattleEvaluator:
@@ -27,15 +155,19 @@ class BattleEvaluator:
     gamecontroller (GameController): 
         The main controller with all others sub controllers and
         models informations.
+    record_stats (bool):
+        True to record the timings and counters of each battle in its
+        result. Disabled, the battles run without instrumentation.
 
     Methods
     ----------
-    fire(tilemodel: Tile) -> None:
+    fire(tilemodel: Tile, phase: Optional[PhaseStats] = None) -> None:
         Executes both close-quarters combat (CQC) and 
         ranged attacks for a given tile.
 
     generate_attacks_with_quartiermaitre(
-        tilemodel: Tile, event_list: List[pygame.event.Event]
+        tilemodel: Tile, event_list: List[pygame.event.Event],
+        phase: Optional[PhaseStats] = None
     ) -> None:
         Handles special attacks triggered by
         the "quartiermaître" module effect.
@@ -43,16 +175,22 @@ class BattleEvaluator:
     get_same_initiative_tiles(initiative: int) -> List[Tile]:
         Retrieves all tiles with the same initiative level.
 
-    remove_dead_tile() -> None:
-        Removes tiles from the board that have zero or 
-        negative life points.
+    remove_dead_tile(phase: Optional[PhaseStats] = None) -> List[str]:
+        Removes tiles from the board that have negative life
+        points and returns their IDs.
 
     battle_round(initiative_round: int,\
-            event_list: List[pygame.event.Event]) -> None:
+            event_list: Optional[List[pygame.event.Event]] = None,\
+            phase: Optional[PhaseStats] = None) -> List[str]:
         Executes a single round of combat for all tiles 
         with the same initiative.
 
-    run_battle(event_list: List[pygame.event.Event]) -> None:
+    resolve_battle(event_list: Optional[List[pygame.event.Event]]\
+            = None) -> BattleResult:
+        Resolves a whole battle and returns its outcome. Without
+        event list, the battle is resolved without any display.
+
+    run_battle(event_list: List[pygame.event.Event]) -> BattleResult:
         Simulates the battle sequence by resolving rounds in
         descending initiative order.
 
@@ -65,7 +203,8 @@ class BattleEvaluator:
         Identifies the opposing army based on 
         the provided army name.
 
-    _apply_cac_attacks(tilemodel: Tile, enemy_army_name: str):
+    _apply_cac_attacks(tilemodel: Tile, enemy_army_name: str,\
+            phase: Optional[PhaseStats] = None):
         Executes all close-quarters attacks for a given tile.
         This function iterates over the cac attack directions 
         and powers defined for the attacking tile. 
@@ -73,7 +212,8 @@ class BattleEvaluator:
         to `_process_cac_attack`,handling the targeting and
         damage mechanics.
 
-    _apply_range_attacks(tilemodel: Tile, enemy_army_name: str):
+    _apply_range_attacks(tilemodel: Tile, enemy_army_name: str,\
+            phase: Optional[PhaseStats] = None):
         Executes all ranged attacks from a tile 
         against an enemy army.
         This function iterates over the ranged attack directions 
@@ -122,10 +262,6 @@ class BattleEvaluator:
         Retrieves the pixel positions of all valid ranged attack
         directions.
 
-    _is_within_board_range(cube_position: Tuple[int, int, int],\
-        max_range: int = BOARD_LIMIT) -> bool:
-        Verifies whether a position is within the valid board range.
-
     _prompt_and_get_attacke_direction_convertion(\
                     tilemodel: Tile,\
                     attack_pixel_positions: List[Tuple[int, int]],\
@@ -140,13 +276,12 @@ class BattleEvaluator:
 ) -> Tile:
         Creates a copy of the tile and converts a specified attack.
 
-    _converte_range_attack(tilemodel: Tile,\
-        range_attack_to_converte: Tuple[int, int, int]):
-        Converts a ranged attack into a CQC attack.
-
-    _converte_cac_attack(tilemodel: Tile,\
-            cac_attack_to_converte: Tuple[int, int, int]):
-        Converts a CQC attack into a ranged attack.
+    _converte_attack(attack_to_converte: Tuple[int, int, int],\
+        from_directions: List[Tuple[int, int, int]],\
+        from_powers: List[int],\
+        to_directions: List[Tuple[int, int, int]],\
+        to_powers: List[int]):
+        Moves an attack from a kind of attack to the other one.
     """
 
     def __init__(self,
@@ -161,14 +296,19 @@ class BattleEvaluator:
                 models informations.
         """
         self.gamecontroller = gamecontroller
+        self.record_stats = False
 
-    def fire(self, tilemodel: Tile) -> None:
+    def fire(self, tilemodel: Tile, phase: Optional[PhaseStats] = None
+            ) -> None:
         """
         Executes both close-quarters combat (CQC) and ranged attacks for
         a given tile.
 
         Args:
             tilemodel (Tile): The tile initiating the attack.
+            phase (Optional[PhaseStats]):
+                Counters of the round the hits are counted in. None to
+                fire without instrumentation.
         """
         if not isinstance(tilemodel, Tile):
             raise ValueError(f"Invalid tile object: {tilemodel}")
@@ -176,14 +316,15 @@ class BattleEvaluator:
         enemy_army_name = self._get_enemy_army(tilemodel.army_name)
 
         # Gérer les attaques CAC
-        self._apply_cac_attacks(tilemodel, enemy_army_name)
+        self._apply_cac_attacks(tilemodel, enemy_army_name, phase)
 
         # Gérer les attaques à distance
-        self._apply_range_attacks(tilemodel, enemy_army_name)
+        self._apply_range_attacks(tilemodel, enemy_army_name, phase)
 
     def generate_attacks_with_quartiermaitre(self,
                                         tilemodel: Tile,
-                                        event_list: List[pygame.event.Event]
+                                        event_list: List[pygame.event.Event],
+                                        phase: Optional[PhaseStats] = None
                                     ) -> None:
         """Handles special attacks triggered by the "quartiermaître"
         module effect.
@@ -191,12 +332,17 @@ class BattleEvaluator:
         Args:
             tilemodel (Tile): The tile initiating the attack.
             event_list (List[pygame.event.Event]): Pygame events list
+            phase (Optional[PhaseStats]):
+                Counters of the round the hits are counted in. None to
+                fire without instrumentation.
         """
         if not isinstance(tilemodel, Tile):
             raise ValueError(f"Invalid tile object: {tilemodel}")
 
         range_attack_pixel = self._get_pixel_positions_range_attacks(tilemodel)
         cac_attack_pixel = self._get_pixel_positions_cac_attacks(tilemodel)
+        range_attack_to_converte = None
+        cac_attack_to_converte = None
         if range_attack_pixel:
             range_attack_to_converte = \
                 self._prompt_and_get_attacke_direction_convertion(
@@ -212,7 +358,7 @@ class BattleEvaluator:
         tileconverted = self._converte_attacks_and_copy_tile(
             tilemodel, range_attack_to_converte, cac_attack_to_converte)
 
-        self.fire(tileconverted)
+        self.fire(tileconverted, phase)
         self.gamecontroller.moduleevaluator\
             ._clean_quartiermaitre_effect_on_tile(tilemodel)
 
@@ -225,75 +371,170 @@ class BattleEvaluator:
         Returns:
             List[Tile]: List of tile with same initiative
         """
-        return [
-            tile
-            for army in self.gamecontroller.board.armies
-            for tile in self.gamecontroller.board.tiles[army]
-            if tile.initiative == initiative
-        ]
-
-    def remove_dead_tile(self) -> None:
-        """Removes tiles from the board that have zero or negative life
-        points."""
+        return self.gamecontroller.board.get_initiative_tiles(initiative)
+
+    def remove_dead_tile(self, phase: Optional[PhaseStats] = None
+                        ) -> List[str]:
+        """Removes tiles from the board that have negative life points.
+
+        Args:
+            phase (Optional[PhaseStats]):
+                Counters the removal time of the destroyed modules is
+                added to, as module time. None to not count it.
+
+        Returns:
+            List[str]: IDs of the removed tiles
+        """
+        removed_tiles = []
         for army in self.gamecontroller.board.armies:
-            for tile in self.gamecontroller.board.tiles[army]:
+            # Copy the list, removing a tile mutates it
+            for tile in list(self.gamecontroller.board.tiles[army]):
                 if tile.life_point and tile.life_point < 0:
+                    start = perf_counter()
                     self.gamecontroller.board\
                         .remove_tile_from_board(tile.id_tile)
+                    removed_tiles.append(tile.id_tile)
+                    if phase is not None and tile.module:
+                        phase.module_time += perf_counter() - start
+        return removed_tiles
 
     def battle_round(self,
                     initiative_round: int,
-                    event_list: List[pygame.event.Event]
-                    ) -> None:
+                    event_list: Optional[List[pygame.event.Event]] = None,
+                    phase: Optional[PhaseStats] = None
+                    ) -> List[str]:
         """Executes a single round of combat for all tiles with the same
         initiative.
 
         Args:
             initiative_round (int): initiative of the round
-            event_list (List[pygame.event.Event]): Pygame events list
+            event_list (Optional[List[pygame.event.Event]]):
+                Pygame events list. None if the battle is resolved
+                without display, "quartiermaitre" tiles then fire
+                without converting any attack.
+            phase (Optional[PhaseStats]):
+                Counters of the round, filled in place. None to run the
+                round without instrumentation.
+
+        Returns:
+            List[str]: IDs of the tiles destroyed during the round
         """
+        start = perf_counter()
         tiles = self.get_same_initiative_tiles(initiative_round)
+        converted_attacks = False
         for tile in tiles:
-            if "quartiermaitre" in tile.module_effects:
-                self.generate_attacks_with_quartiermaitre(tile, event_list)
+            if (event_list is not None
+                    and "quartiermaitre" in tile.module_effects):
+                self.generate_attacks_with_quartiermaitre(tile,
+                                                        event_list,
+                                                        phase)
+                converted_attacks = True
             else:
-                self.fire(tile)
-        self.remove_dead_tile()
+                self.fire(tile, phase)
+
+        removal_start = perf_counter()
+        destroyed_tiles = self.remove_dead_tile(phase)
+        module_start = perf_counter()
+        # The "quartiermaitre" effects cleaned once fired apply again in
+        # the next rounds
+        if converted_attacks:
+            self.gamecontroller.board.refresh_module_effects()
+
+        if phase is not None:
+            phase.attack_time = removal_start - start
+            # The destroyed modules are already counted as module time
+            phase.removal_time = module_start - removal_start \
+                - phase.module_time
+            phase.module_time += perf_counter() - module_start
+            phase.acting_tiles = len(tiles)
+            phase.destroyed_tiles = len(destroyed_tiles)
+        return destroyed_tiles
+
+    def resolve_battle(self,
+                    event_list: Optional[List[pygame.event.Event]] = None
+                    ) -> BattleResult:
+        """Resolves a whole battle on the board, rounds in descending
+        initiative order, and returns its outcome.
+
+        Only the board of the game controller is used when no event
+        list is given, so the battle can be resolved without any
+        display.
+
+        Args:
+            event_list (Optional[List[pygame.event.Event]]):
+                Pygame events list. None to resolve the battle without
+                display.
 
-    def run_battle(self, event_list: List[pygame.event.Event]) -> None:
+        Returns:
+            BattleResult: HQ life deltas and destroyed tiles
+        """
+        board = self.gamecontroller.board
+        hq_tiles = [tile
+                    for army in board.armies
+                    for tile in board.tiles[army]
+                    if tile.kind == "base"
+                ]
+        hq_life_before = {tile.id_tile: tile.life_point for tile in hq_tiles}
+        result = BattleResult()
+        if self.record_stats:
+            result.stats = BattleStats()
+            start = perf_counter()
+
+        # Module effects are kept up to date by the board, a module
+        # destroyed during a round no longer applies in the next ones.
+        # Only initiatives at which a tile still acts are played.
+        initiative_round = board.next_initiative()
+        while initiative_round is not None:
+            phase = None
+            if result.stats is not None:
+                phase = PhaseStats(initiative_round)
+                result.stats.phases.append(phase)
+            result.destroyed_tiles.extend(
+                self.battle_round(initiative_round=initiative_round,
+                                event_list=event_list,
+                                phase=phase
+                                )
+            )
+            initiative_round = board.next_initiative(initiative_round)
+
+        if result.stats is not None:
+            result.stats.elapsed = perf_counter() - start
+
+        for tile in hq_tiles:
+            result.hq_life_deltas[tile.army_name] = \
+                tile.life_point - hq_life_before[tile.id_tile]
+        return result
+
+    def run_battle(self, event_list: List[pygame.event.Event]
+                ) -> BattleResult:
         """Simulates the battle sequence by resolving rounds in
         descending initiative order.
 
         Args:
             event_list (List[pygame.event.Event]): Pygame events list
+
+        Returns:
+            BattleResult: HQ life deltas and destroyed tiles
         """
-        initiative_round = self._get_max_initiative()
-        while initiative_round >= 0:
-            self.gamecontroller.moduleevaluator.apply_all_effect_modules()
-            self.battle_round(initiative_round=initiative_round,
-                            event_list=event_list
-                            )
-            self.gamecontroller.moduleevaluator.clean_all_effect_modules()
-            initiative_round -= 1
+        return self.resolve_battle(event_list)
 
 # --- MÉTHODES PRIVÉES ---
 
     def _get_max_initiative(self) -> int:
         """Return the highest initiative among all tiles on the board.
         """
-        return max(
-            max(tilemodel.initiative)
-            for army in self.gamecontroller.board.armies
-            for tilemodel in self.gamecontroller.board.tiles[army]
-            if tilemodel.initiative
-        )
+        max_initiative = self.gamecontroller.board.next_initiative()
+        return -1 if max_initiative is None else max_initiative
 
     def _get_enemy_army(self, army_name: str) -> str:
         """Identifies the opposing army based on the provided army name.
         """
         return next_element(self.gamecontroller.board.armies, army_name)
 
-    def _apply_cac_attacks(self, tilemodel: Tile, enemy_army_name: str):
+    def _apply_cac_attacks(self,
+                        tilemodel: Tile,
+                        enemy_army_name: str,
+                        phase: Optional[PhaseStats] = None):
         """
         Executes all close-quarters attacks for a given tile.
 
@@ -308,17 +549,25 @@ class BattleEvaluator:
                 The attacking tile performing the cac attacks.
             enemy_army_name (str):
                 The name of the enemy army to target.
+            phase (Optional[PhaseStats]):
+                Counters the hits are added to. None to not count them.
         """
         if tilemodel.cac_attacks_direction:
+            cac_attacks_power = tilemodel.effective_cac_attacks_power
             for index, cac_attack_direction in \
                     enumerate(tilemodel.cac_attacks_direction):
-                self._process_cac_attack(tilemodel,
-                                        enemy_army_name,
-                                        cac_attack_direction,
-                                        tilemodel.cac_attacks_power[index]
-                                        )
-
-    def _apply_range_attacks(self, tilemodel: Tile, enemy_army_name: str):
+                outcome = self._process_cac_attack(tilemodel,
+                                                enemy_army_name,
+                                                cac_attack_direction,
+                                                cac_attacks_power[index]
+                                                )
+                if phase is not None:
+                    phase.melee_hits += outcome != MISS
+
+    def _apply_range_attacks(self,
+                            tilemodel: Tile,
+                            enemy_army_name: str,
+                            phase: Optional[PhaseStats] = None):
         """
         Executes all ranged attacks from a tile against an enemy army.
 
@@ -333,22 +582,30 @@ class BattleEvaluator:
                 The attacking tile performing the ranged attacks.
             enemy_army_name (str):
                 The name of the enemy army to target.
+            phase (Optional[PhaseStats]):
+                Counters the hits and shield absorptions are added to.
+                None to not count them.
         """
         if tilemodel.range_attacks_direction:
+            range_attacks_power = tilemodel.effective_range_attacks_power
             for index, range_attack_direction in \
                     enumerate(tilemodel.range_attacks_direction):
-                self._process_range_attack(tilemodel,
-                                        enemy_army_name,
-                                        range_attack_direction,
-                                        tilemodel.range_attacks_power[index]
-                                        )
+                outcome = self._process_range_attack(
+                    tilemodel,
+                    enemy_army_name,
+                    range_attack_direction,
+                    range_attacks_power[index]
+                )
+                if phase is not None:
+                    phase.ranged_hits += outcome != MISS
+                    phase.shield_absorptions += outcome == SHIELDED_HIT
 
     def _process_cac_attack(self,
                             tilemodel: Tile,
                             enemy_army_name: str,
                             cac_attack_direction: Tuple[int, int, int],
                             cac_attack_power: int
-                            ):
+                            ) -> int:
         """
         Processes a close-quarters combat (CQC) attack from a tile,
         applying damage to an enemy tile in the specified direction.
@@ -369,32 +626,42 @@ class BattleEvaluator:
                 The direction of the attack in cube coordinates.
             cac_attack_power (int):
                 The power of the close-combat attack.
+
+        Returns:
+            int: HIT if an enemy tile is hit, else MISS
         """
 
-        cac_attack_position = calculate_position(
-            tilemodel.board_position, cac_attack_direction
+        board = self.gamecontroller.board
+        cac_attack_position = get_neighbor_position(
+            tilemodel.board_position,
+            tuple(cac_attack_direction), # type: ignore
+            board.board_limit
         )
-        enemy_tilemodel = self.gamecontroller.board.find_army_tile_at_position(
+        if cac_attack_position is None:
+            return MISS
+        enemy_tilemodel = board.find_battle_tile_at_position(
             enemy_army_name, cac_attack_position
         )
         if enemy_tilemodel and enemy_tilemodel.life_point:
-            enemy_tilemodel.life_point -= \
-                cac_attack_power
+            enemy_tilemodel.set_attribute(
+                "life_point", enemy_tilemodel.life_point - cac_attack_power)
+            return HIT
+        return MISS
 
     def _process_range_attack(self,
                             tilemodel: Tile,
                             enemy_army_name: str,
                             range_attack_direction: Tuple[int, int, int],
                             range_attack_power: int
-                        ):
+                        ) -> int:
         """
         Processes a ranged attack from a tile and applies damage to the
         enemy target if hit.
 
-        This function simulates a ranged attack by iteratively advancing
-        in the specified direction from the tile's current position.
-        If the attack encounters an enemy tile, it calculates the
-        damage, factoring in potential shield protection.
+        This function scans the precomputed ray of the tile's position
+        in the specified direction, until the board edge. Every enemy
+        tile encountered takes the damage, factoring in potential
+        shield protection.
 
         Args:
             tilemodel (Tile):
@@ -405,30 +672,38 @@ class BattleEvaluator:
                 The direction of the ranged attack in cube coordinates.
             range_attack_power (int):
                 The base power of the ranged attack.
-        """
-        touched = False
-        range_attack_position = tilemodel.board_position
-        while (self._is_within_board_range(range_attack_position)
-                or not touched):
 
-            range_attack_position = calculate_position(
-                range_attack_position, range_attack_direction
-            )
-            enemy_tilemodel = self.gamecontroller.board.\
-                find_army_tile_at_position(
-                enemy_army_name,
-                range_attack_position
-            )
-            if enemy_tilemodel and enemy_tilemodel.life_point:
+        Returns:
+            int: SHIELDED_HIT if a hit is reduced by a shield, HIT if
+                an enemy tile is hit, else MISS
+        """
+        board = self.gamecontroller.board
+        hex_tiles = board.hex_tiles
+        origin_index = get_hex_index(board.board_limit)[
+            tilemodel.board_position]
+
+        outcome = MISS
+        # Invalid directions have no ray and hit nothing
+        for hex_index in get_ray_table(board.board_limit).get(
+                (origin_index, tuple(range_attack_direction)), ()):
+            enemy_tilemodel = hex_tiles[hex_index]
+            if enemy_tilemodel is None or board.get_controlling_army(
+                    enemy_tilemodel) != enemy_army_name:
+                continue
+            if enemy_tilemodel.life_point:
+                shield_point = 0
                 if enemy_tilemodel.shields_directions:
                     for shield in enemy_tilemodel.shields_directions:
                         if range_attack_direction == \
                                 tuple([z * -1 for z in shield]):
                             shield_point = 1
 
-                    enemy_tilemodel.life_point -= (
-                        range_attack_power - shield_point)
-                    touched = True
+                enemy_tilemodel.set_attribute(
+                    "life_point",
+                    enemy_tilemodel.life_point
+                    - max(range_attack_power - shield_point, 0))
+                outcome = max(outcome, SHIELDED_HIT if shield_point else HIT)
+        return outcome
 
     def _get_pixel_positions_cac_attacks(self,
                                         tilemodel: Tile
@@ -471,20 +746,6 @@ class BattleEvaluator:
             ]
             return list_cubes_to_pixel(real_cac_attack_directions)
 
-    def _is_within_board_range(self,
-                            cube_position: Tuple[int, int, int],
-                            max_range: int = BOARD_LIMIT
-                            ) -> bool:
-        """Verifies whether a position is within the valid board range.
-
-        Args:
-            cube_position (Tuple[int, int, int]): Position to checke
-            max_range (int, optional): Board limit.
-        Returns:
-            bool: True if is within the valid board range.
-        """
-        return all(abs(coord) <= max_range for coord in cube_position)
-
     def _prompt_and_get_attacke_direction_convertion(
         self,
         tilemodel: Tile,
@@ -525,6 +786,9 @@ class BattleEvaluator:
                     ) -> Tile:
         """Creates a copy of the tile and converts a specified attack.
 
+        The template of the tile is shared with other tiles, the copy
+        gets its own template with the converted attacks.
+
         Args:
             tilemodel (Tile): Tile to copy and convert
             range_attack_to_converte (Optional[Tuple[int, int, int]]): 
@@ -535,45 +799,74 @@ class BattleEvaluator:
         Returns:
             Tile: The copied tile with converted attack
         """
-        tilecopy = copy.deepcopy(tilemodel)
+        range_directions = list(tilemodel.range_attacks_direction or [])
+        range_powers = list(tilemodel.range_attacks_power or [])
+        cac_directions = list(tilemodel.cac_attacks_direction or [])
+        cac_powers = list(tilemodel.cac_attacks_power or [])
         if range_attack_to_converte:
-            self._converte_range_attack(tilecopy, range_attack_to_converte)
+            self._converte_attack(range_attack_to_converte,
+                                range_directions, range_powers,
+                                cac_directions, cac_powers)
         if cac_attack_to_converte:
-            self._converte_cac_attack(tilecopy, cac_attack_to_converte)
+            self._converte_attack(cac_attack_to_converte,
+                                cac_directions, cac_powers,
+                                range_directions, range_powers)
+
+        tilecopy = tilemodel.copy()
+        tilecopy.template = tilemodel.template.with_attacks(
+            tilemodel.rotational_index,
+            range_directions, range_powers,
+            cac_directions, cac_powers
+        )
         return tilecopy
 
-    def _converte_range_attack(self,
-                            tilemodel: Tile,
-                            range_attack_to_converte: Tuple[int, int, int]
-                            ) -> None:
-        """Converts a ranged attack into a CQC attack.
+    def _converte_attack(self,
+                        attack_to_converte: Tuple[int, int, int],
+                        from_directions: List[Tuple[int, int, int]],
+                        from_powers: List[int],
+                        to_directions: List[Tuple[int, int, int]],
+                        to_powers: List[int]
+                        ) -> None:
+        """Moves an attack from a kind of attack to the other one
+        (ranged into CQC or CQC into ranged).
 
         Args:
-            tilemodel (Tile): Tile to convert.
-            range_attack_to_converte (Tuple[int, int, int]): 
+            attack_to_converte (Tuple[int, int, int]): 
                 Attack direction to convert.
+            from_directions (List[Tuple[int, int, int]]):
+                Directions of the converted kind of attack.
+            from_powers (List[int]):
+                Powers of the converted kind of attack.
+            to_directions (List[Tuple[int, int, int]]):
+                Directions of the new kind of attack.
+            to_powers (List[int]):
+                Powers of the new kind of attack.
         """
-        index_power = tilemodel.range_attacks_direction.index(
-            range_attack_to_converte)
-        tilemodel.range_attacks_direction.remove(range_attack_to_converte)
-        power = tilemodel.range_attacks_power[index_power]
-        tilemodel.cac_attacks_direction.append(range_attack_to_converte)
-        tilemodel.cac_attacks_power.append(power)
-
-    def _converte_cac_attack(self,
-                            tilemodel: Tile,
-                            cac_attack_to_converte: Tuple[int, int, int]
-                            ) -> None:
-        """Converts a CQC attack into a ranged attack.
+        index_power = from_directions.index(attack_to_converte)
+        from_directions.pop(index_power)
+        to_directions.append(attack_to_converte)
+        to_powers.append(from_powers.pop(index_power))
 
-        Args:
-            tilemodel (Tile): Tile to convert.
-            cac_attack_to_converte (Tuple[int, int, int]):
-                Attack direction to convert.
-        """
-        index_power = tilemodel.cac_attacks_direction.index(
-            cac_attack_to_converte)
-        tilemodel.cac_attacks_direction.remove(cac_attack_to_converte)
-        power = tilemodel.cac_attacks_power[index_power]
-        tilemodel.range_attacks_direction.append(cac_attack_to_converte)
-        tilemodel.range_attacks_power.append(power)
+
+def resolve_battle(board: HexBoard, record_stats: bool = False
+                ) -> BattleResult:
+    """
+    Resolves a battle on a board without game controller nor display.
+
+    Only the board is used, so it can run in processes that never
+    import pygame.
+
+    Args:
+        board (HexBoard): Board on which the battle is resolved. Its
+        tiles are modified in place.
+        record_stats (bool, optional):
+            True to record the timings and counters of the battle in
+            the result. Defaults to False.
+
+    Returns:
+        BattleResult: HQ life deltas and destroyed tiles
+    """
+    context = SimpleNamespace(board=board, view=None)
+    evaluator = BattleEvaluator(context) # type: ignore
+    evaluator.record_stats = record_stats
+    return evaluator.resolve_battle()
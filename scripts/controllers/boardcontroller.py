@@ -157,10 +157,7 @@ class BoardController:
         Returns:
             bool: True if the tile is on the board, False otherwise.
         """
-        return any(tile.id_tile == id_tile
-                    for army in self.gamecontroller.board.armies
-                    for tile in self.gamecontroller.board.tiles[army]
-                )
+        return self.gamecontroller.board.is_tile_on_board(id_tile)
 
     def _get_info_from_id_tile(self, id_tile: str) -> Dict:
         """
@@ -174,14 +171,12 @@ class BoardController:
         Raises:
             ValueError: if tile not found
         """
-        try:
-            tile = next(tile for tile in self.gamecontroller.board.all_tile
-                        if tile.id_tile == id_tile)
-            return tile.__dict__
-        except StopIteration:
+        tile = self.gamecontroller.board.tile_registry.get(id_tile)
+        if tile is None:
             raise ValueError(
                 "ID tile incorrect or no tile with the given ID exists."
                 )
+        return tile.to_dict()
 
     def _get_one_view_tile(self, id_tile: str) -> Optional[TileView]:
         """
@@ -243,24 +238,15 @@ class BoardController:
         """
         tilemodel = self._get_one_model_tile(id_tile)
         cube_coordinates = coordinates_pixel_to_cube(pixel_position)
-
-        old_board_position = tilemodel.board_position
-        tilemodel.board_position = cube_coordinates
-        tilemodel.rotate_tile(angle_index)
+        self.gamecontroller.board.rotate_tile_on_board(tilemodel, angle_index)
 
         if not self._check_if_tile_on_board(id_tile):
+            tilemodel.set_attribute("board_position", cube_coordinates)
             self.gamecontroller.board.add_tile_to_board(tilemodel)
 
         else:
-            self.gamecontroller.board.occupied[
-                tilemodel.army_name].append(cube_coordinates)
-            self.gamecontroller.board.occupied[
-                tilemodel.army_name].remove(old_board_position)
-
-            del self.gamecontroller.board.position_index[
-                tilemodel.army_name][old_board_position]
-            self.gamecontroller.board.position_index[
-                tilemodel.army_name][cube_coordinates] = tilemodel
+            self.gamecontroller.board.move_tile_on_board(tilemodel,
+                                                        cube_coordinates)
 
     def _update_board_model(self) -> None:
         """
@@ -284,20 +270,21 @@ class BoardController:
         """
         for army in self.gamecontroller.board.armies:
             enemy_army = next_element(self.gamecontroller.board.armies, army)
-            enemy_tiles = self.gamecontroller.board.position_index[enemy_army]
 
             for tilemodel in self.gamecontroller.board.tiles[army]:
                 if not tilemodel.net_directions:
                     continue
 
                 for net_directions in tilemodel.net_directions:
-                    netted_positions = calculate_position(
-                                                    net_directions,
-                                                    tilemodel.board_position
+                    netted_positions = get_neighbor_position(
+                                                    tilemodel.board_position,
+                                                    net_directions
                                                     )
-                    if netted_positions in enemy_tiles:
-                        enemy_tile = enemy_tiles[netted_positions]
-                        enemy_tile.is_netted = True
+                    enemy_tile = self.gamecontroller.board.get_tile_at(
+                        netted_positions)
+                    if enemy_tile is not None \
+                            and enemy_tile.army_name == enemy_army:
+                        enemy_tile.set_attribute("is_netted", True)
 
     def _update_board_view(self) -> None:
         """
@@ -321,13 +308,4 @@ class BoardController:
             ValueError:
             If no tile with the specified ID exists on the board.
         """
-
-        tile = next(
-        (tile for tile in self.gamecontroller.board.all_tile
-        if tile.id_tile == id_tile),
-        None
-    )
-        if tile is None:
-            raise ValueError(f"No tile found with ID '{id_tile}'.")
-
-        return tile
\ No newline at end of file
+        return self.gamecontroller.board.get_tile(id_tile)
\ No newline at end of file
@@ -5,7 +5,7 @@ from typing import Optional
 
 from scripts.model.model import Player, HexBoard
 from scripts.utils.config import BOARD_LIMIT
-from scripts.view.view import View
+from scripts.view.view import View, preload_rotated_images
 from scripts.controllers.moduleevaluator import ModuleEvaluator
 from scripts.controllers.battleevaluator import BattleEvaluator
 from scripts.controllers.tilecontroller import TileController
@@ -42,6 +42,9 @@ class GameController:
     playerscontroller (PlayersController): 
         Handles player-specific actions, such as drawing tiles or
         ending turns.
+    rng (random.Random):
+        Random generator of the game: shuffles the decks and the
+        players order.
 
     Methods
     ----------
@@ -51,6 +54,9 @@ class GameController:
 
     Private Methods
     ----------
+        _get_events() -> List[pygame.event.Event]:
+            Starts a frame and handles its input events.
+
         _quitte_loop(event_list: List[pygame.event.Event]) -> None:
             Checks for quit events in the event list and exits the game
             if triggered.
@@ -83,11 +89,20 @@ class GameController:
 
     """
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initializes the model, the view and the controllers of a game.
+
+        Args:
+            seed (Optional[int], optional):
+                Seed of the game: the same seed deals the same decks.
+                Defaults to None, a seed from the system.
+        """
+        self.rng = random.Random(seed)
 
         # Model
-        self.players = [Player("paul", "borgo"),
-                        Player("benoit", "moloch")]
+        self.players = [Player("paul", "borgo", self.rng),
+                        Player("benoit", "moloch", self.rng)]
         self.board = HexBoard(
                             BOARD_LIMIT,
                             armies=['borgo', 'moloch'],
@@ -96,6 +111,10 @@ class GameController:
         
         # View
         self.view = View()
+        preload_rotated_images(tile.id_tile
+                            for player in self.players
+                            for tile in player.deck.tiles
+                                + [player.deck.hq_tile])
         
         # Controller
         self.moduleevaluator = ModuleEvaluator(self)
@@ -104,6 +123,22 @@ class GameController:
         self.battleevaluator = BattleEvaluator(self)
         self.playerscontroller = PlayersController(self)
 
+    def _get_events(self) -> List[pygame.event.Event]:
+        """
+        Starts a new frame of the profiler, then gets the pygame events,
+        quits the game on a quit event and handles the profiler keys.
+
+        Returns:
+            List[pygame.event.Event]: The events of the frame
+        """
+        profiler = self.view.profiler
+        profiler.start_frame()
+        with profiler.measure("input"):
+            event_list = pygame.event.get()
+            self._quitte_loop(event_list)
+            profiler.handle_events(event_list)
+        return event_list
+
     def _quitte_loop(self, event_list: List[pygame.event.Event]) -> None:
         """
         Checks for quit events in the event list and exits the game if
@@ -124,7 +159,7 @@ class GameController:
         and shuffling the players' order.
         """
         self.view.display_screen()
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
         
 
     def _end_turn(self, player: Player, event_list: List[pygame.event.Event]
@@ -155,13 +190,11 @@ class GameController:
             self.playerscontroller.draw_hq_tile(player)
             run = True
             while run:
-                event_list = pygame.event.get()
-
-                self._quitte_loop(event_list)
+                event_list = self._get_events()
 
                 self.playerscontroller.play_tile_hand(player, event_list)
                 self.boardcontroller.update_board_view_from_hand()
-                pygame.display.flip()
+                self.view.end_frame()
                 
                 if self._end_turn(player, event_list):
                     run = False
@@ -214,7 +247,7 @@ class GameController:
         self.view.generate_all_sprite_group()
         self.view.display_all_sprite()
 
-        pygame.display.flip()
+        self.view.end_frame()
 
         if self._end_turn(player, event_list):
             return True
@@ -241,9 +274,7 @@ class GameController:
             self._init_player_turn(player, round_iteration)
 
             while turn_running:
-                event_list = pygame.event.get()
-
-                self._quitte_loop(event_list)
+                event_list = self._get_events()
 
                 if self._player_turn(player, event_list):
                     round_iteration += 1
@@ -0,0 +1,860 @@
+import random
+from typing import Any, List, Optional, Tuple, Dict, Literal
+
+from scripts.model.model import (Player,
+                                HexBoard,
+                                Tile,
+                                ChangeJournal,
+                                get_army_keys)
+from scripts.model.replay import (ReplayLog,
+                                SET_UP,
+                                PLACE_HQ,
+                                DRAW,
+                                DRAW_TILE,
+                                DISCARD,
+                                PLACE,
+                                ACTION,
+                                BATTLE,
+                                END_TURN
+                            )
+from scripts.controllers.moduleevaluator import ModuleEvaluator
+from scripts.controllers.battleevaluator import BattleEvaluator, BattleResult
+from scripts.utils.config import BOARD_LIMIT, INNER_BOARD_CUBE_POSITIONS
+from scripts.utils.functions import (next_element,
+                                    get_neighbor_position,
+                                    get_neighbors_hex_positions
+                                )
+
+
+class GameEngine:
+    """
+    Headless engine driving a whole Neuroshima game from method calls.
+
+    The engine plays the same phases as the `GameController` (HQ
+    placement, draw, discard, place, action tiles and battles) directly
+    on the model, without pygame nor view. It is used for simulations,
+    where a game has to be played as fast as possible.
+
+    The engine plays the role of the game controller for the
+    `ModuleEvaluator` and the `BattleEvaluator`: they reach the board
+    through it.
+
+    Attributes
+    ----------
+    players (List[Player]):
+        Players of the game, in turn order once `set_up` is called.
+    board (HexBoard):
+        The game board.
+    view (None):
+        No display. Kept for the evaluators sharing code with the
+        `GameController`.
+    moduleevaluator (ModuleEvaluator):
+        Handles module effects on the board.
+    battleevaluator (BattleEvaluator):
+        Resolves battles on the board.
+    round_iteration (int):
+        Current round, starting at 1 after the HQ placement.
+    final_round (Optional[int]):
+        Last round of the game. Set once a player has drawn the last
+        tile of his deck.
+    battles (List[BattleResult]):
+        Outcomes of all battles of the game.
+    game_over (bool):
+        True once the final battle is resolved or an HQ is destroyed.
+    journal (Optional[ChangeJournal]):
+        Journal recording the changes of the game. None if not
+        recorded.
+    rng (random.Random):
+        Random generator of the game: shuffles the decks, then the
+        players order. The same seed replays the same game.
+    replay (Optional[ReplayLog]):
+        Log recording the actions of the game. None if not recorded.
+
+    Methods
+    ----------
+    set_up() -> None:
+        Shuffles the players order.
+    place_hq(player: Player, position: Tuple[int, int, int]) -> None:
+        Places the HQ of a player on the board.
+    draw_tiles() -> List[Tile]:
+        Draws the tiles of the current player for this round.
+    draw_tile(id_tile: str) -> Tile:
+        Draws a given tile of the current player's deck.
+    discard_tiles(id_tiles: List[str]) -> None:
+        Discards tiles from the current player's hand.
+    place_tile(id_tile: str, position: Tuple[int, int, int],\
+            rotation: Literal[0, 1, 2, 3, 4, 5] = 0) -> None:
+        Places a unit or module tile of the current player's hand on
+        the board.
+    play_action_tile(id_tile: str, id_target: Optional[str] = None,\
+            position: Optional[Tuple[int, int, int]] = None,\
+            rotation: Optional[Literal[0, 1, 2, 3, 4, 5]] = None) -> None:
+        Plays an action tile of the current player's hand.
+    battle() -> BattleResult:
+        Resolves a battle on the board.
+    end_turn(id_tiles_to_keep: List[str] = []) -> None:
+        Ends the current player's turn.
+    free_positions() -> List[Tuple[int, int, int]]:
+        Returns the free positions of the board.
+    get_hq_life() -> Dict[str, int]:
+        Returns the HQ life points of each army.
+    winner() -> Optional[str]:
+        Returns the army name of the winner.
+    snapshot() -> Tuple:
+        Returns the state of the game.
+    restore(state: Tuple) -> None:
+        Restores a state returned by `snapshot`.
+    attach_journal(journal: Optional[ChangeJournal]) -> None:
+        Records the changes of the game in a journal.
+    from_replay(log: ReplayLog) -> GameEngine:
+        Replays a recorded game on a new engine.
+
+    Private Methods
+    ----------
+    _get_hand_tile(player: Player, id_tile: str) -> Tile:
+        Returns a tile of the player's hand.
+    _get_board_tile(id_tile: str) -> Tile:
+        Returns a tile on the board.
+    _get_enemy_player(player: Player) -> Player:
+        Returns the opponent of a player.
+    _check_free_position(position: Tuple[int, int, int]) -> None:
+        Raises an exception if a position is not free.
+    _is_adjacent(position: Tuple[int, int, int],\
+            other_position: Tuple[int, int, int]) -> bool:
+        Checks if two positions are neighbors.
+    _damage_tile(tile: Tile) -> None:
+        Inflicts one damage on a tile, removing it if destroyed.
+    _movement_action(player: Player, id_target: Optional[str],\
+            position: Optional[Tuple[int, int, int]],\
+            rotation: Optional[Literal[0, 1, 2, 3, 4, 5]]) -> None:
+        Handles the movement action tile.
+    _push_action(player: Player, id_target: Optional[str],\
+            position: Optional[Tuple[int, int, int]]) -> None:
+        Handles the push action tile.
+    _sniper_action(player: Player, id_target: Optional[str]) -> None:
+        Handles the sniper action tile.
+    _grenade_action(player: Player, id_target: Optional[str]) -> None:
+        Handles the grenade action tile.
+    _airstrike_action(position: Optional[Tuple[int, int, int]]\
+            ) -> None:
+        Handles the airstrike action tile.
+    _update_netted_tiles() -> None:
+        Updates the attribut `is_netted` of all tiles on the board.
+    _check_hq_destroyed() -> None:
+        Ends the game if an HQ is destroyed.
+    _resolve_battle() -> BattleResult:
+        Resolves a battle on the board, without recording it.
+    _set_attribute(name: str, value: Any) -> None:
+        Sets an attribute of the engine, recording it in the journal.
+    """
+
+    def __init__(self,
+                armies: Tuple[str, str] = ("borgo", "moloch"),
+                names: Optional[Tuple[str, str]] = None,
+                board_limit: Literal[3, 4] = BOARD_LIMIT,
+                rng: Optional[random.Random] = None
+            ) -> None:
+        """
+        Initializes the model and the evaluators of a new game.
+
+        Args:
+            armies (Tuple[str, str], optional):
+                Army names of the two players, the same army for a
+                mirror match. Defaults to ("borgo", "moloch").
+            names (Optional[Tuple[str, str]], optional):
+                Players names. Defaults to the army keys (see
+                `get_army_keys`).
+            board_limit (Literal[3, 4], optional):
+                Size of the board. Defaults to BOARD_LIMIT.
+            rng (Optional[random.Random], optional):
+                Random generator of the game. Defaults to None, a
+                generator seeded by the system.
+        """
+        keys = get_army_keys(armies)
+        if names is None:
+            names = keys # type: ignore
+        self.rng = rng if rng is not None else random.Random()
+
+        # Model
+        self.players = [Player(name, key, self.rng, army)
+                        for name, key, army in zip(names, keys, armies)]
+        self.board = HexBoard(board_limit,
+                            armies=list(keys),
+                            players=self.players
+                        )
+        self.view = None
+
+        # Controller
+        self.moduleevaluator = ModuleEvaluator(self) # type: ignore
+        self.battleevaluator = BattleEvaluator(self) # type: ignore
+
+        self.round_iteration: int = 1
+        self.final_round: Optional[int] = None
+        self.battles: List[BattleResult] = []
+        self.game_over: bool = False
+        self.journal: Optional[ChangeJournal] = None
+        self.replay: Optional[ReplayLog] = None
+
+    @property
+    def current_player(self) -> Player:
+        """Player of the current round."""
+        return self.players[(self.round_iteration - 1) % 2]
+
+    def set_up(self) -> None:
+        """Shuffles the players order."""
+        self.rng.shuffle(self.players)
+        if self.replay is not None:
+            self.replay.record(SET_UP)
+
+    def place_hq(self,
+                player: Player,
+                position: Tuple[int, int, int]
+            ) -> None:
+        """
+        Places the HQ of a player on the board.
+
+        Args:
+            player (Player): Player placing his HQ
+            position (Tuple[int, int, int]): Position of the HQ
+
+        Raises:
+            ValueError: If the HQ is already on the board
+            ValueError: If the position is not free
+        """
+        hq_tile = player.deck.hq_tile
+        if self.board.is_tile_on_board(hq_tile.id_tile):
+            raise ValueError(f"HQ {hq_tile.id_tile} already on the board.")
+        self._check_free_position(position)
+
+        hq_tile.set_attribute("board_position", position)
+        self.board.add_tile_to_board(hq_tile)
+        if self.replay is not None:
+            self.replay.record(PLACE_HQ, hq_tile.id_tile, position=position)
+
+    def draw_tiles(self) -> List[Tile]:
+        """
+        Draws the tiles of the current player for this round: 1 tile on
+        round 1, 2 on round 2 and then 3.
+        The final round is set once the player draws his last tile.
+
+        Returns:
+            List[Tile]: Tiles in the current player's hand
+        """
+        player = self.current_player
+        player.get_tiles(min(self.round_iteration, 3)) # type: ignore
+
+        if not player.deck.tiles and self.final_round is None:
+            self._set_attribute("final_round", self.round_iteration + 1)
+        if self.replay is not None:
+            self.replay.record(DRAW)
+
+        return list(player.hand.hand_tiles)
+
+    def draw_tile(self, id_tile: str) -> Tile:
+        """
+        Draws a given tile of the current player's deck, whatever its
+        place in the deck. Used by searches exploring the possible
+        draws. The final round is set once the deck is empty.
+
+        Args:
+            id_tile (str): ID of the tile to draw
+
+        Returns:
+            Tile: The drawn tile
+
+        Raises:
+            ValueError: If the tile is not in the deck
+        """
+        player = self.current_player
+        tile = next((x for x in player.deck.tiles if x.id_tile == id_tile),
+                    None)
+        if tile is None:
+            raise ValueError(f"Tile {id_tile} not found in deck.")
+        player.deck.remove_tile(tile)
+        player.hand.add_tile(tile)
+
+        if not player.deck.tiles and self.final_round is None:
+            self._set_attribute("final_round", self.round_iteration + 1)
+        if self.replay is not None:
+            self.replay.record(DRAW_TILE, id_tile)
+
+        return tile
+
+    def discard_tiles(self, id_tiles: List[str]) -> None:
+        """
+        Discards tiles from the current player's hand.
+
+        Args:
+            id_tiles (List[str]): IDs of the tiles to discard
+
+        Raises:
+            ValueError: If a tile is not in the hand
+        """
+        player = self.current_player
+        tiles = [self._get_hand_tile(player, id_tile) for id_tile in id_tiles]
+        player.hand.discard_tile(tiles)
+        player.deck.discard_tiles(tiles)
+        if self.replay is not None:
+            for id_tile in id_tiles:
+                self.replay.record(DISCARD, id_tile)
+
+    def place_tile(self,
+                id_tile: str,
+                position: Tuple[int, int, int],
+                rotation: Literal[0, 1, 2, 3, 4, 5] = 0
+            ) -> None:
+        """
+        Places a unit or module tile of the current player's hand on
+        the board. A battle is launched if the board becomes full.
+
+        Args:
+            id_tile (str): ID of the tile to place
+            position (Tuple[int, int, int]): Position of the tile
+            rotation (Literal[0, 1, 2, 3, 4, 5], optional):
+                Rotational index of the tile. Defaults to 0.
+
+        Raises:
+            ValueError: If the tile is not in the hand
+            ValueError: If the tile can not be placed on the board
+            ValueError: If the position is not free
+        """
+        player = self.current_player
+        tile = self._get_hand_tile(player, id_tile)
+        if tile.kind not in ["unite", "module"]:
+            raise ValueError(f"Tile {id_tile} can not be placed on board.")
+        self._check_free_position(position)
+
+        tile.rotate_tile(rotation)
+        tile.set_attribute("board_position", position)
+        self.board.add_tile_to_board(tile)
+        player.hand.discard_tile([tile])
+        self._update_netted_tiles()
+        if self.replay is not None:
+            self.replay.record(PLACE, id_tile, position=position,
+                            rotation=rotation)
+
+        if not self.free_positions():
+            self._resolve_battle()
+
+    def play_action_tile(self,
+                        id_tile: str,
+                        id_target: Optional[str] = None,
+                        position: Optional[Tuple[int, int, int]] = None,
+                        rotation: Optional[Literal[0, 1, 2, 3, 4, 5]] = None
+                    ) -> None:
+        """
+        Plays an action tile of the current player's hand. The tile is
+        then discarded.
+
+        Args:
+            id_tile (str): ID of the action tile
+            id_target (Optional[str], optional):
+                ID of the tile targeted by the action. Used by
+                "movement", "push", "sniper" and "grenade".
+            position (Optional[Tuple[int, int, int]], optional):
+                Position targeted by the action. Destination for
+                "movement" and "push", center for "airstrike".
+            rotation (Optional[Literal[0, 1, 2, 3, 4, 5]], optional):
+                New rotational index of the tile moved with "movement".
+
+        Raises:
+            ValueError: If the tile is not an action tile of the hand
+            ValueError: If the action targets are not valid
+        """
+        player = self.current_player
+        tile = self._get_hand_tile(player, id_tile)
+
+        action_map = {
+            "battle": lambda: self._resolve_battle(),
+            "movement": lambda: self._movement_action(player,
+                                                    id_target,
+                                                    position,
+                                                    rotation),
+            "push": lambda: self._push_action(player, id_target, position),
+            "sniper": lambda: self._sniper_action(player, id_target),
+            "grenade": lambda: self._grenade_action(player, id_target),
+            "airstrike": lambda: self._airstrike_action(position),
+        }
+        if tile.kind != "action" or tile.action not in action_map:
+            raise ValueError(f"Tile {id_tile} is not a playable action.")
+
+        if self.replay is not None:
+            # Recorded first: the battle of the action may end the game
+            mark = len(self.replay.records)
+            self.replay.record(ACTION, id_tile, id_target, position, rotation)
+        try:
+            action_map[tile.action]()
+        except ValueError:
+            if self.replay is not None:
+                del self.replay.records[mark:]
+            raise
+        player.hand.discard_tile([tile])
+        player.deck.discard_tiles([tile])
+
+    def battle(self) -> BattleResult:
+        """
+        Resolves a battle on the board. The game ends if an HQ is
+        destroyed.
+
+        Returns:
+            BattleResult: HQ life deltas and destroyed tiles
+        """
+        if self.replay is not None:
+            self.replay.record(BATTLE)
+        return self._resolve_battle()
+
+    def end_turn(self, id_tiles_to_keep: List[str] = []) -> None:
+        """
+        Ends the current player's turn: the tiles not kept are
+        discarded. The final battle is resolved at the end of the final
+        round.
+
+        Args:
+            id_tiles_to_keep (List[str], optional):
+                IDs of the tiles kept in hand for the next turn.
+        """
+        self.current_player.discard_tiles_hand(id_tiles_to_keep)
+        if self.replay is not None:
+            # One record per kept tile, then the end of the turn
+            for id_tile in id_tiles_to_keep:
+                self.replay.record(END_TURN, id_tile)
+            self.replay.record(END_TURN)
+
+        if (not self.game_over and self.final_round is not None
+                and self.round_iteration >= self.final_round):
+            self._resolve_battle()
+            self._set_attribute("game_over", True)
+
+        self._set_attribute("round_iteration", self.round_iteration + 1)
+
+    def free_positions(self) -> List[Tuple[int, int, int]]:
+        """
+        Returns the free positions of the board.
+
+        Returns:
+            List[Tuple[int, int, int]]: Positions without any tile
+        """
+        return list(self.board.get_free_positions())
+
+    def get_hq_life(self) -> Dict[str, int]:
+        """
+        Returns the HQ life points of each army.
+
+        Returns:
+            Dict[str, int]: HQ life points, keys are army keys
+        """
+        return {player.deck.army_name: player.deck.hq_tile.life_point
+                for player in self.players
+            } # type: ignore
+
+    def winner(self) -> Optional[str]:
+        """
+        Returns the army key of the winner: the only army with a
+        standing HQ, or else the army with the most HQ life points.
+
+        Returns:
+            Optional[str]:
+                Army key of the winner (see `get_army_keys`). None if
+                the game is not over or ends in a draw.
+        """
+        if not self.game_over:
+            return None
+
+        hq_life = self.get_hq_life()
+        (army, life), (enemy_army, enemy_life) = hq_life.items()
+        if life > enemy_life and life > 0:
+            return army
+        if enemy_life > life and enemy_life > 0:
+            return enemy_army
+        return None
+
+    def snapshot(self) -> Tuple:
+        """
+        Returns the state of the game: players, board and rounds. Only
+        the mutable state is saved, tile templates are shared. A
+        snapshot can be restored several times, to try moves from the
+        same position.
+
+        Returns:
+            Tuple: State of the game, for `restore`
+        """
+        return (tuple(self.players),
+                tuple(player.snapshot() for player in self.players),
+                self.board.snapshot(),
+                self.round_iteration,
+                self.final_round,
+                tuple(self.battles),
+                self.game_over
+            )
+
+    def restore(self, state: Tuple) -> None:
+        """
+        Restores a state returned by `snapshot` of this engine.
+
+        Args:
+            state (Tuple): State of the game
+        """
+        (players, players_states, board_state, self.round_iteration,
+        self.final_round, battles, self.game_over) = state
+        self.players = list(players)
+        for player, player_state in zip(players, players_states):
+            player.restore(player_state)
+        self.board.restore(board_state)
+        self.battles = list(battles)
+
+    def attach_journal(self, journal: Optional[ChangeJournal]) -> None:
+        """
+        Records the changes of the game in a journal: engine, players,
+        board and tiles. An action can then be played in place and
+        undone:
+
+            journal = ChangeJournal()
+            engine.attach_journal(journal)
+            mark = journal.mark()
+            engine.place_tile(id_tile, position, rotation)
+            journal.undo(mark)
+
+        Args:
+            journal (Optional[ChangeJournal]):
+                The journal. None to stop recording.
+        """
+        self.journal = journal
+        self.board.attach_journal(journal)
+        for player in self.players:
+            player.attach_journal(journal)
+
+    @classmethod
+    def from_replay(cls, log: ReplayLog) -> "GameEngine":
+        """
+        Replays a recorded game on a new engine: the seed of the log
+        deals the same decks, then its records are played in order.
+
+        Args:
+            log (ReplayLog): Log of the game
+
+        Returns:
+            GameEngine: The engine, in the final state of the game
+
+        Raises:
+            ValueError: If a record is not legal in the replayed game
+        """
+        engine = cls(log.armies, # type: ignore
+                    board_limit=log.board_limit, # type: ignore
+                    rng=random.Random(log.seed)
+                )
+        hq_players = {player.deck.hq_tile.id_tile: player
+                    for player in engine.players}
+        id_tiles_to_keep: List[str] = []
+        for operation, id_tile, id_target, position, rotation in log:
+            if operation == SET_UP:
+                engine.set_up()
+            elif operation == PLACE_HQ:
+                engine.place_hq(hq_players[id_tile], position) # type: ignore
+            elif operation == DRAW:
+                engine.draw_tiles()
+            elif operation == DRAW_TILE:
+                engine.draw_tile(id_tile) # type: ignore
+            elif operation == DISCARD:
+                engine.discard_tiles([id_tile]) # type: ignore
+            elif operation == PLACE:
+                engine.place_tile(id_tile, position, rotation) # type: ignore
+            elif operation == ACTION:
+                engine.play_action_tile(id_tile, # type: ignore
+                                        id_target,
+                                        position,
+                                        rotation) # type: ignore
+            elif operation == BATTLE:
+                engine.battle()
+            elif operation != END_TURN:
+                raise ValueError(f"Unknown replay operation {operation}.")
+            elif id_tile is not None:
+                id_tiles_to_keep.append(id_tile)
+            else:
+                engine.end_turn(id_tiles_to_keep)
+                id_tiles_to_keep = []
+        return engine
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _get_hand_tile(self, player: Player, id_tile: str) -> Tile:
+        """
+        Returns a tile of the player's hand.
+
+        Args:
+            player (Player): Player owning the hand
+            id_tile (str): ID of the tile
+
+        Returns:
+            Tile: The tile
+
+        Raises:
+            ValueError: If the tile is not in the hand
+        """
+        return player.hand.get_tile_by_id(id_tile)
+
+    def _get_board_tile(self, id_tile: Optional[str]) -> Tile:
+        """
+        Returns a tile on the board.
+
+        Args:
+            id_tile (Optional[str]): ID of the tile
+
+        Returns:
+            Tile: The tile
+
+        Raises:
+            ValueError: If no tile with this ID is on the board
+        """
+        if id_tile is None or not self.board.is_tile_on_board(id_tile):
+            raise ValueError(f"No tile with ID '{id_tile}' on the board.")
+        return self.board.get_tile(id_tile)
+
+    def _get_enemy_player(self, player: Player) -> Player:
+        """
+        Returns the opponent of a player.
+
+        Args:
+            player (Player): The player
+
+        Returns:
+            Player: The opponent
+        """
+        return next_element(self.players, player)
+
+    def _check_free_position(self, position: Tuple[int, int, int]) -> None:
+        """
+        Raises an exception if a position is not free.
+
+        Args:
+            position (Tuple[int, int, int]): Position to check
+
+        Raises:
+            ValueError: If the position is not on the board
+            ValueError: If the position is already occupied
+        """
+        if not self.board.is_free(position):
+            raise ValueError(f"Position {position} is already occupied.")
+
+    def _is_adjacent(self,
+                    position: Tuple[int, int, int],
+                    other_position: Tuple[int, int, int]
+                ) -> bool:
+        """
+        Checks if two positions are neighbors.
+
+        Args:
+            position (Tuple[int, int, int]): First position
+            other_position (Tuple[int, int, int]): Second position
+
+        Returns:
+            bool: True if the positions are neighbors
+        """
+        return other_position in get_neighbors_hex_positions(position)
+
+    def _damage_tile(self, tile: Tile) -> None:
+        """
+        Inflicts one damage on a tile, removing it from the board if
+        destroyed.
+
+        Args:
+            tile (Tile): Tile to damage
+        """
+        if tile.life_point:
+            tile.set_attribute("life_point", tile.life_point - 1)
+            if tile.life_point <= 0:
+                self.board.remove_tile_from_board(tile.id_tile)
+                self._update_netted_tiles()
+
+    def _movement_action(self,
+                        player: Player,
+                        id_target: Optional[str],
+                        position: Optional[Tuple[int, int, int]],
+                        rotation: Optional[Literal[0, 1, 2, 3, 4, 5]]
+                    ) -> None:
+        """
+        Handles the movement action tile: a tile of the player moves to
+        a free neighbor position, or stays in place, and can be rotated.
+
+        Args:
+            player (Player): Player using the action
+            id_target (Optional[str]): ID of the tile to move
+            position (Optional[Tuple[int, int, int]]): Destination
+            rotation (Optional[Literal[0, 1, 2, 3, 4, 5]]):
+                New rotational index. None to keep it.
+
+        Raises:
+            ValueError: If the target is not a free tile of the player
+            ValueError: If the destination is not a free neighbor
+        """
+        tile = self._get_board_tile(id_target)
+        if tile.army_name != player.deck.army_name or tile.is_netted:
+            raise ValueError(f"Tile {id_target} can not be moved.")
+
+        if position is not None and position != tile.board_position:
+            if not self._is_adjacent(tile.board_position, position):
+                raise ValueError(f"Position {position} is not a neighbor.")
+            self._check_free_position(position)
+            self.board.move_tile_on_board(tile, position)
+
+        if rotation is not None:
+            self.board.rotate_tile_on_board(tile, rotation)
+        self._update_netted_tiles()
+
+    def _push_action(self,
+                    player: Player,
+                    id_target: Optional[str],
+                    position: Optional[Tuple[int, int, int]]
+                ) -> None:
+        """
+        Handles the push action tile: an enemy tile next to a tile of
+        the player is pushed one position away from it.
+
+        Args:
+            player (Player): Player using the action
+            id_target (Optional[str]): ID of the enemy tile to push
+            position (Optional[Tuple[int, int, int]]): Destination
+
+        Raises:
+            ValueError: If the target is not an enemy tile
+            ValueError: If the destination is not free or not away from
+                the player's tiles
+        """
+        tile = self._get_board_tile(id_target)
+        if tile.army_name == player.deck.army_name:
+            raise ValueError(f"Tile {id_target} is not an enemy tile.")
+        if position is None or not self._is_adjacent(tile.board_position,
+                                                    position):
+            raise ValueError(f"Position {position} is not a neighbor.")
+        self._check_free_position(position)
+
+        pushers = [
+            pusher for pusher in self.board.tiles[player.deck.army_name]
+            if not pusher.is_netted
+            and self._is_adjacent(pusher.board_position, tile.board_position)
+            and not self._is_adjacent(pusher.board_position, position)
+        ]
+        if not pushers:
+            raise ValueError(f"Tile {id_target} can not be pushed there.")
+
+        self.board.move_tile_on_board(tile, position)
+        self._update_netted_tiles()
+
+    def _sniper_action(self, player: Player, id_target: Optional[str]
+                    ) -> None:
+        """
+        Handles the sniper action tile: one damage on any enemy tile but
+        the HQ.
+
+        Args:
+            player (Player): Player using the action
+            id_target (Optional[str]): ID of the enemy tile
+
+        Raises:
+            ValueError: If the target is not an enemy unit or module
+        """
+        tile = self._get_board_tile(id_target)
+        if tile.army_name == player.deck.army_name or tile.kind == "base":
+            raise ValueError(f"Tile {id_target} can not be targeted.")
+        self._damage_tile(tile)
+
+    def _grenade_action(self, player: Player, id_target: Optional[str]
+                    ) -> None:
+        """
+        Handles the grenade action tile: one damage on an enemy tile
+        next to the player's HQ.
+
+        Args:
+            player (Player): Player using the action
+            id_target (Optional[str]): ID of the enemy tile
+
+        Raises:
+            ValueError: If the target is not an enemy unit or module
+                next to the player's HQ
+        """
+        tile = self._get_board_tile(id_target)
+        if (tile.army_name == player.deck.army_name or tile.kind == "base"
+                or not self._is_adjacent(
+                    player.deck.hq_tile.board_position,
+                    tile.board_position)):
+            raise ValueError(f"Tile {id_target} can not be targeted.")
+        self._damage_tile(tile)
+
+    def _airstrike_action(self, position: Optional[Tuple[int, int, int]]
+                        ) -> None:
+        """
+        Handles the airstrike action tile: one damage on every tile but
+        the HQs on an inner position of the board and its neighbors.
+
+        Args:
+            position (Optional[Tuple[int, int, int]]):
+                Center of the airstrike
+
+        Raises:
+            ValueError: If the position is not an inner position
+        """
+        if position not in INNER_BOARD_CUBE_POSITIONS:
+            raise ValueError(f"Position {position} is not an inner position.")
+
+        positions = [position] + get_neighbors_hex_positions(position)
+        tiles = [self.board.find_any_tile_at_position(x) for x in positions]
+        for tile in tiles:
+            if tile is not None and tile.kind != "base":
+                self._damage_tile(tile)
+
+    def _update_netted_tiles(self) -> None:
+        """
+        Updates the attribut `is_netted` of all tiles on the board
+        according to the nets of the enemy tiles.
+        """
+        for army in self.board.armies:
+            for tile in self.board.tiles[army]:
+                tile.set_attribute("is_netted", False)
+
+        for army in self.board.armies:
+            enemy_army = next_element(self.board.armies, army)
+            for tile in self.board.tiles[army]:
+                if not tile.net_directions:
+                    continue
+                for net_direction in tile.net_directions:
+                    netted_position = get_neighbor_position(
+                        tile.board_position,
+                        net_direction,
+                        self.board.board_limit)
+                    enemy_tile = self.board.get_tile_at(netted_position)
+                    if enemy_tile is not None \
+                            and enemy_tile.army_name == enemy_army:
+                        enemy_tile.set_attribute("is_netted", True)
+
+    def _check_hq_destroyed(self) -> None:
+        """Ends the game if an HQ is destroyed."""
+        if any(life <= 0 for life in self.get_hq_life().values()):
+            self._set_attribute("game_over", True)
+
+    def _resolve_battle(self) -> BattleResult:
+        """
+        Resolves a battle on the board, without recording it in the
+        replay: the battles launched by the rules are replayed with the
+        action launching them. The game ends if an HQ is destroyed.
+
+        Returns:
+            BattleResult: HQ life deltas and destroyed tiles
+        """
+        result = self.battleevaluator.resolve_battle()
+        self.battles.append(result)
+        if self.journal is not None:
+            self.journal.record(list.pop, self.battles)
+        self._update_netted_tiles()
+        self._check_hq_destroyed()
+        return result
+
+    def _set_attribute(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute of the engine, recording it in the journal.
+
+        Args:
+            name (str): Name of the attribute
+            value (Any): New value
+        """
+        if self.journal is not None:
+            self.journal.record_attribute(self, name)
+        setattr(self, name, value)
@@ -2,18 +2,24 @@
 # import issue
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
 from scripts.model.model import Tile
-from scripts.controllers import gamecontroller
-from scripts.utils.functions import next_element, calculate_position
+from scripts.utils.config import (ACTIVE_MODULE_EFFECTS,
+                                BATTLE_MODULE_EFFECTS,
+                                PRIORITY_MODULE_EFFECTS
+                            )
+from scripts.utils.functions import get_neighbor_position, next_element
+
+# Only needed for type hints, the module effects must be usable without
+# loading pygame and the view.
+if TYPE_CHECKING:
+    from scripts.controllers import gamecontroller
 
 
 class ModuleEvaluator:
     """
-    This class evaluates and manages effects of game modules on tiles of
-    a `HexBoard`. It is esponsible for applying, cleaning, and managing
-    module effects on a hexagonal game board.
+    This class manages effects of game modules on tiles of a `HexBoard`.
 
     Modules can be divided into 3 categories:
         - Modules with priority : this module effects have to be applied
@@ -24,7 +30,12 @@ class ModuleEvaluator:
         - Modules with non priority : "Classic" effect used only for
         battle, like initiative bonus, damage bonus.
 
-    
+    Priority and non priority effects are tracked incrementally by the
+    `HexBoard` when a module is added, moved, rotated or removed, and
+    read through the effective stats of the tiles
+    (`Tile.effective_initiative`, ...). They are only recomputed here
+    from scratch, as a reference.
+
     Attributes
     ----------
     gamecontroller (GameController): 
@@ -35,10 +46,7 @@ class ModuleEvaluator:
     ----------
     apply_all_effect_modules() -> None:
         Applies priority and non-priority module effects for all
-        armies
-
-    clean_all_effect_modules() -> None:
-        Cleans all module effects from all tiles on the board.
+        armies, computed from scratch.
 
     apply_active_module_effect() -> None:
         Applies active module effects for all armies.
@@ -48,43 +56,40 @@ class ModuleEvaluator:
 
     Private Methods
     ----------
-    _apply_one_effect_on_tile(tilemodel: Tile, effect_type: str\
-        ) -> None:
+    _apply_one_effect_on_tile(tilemodel: Tile, effect_type: str,\
+        tile_armies: Dict[str, str],\
+        module_effects: Dict[str, List[str]]) -> None:
         Applies a specific effect to a tile based on its type.
 
-    _clean_one_effect_on_tile(tilemodel: Tile, effect_type: str\
-        ) -> None:
-        Clean a specific effect from a tile based on its type.
-
-    _apply_<effect_name>_effect_on_tile(tilemodel: Tile) -> None:
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
-    
-    _clean_<effect_name>_effect_on_tile(tilemodel: Tile) -> None:
-        Cleans a specific type of module effect from a tile (e.g.,
-        "medic", "range_augment").
-
-    _apply_prio_effect_modules_army(army_name: str) -> None:
+    _apply_prio_effect_modules_army(army_name: str,\
+        tile_armies: Dict[str, str],\
+        module_effects: Dict[str, List[str]]) -> None:
         Applies priority module effects for a given army.
 
-    _apply_non_prio_effect_modules_army(army_name: str) -> None:
+    _apply_non_prio_effect_modules_army(army_name: str,\
+        tile_armies: Dict[str, str],\
+        module_effects: Dict[str, List[str]]) -> None:
         Applies non priority module effects for a given army.
 
+    _apply_effect_modules(army_name: str, modules: List[Tile],\
+        tile_armies: Dict[str, str],\
+        module_effects: Dict[str, List[str]]) -> None:
+        Applies the effects of modules on the tiles of an army.
+
+    _get_army_modules(army_name: str, tile_armies: Dict[str, str],\
+        priority: bool) -> List[Tile]:
+        Returns the priority or non priority modules of an army.
+
     _get_effects_modules(modules: List[Tile]) -> Tuple[List[str], \
         List[List[Position]]]:
         Retrieves module effects and affected positions from a list
         of module tiles.
 
-    _get_prio_army_modules(army_name: str) -> List[Tile]:
-        Returns a list of priority module tiles for the specified
-        army.
-
-    _get_non_prio_army_modules(army_name: str) -> List[Tile]:
-        Returns a list of non priority module tiles for the
-        specified army.
-
     _get_active_army_modules(army_name: str) -> List[Tile]:
         Returns a list of active modules for the specified army.
+
+    _clean_quartiermaitre_effect_on_tile(tilemodel: Tile) -> None:
+        Cleans the "quartiermaitre" effect from a tile once it fired.
     """
 
     def __init__(self, gamecontroller: gamecontroller.GameController) -> None:
@@ -100,19 +105,36 @@ class ModuleEvaluator:
 
     def apply_all_effect_modules(self):
         """Applies priority and non-priority module effects for all
-        armies
-        """
-        for army_name in self.gamecontroller.board.armies:
-            self._apply_prio_effect_modules_army(army_name)
-            self._apply_non_prio_effect_modules_army(army_name)
-
-    def clean_all_effect_modules(self):
-        """Cleans all module effects from all tiles on the board.
-        """
-        for army_name in self.gamecontroller.board.armies:
-            for tile in self.gamecontroller.board.tiles[army_name]:
-                for effect in tile.module_effects:
-                    self._clean_one_effect_on_tile(tile, effect)
+        armies, computed from scratch as before each battle round of the
+        upstream game: army after army, the priority modules of an army
+        first.
+
+        The board keeps the same effects up to date incrementally, this
+        is the reference it is checked against (`python -m benchmarks
+        check`). Modules under a "scoper" effect are not moved to the
+        next army, the board gives the army they fight for.
+        """
+        board = self.gamecontroller.board
+        # Army each tile belongs to while the effects are applied
+        tile_armies = {tile.id_tile: army
+                    for army in board.armies
+                    for tile in board.tiles[army]}
+        module_effects: Dict[str, List[str]] = {
+            id_tile: [] for id_tile in tile_armies}
+        for army_name in board.armies:
+            self._apply_prio_effect_modules_army(army_name,
+                                                tile_armies,
+                                                module_effects)
+            self._apply_non_prio_effect_modules_army(army_name,
+                                                    tile_armies,
+                                                    module_effects)
+        for army_name in board.armies:
+            for tile in board.tiles[army_name]:
+                board.set_module_effects(
+                    tile,
+                    module_effects[tile.id_tile] + [
+                        effect for effect in tile.module_effects
+                        if effect in ACTIVE_MODULE_EFFECTS])
 
     def apply_active_module_effect(self):
         """Applies active module effects for all armies
@@ -127,8 +149,8 @@ class ModuleEvaluator:
                     tile = self.gamecontroller.board.find_any_tile_at_position(
                         position)
                     if tile:
-                        tile.module_effects.append("transport")
-                        tile.special_capacities.append("movement")
+                        tile.set_attribute("module_effects",
+                                        tile.module_effects + ["transport"])
 
     def clean_active_module_effect(self):
         """Clean active module effects from all tiles on the board.
@@ -136,163 +158,133 @@ class ModuleEvaluator:
         for army_name in self.gamecontroller.board.armies:
             for tile in self.gamecontroller.board.tiles[army_name]:
                 if "transport" in tile.module_effects:
-                    tile.module_effects.remove("transport")
-                    tile.special_capacities.remove("movement")
+                    tile.set_attribute("module_effects", [
+                        effect for effect in tile.module_effects
+                        if effect != "transport"])
 
 # --- MÉTHODES PRIVÉES ---
 
-    def _apply_medic_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("medic")
-
-    def _apply_cac_augment_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("cac_augment")
-        if tilemodel.cac_attacks_power is not None:
-            tilemodel.cac_attacks_power = (
-                [cac_attack_power + 1 
-                for cac_attack_power in tilemodel.cac_attacks_power]
-            )
-
-    def _apply_range_augment_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("range_augment")
-        if tilemodel.range_attacks_power is not None:
-            tilemodel.range_attacks_power = (
-                [range_attack_power +
-                    1 for range_attack_power in tilemodel.range_attacks_power]
-            )
-
-    def _apply_initiative_augment_effect_on_tile(self, tilemodel: Tile
-                                                ) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("initiative_augment")
-        if tilemodel.initiative is not None:
-            tilemodel.initiative = (
-                [initiative + 1 for initiative in tilemodel.initiative]
-            )
-
-    def _apply_double_initiative_effect_on_tile(self, tilemodel: Tile
-                                                ) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("double_initiative")
-        if tilemodel.initiative is not None:
-            min_init = min(tilemodel.initiative)
-            new_init = min_init - 1
-            tilemodel.initiative.append(new_init)
-
-    def _apply_saboteur_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
+    def _apply_one_effect_on_tile(self,
+                                tilemodel: Tile,
+                                effect_type: str,
+                                tile_armies: Dict[str, str],
+                                module_effects: Dict[str, List[str]]
+                            ) -> None:
+        """Applies a specific effect to a tile based on its type. A
+        module under a "scoper" effect goes to the next army.
 
         Args:
             tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("saboteur")
-        if tilemodel.initiative is not None:
-            for index, init in enumerate(tilemodel.initiative):
-                tilemodel.initiative[index] = init-1
-
-    def _apply_scoper_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
+            effect_type (str): Type of effect
+            tile_armies (Dict[str, str]): Army of each tile, by ID
+            module_effects (Dict[str, List[str]]):
+                Effects applied on each tile, by ID
+        """
+        if effect_type not in BATTLE_MODULE_EFFECTS:
+            return
+        if effect_type == "scoper":
+            if tilemodel.kind != "module":
+                return
+            tile_armies[tilemodel.id_tile] = next_element(
+                self.gamecontroller.board.armies,
+                tile_armies[tilemodel.id_tile])
+        module_effects[tilemodel.id_tile].append(effect_type)
+
+    def _apply_prio_effect_modules_army(self,
+                                        army_name: str,
+                                        tile_armies: Dict[str, str],
+                                        module_effects: Dict[str, List[str]]
+                                    ) -> None:
+        """Applies priority module effects for a given army.
 
         Args:
-            tilemodel (Tile): Tile affected
-        """
-        if tilemodel.kind == "module":
-            tilemodel.module_effects.append("scoper")
-            self.gamecontroller.board.remove_tile_from_board(tilemodel.id_tile)
-            tilemodel.army_name = next_element(
-                self.gamecontroller.board.armies, tilemodel.army_name)
-            self.gamecontroller.board.add_tile_to_board(tilemodel)
-
-    def _apply_quartiermaitre_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Applies a specific type of module effect (e.g., "medic",
-        "range_augment").
+            army_name (str): army name
+            tile_armies (Dict[str, str]): Army of each tile, by ID
+            module_effects (Dict[str, List[str]]):
+                Effects applied on each tile, by ID
+        """
+        self._apply_effect_modules(
+            army_name,
+            self._get_army_modules(army_name, tile_armies, True),
+            tile_armies,
+            module_effects)
+
+    def _apply_non_prio_effect_modules_army(self,
+                                            army_name: str,
+                                            tile_armies: Dict[str, str],
+                                            module_effects: Dict[str,
+                                                                List[str]]
+                                        ) -> None:
+        """Applies non priority module effects for a given army.
 
         Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.append("quartiermaitre")
-
-    def _apply_one_effect_on_tile(self,
-                                tilemodel: Tile, 
-                                effect_type: str
-                            ) -> None:
-        """Applies a specific effect to a tile based on its type.
+            army_name (str): army name
+            tile_armies (Dict[str, str]): Army of each tile, by ID
+            module_effects (Dict[str, List[str]]):
+                Effects applied on each tile, by ID
+        """
+        self._apply_effect_modules(
+            army_name,
+            self._get_army_modules(army_name, tile_armies, False),
+            tile_armies,
+            module_effects)
+
+    def _apply_effect_modules(self,
+                            army_name: str,
+                            modules: List[Tile],
+                            tile_armies: Dict[str, str],
+                            module_effects: Dict[str, List[str]]
+                        ) -> None:
+        """Applies the effects of modules on the tiles of an army.
 
         Args:
-            tilemodel (Tile): Tile affected
-            effect_type (str): Type of effect
-        """
-        if effect_type == "medic":
-            self._apply_medic_effect_on_tile(tilemodel)
-        elif effect_type == "cac_augment":
-            self._apply_cac_augment_effect_on_tile(tilemodel)
-        elif effect_type == "range_augment":
-            self._apply_range_augment_effect_on_tile(tilemodel)
-        elif effect_type == "initiative_augment":
-            self._apply_initiative_augment_effect_on_tile(tilemodel)
-        elif effect_type == "double_initiative":
-            self._apply_double_initiative_effect_on_tile(tilemodel)
-        elif effect_type == "saboteur":
-            self._apply_saboteur_effect_on_tile(tilemodel)
-        elif effect_type == "scoper":
-            self._apply_scoper_effect_on_tile(tilemodel)
-        elif effect_type == "quartiermaitre":
-            self._apply_quartiermaitre_effect_on_tile(tilemodel)
-
-    def _get_prio_army_modules(self, army_name: str) -> List[Tile]:
-        """
-        Returns a list of priority module tiles for the specified
-        army.
+            army_name (str): army name
+            modules (List[Tile]): Modules applied
+            tile_armies (Dict[str, str]): Army of each tile, by ID
+            module_effects (Dict[str, List[str]]):
+                Effects applied on each tile, by ID
+        """
+        board = self.gamecontroller.board
+        list_effects, list_effects_position = \
+            self._get_effects_modules(modules)
+        for effect, effect_position in zip(list_effects,
+                                        list_effects_position):
+            tile = board.find_any_tile_at_position(effect_position)
+            if tile is not None and tile_armies[tile.id_tile] == army_name:
+                self._apply_one_effect_on_tile(tile,
+                                            effect,
+                                            tile_armies,
+                                            module_effects)
+
+    def _get_army_modules(self,
+                        army_name: str,
+                        tile_armies: Dict[str, str],
+                        priority: bool
+                    ) -> List[Tile]:
+        """
+        Returns the priority or non priority modules of an army. A
+        module is a priority module if it has an effect of
+        PRIORITY_MODULE_EFFECTS.
 
         Args:
             army_name (str): Name of the army
+            tile_armies (Dict[str, str]): Army of each tile, by ID
+            priority (bool): True for the priority modules
 
         Returns:
             List[Tile]: List of modules
         """
-        modules_prio = []
-        for tile in self.gamecontroller.board.tiles[army_name]:
-            if tile.kind == "module":
-                if tile.id_tile == "outpost-derivateur":
-                    modules_prio.append(tile)
-        return modules_prio
+        board = self.gamecontroller.board
+        return [
+            tile
+            for army in board.armies
+            for tile in board.tiles[army]
+            if tile.kind == "module"
+            and tile_armies[tile.id_tile] == army_name
+            and priority == any(effect_type in PRIORITY_MODULE_EFFECTS
+                                for effect in tile.module or []
+                                for effect_type in effect)
+        ]
 
     def _get_effects_modules(self, modules: List[Tile]) \
             -> Tuple[List[str], List[Tuple[int, int, int]]]:
@@ -306,7 +298,7 @@ class ModuleEvaluator:
         Returns:
             Tuple[List[str], List[Tuple[int, int, int]]]: 
             list of effects and list of cube position where applied the
-            effect. 
+            effect. Positions outside the board are skipped.
             The two indexes of the two list match
         """
         effects = []
@@ -315,34 +307,24 @@ class ModuleEvaluator:
         for module_tile in modules:
             if module_tile.module and module_tile.board_position:
                 for effect in module_tile.module:
-                    effect_type = [list(effect.keys())[0]]
+                    effect_type = list(effect.keys())[0]
+                    effect_directions = list(effect.values())[0]
+                    if not effect_directions:
+                        continue
                     affected_position = [
-                        calculate_position(x, module_tile.board_position)
-                        for x in list(effect.values())[0]
+                        position
+                        for position in (
+                            get_neighbor_position(
+                                module_tile.board_position,
+                                tuple(x),
+                                self.gamecontroller.board.board_limit)
+                            for x in effect_directions
+                        )
+                        if position is not None
                     ]
                     effects.extend([effect_type] * len(affected_position))
                     effect_positions.extend(affected_position)
         return effects, effect_positions
-        # Attention les deux listes n'ont pas toujours la même taille 
-        # (faire un test)
-
-    def _get_non_prio_army_modules(self, army_name: str) -> List[Tile]:
-        """
-        Returns a list of non priority module tiles for the specified
-        army.
-
-        Args:
-            army_name (str): Name of the army
-
-        Returns:
-            List[Tile]: List of modules
-        """
-        modules = []
-        for tile in self.gamecontroller.board.tiles[army_name]:
-            if tile.kind == "module":
-                if tile.id_tile != "outpost-derivateur":
-                    modules.append(tile)
-        return modules
 
     def _get_active_army_modules(self, army_name: str) -> List[Tile]:
         """Returns a list of active module tiles for the specified army.
@@ -361,170 +343,14 @@ class ModuleEvaluator:
                     modules_active.append(tile)
         return modules_active
 
-    def _apply_prio_effect_modules_army(self, army_name: str) -> None:
-        """Applies priority module effects for a given army.
-
-        Args:
-            army_name (str): army name
-        """
-        modules_prio = self._get_prio_army_modules(army_name)
-        list_effects_prio, list_effects_position_prio = \
-            self._get_effects_modules(modules_prio)
-        for index, effect_prio in enumerate(list_effects_prio):
-            effect_position_prio = list_effects_position_prio[index]
-            tile = self.gamecontroller.board.find_army_tile_at_position(
-                army_name, effect_position_prio)
-            if tile is not None:
-                self._apply_one_effect_on_tile(tile, effect_prio)
-
-    def _apply_non_prio_effect_modules_army(self, army_name: str) -> None:
-        """Applies non priority module effects for a given army.
-
-        Args:
-            army_name (str): army name
-        """
-        modules_non_prio = self._get_non_prio_army_modules(army_name)
-        list_effects_non_prio, list_effects_position_non_prio = \
-            self._get_effects_modules(modules_non_prio)
-        for index, effect_non_prio in enumerate(list_effects_non_prio):
-            effect_position_non_prio = list_effects_position_non_prio[index]
-            tile = self.gamecontroller.board.find_army_tile_at_position(
-                army_name, effect_position_non_prio)
-            if tile is not None:
-                self._apply_one_effect_on_tile(tile, effect_non_prio)
-
-    def _clean_medic_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("medic")
-
-    def _clean_cac_augment_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("cac_augment")
-        if tilemodel.cac_attacks_power is not None:
-            tilemodel.cac_attacks_power = (
-                [
-                cac_attack_power - 1 
-                for cac_attack_power in tilemodel.cac_attacks_power
-            ]
-        )
-
-    def _clean_range_augment_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("range_augment")
-        if tilemodel.range_attacks_power is not None:
-            tilemodel.range_attacks_power = (
-                [range_attack_power -
-                    1 for range_attack_power in tilemodel.range_attacks_power]
-            )
-
-    def _clean_initiative_augment_effect_on_tile(self,
-                                                tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("initiative_augment")
-        if tilemodel.initiative is not None:
-            tilemodel.initiative = (
-                [initiative - 1 for initiative in tilemodel.initiative]
-            )
-
-    def _clean_double_initiative_effect_on_tile(self,
-                                                tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("double_initiative")
-        if tilemodel.initiative and len(tilemodel.initiative) >= 2:
-            min_init = min(tilemodel.initiative)
-            tilemodel.initiative.remove(min_init)
-
-    def _clean_saboteur_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("saboteur")
-        if tilemodel.initiative is not None:
-            for index, init in enumerate(tilemodel.initiative):
-                tilemodel.initiative[index] = init+1
-
-    def _clean_scoper_effect_on_tile(self, tilemodel: Tile) -> None:
-        """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        if tilemodel.kind == "module":
-            tilemodel.module_effects.remove("scoper")
-            self.gamecontroller.board.remove_tile_from_board(tilemodel.id_tile)
-            tilemodel.army_name = next_element(
-                self.gamecontroller.board.armies, tilemodel.army_name)
-            self.gamecontroller.board.add_tile_to_board(tilemodel)
-
     def _clean_quartiermaitre_effect_on_tile(self, tilemodel: Tile) -> None:
         """
-        Cleans a specific type of module effect from a tile (e.g., 
-        "medic", "range_augment").
-
-        Args:
-            tilemodel (Tile): Tile affected
-        """
-        tilemodel.module_effects.remove("quartiermaitre")
-
-    def _clean_one_effect_on_tile(self,
-                                tilemodel: Tile,
-                                effect_type: str
-                            ) -> None:
-        """Clean a specific effect from a tile based on its type.
+        Cleans the "quartiermaitre" effect from a tile once it fired. The
+        board applies it again when its module effects are refreshed.
 
         Args:
             tilemodel (Tile): Tile affected
-            effect_type (str): effect type
         """
-        if effect_type == "medic":
-            self._clean_medic_effect_on_tile(tilemodel)
-        elif effect_type == "cac_augment":
-            self._clean_cac_augment_effect_on_tile(tilemodel)
-        elif effect_type == "range_augment":
-            self._clean_range_augment_effect_on_tile(tilemodel)
-        elif effect_type == "initiative_augment":
-            self._clean_initiative_augment_effect_on_tile(tilemodel)
-        elif effect_type == "double_initiative":
-            self._clean_double_initiative_effect_on_tile(tilemodel)
-        elif effect_type == "saboteur":
-            self._clean_saboteur_effect_on_tile(tilemodel)
-        elif effect_type == "scoper":
-            self._clean_scoper_effect_on_tile(tilemodel)
-        elif effect_type == "quartiermaitre":
-            self._clean_quartiermaitre_effect_on_tile(tilemodel)
+        module_effects = list(tilemodel.module_effects)
+        module_effects.remove("quartiermaitre")
+        tilemodel.set_attribute("module_effects", module_effects)
@@ -103,14 +103,12 @@ class TileController:
         Raises:
             ValueError: if no tile with the ID.
         """
-        try:
-            tile = next(tile for tile in self.gamecontroller.board.all_tile
-                        if tile.id_tile == id_tile)
-            return tile.__dict__
-        except StopIteration:
+        tile = self.gamecontroller.board.tile_registry.get(id_tile)
+        if tile is None:
             raise ValueError(
                 "ID tile incorrect or no tile with the given ID exists."
                 )
+        return tile.to_dict()
 
     def get_one_model_tile(self, id_tile: str) -> Tile:
         """
@@ -126,15 +124,7 @@ class TileController:
         Raises:
             ValueError: If no tile with the given ID exists.
         """
-        tile = next(
-        (tile for tile in self.gamecontroller.board.all_tile
-        if tile.id_tile == id_tile),
-        None
-    )
-        if tile is None:
-            raise ValueError(f"No tile found with ID '{id_tile}'.")
-
-        return tile
+        return self.gamecontroller.board.get_tile(id_tile)
 
     def _check_tileview_criteria(self,
                 player: Player,
@@ -527,7 +517,7 @@ class TileController:
         """
         tilemodel = self.get_one_model_tile(tileview.id_tile)
         if tilemodel.life_point:
-            tilemodel.life_point = tilemodel.life_point-1
+            tilemodel.set_attribute("life_point", tilemodel.life_point-1)
             if tilemodel.life_point <= 0:
                 self.gamecontroller.view.tiles_board.remove(tileview)
                 self.gamecontroller.board.remove_tile_from_board(
@@ -559,7 +549,8 @@ class TileController:
             position for position in get_neighbors_hex_positions(
                                         tile_collided_info['board_position']
                                     )
-            if position in self.gamecontroller.board.position_index[enemy_army]
+            if self.gamecontroller.board.find_army_tile_at_position(
+                enemy_army, position) is not None
         ]
 
         if neighbors_enemies_positions == []:
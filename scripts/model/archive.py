@@ -0,0 +1,329 @@
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Literal, Optional, Tuple
+
+from scripts.model.replay import HEADER, RECORD, ReplayLog
+
+
+ARCHIVE_MAGIC = b"NSRA"
+INDEX_MAGIC = b"NSRI"
+ARCHIVE_VERSION = 1
+# Magic, version, number of games (only used in the index)
+ARCHIVE_HEADER = struct.Struct("<4sIQ")
+# End offset of a game in the archive
+OFFSET = struct.Struct("<Q")
+# End offsets of two consecutive games
+BOUNDS = struct.Struct("<2Q")
+
+
+class ReplayArchive:
+    """
+    Append-only archive of replay logs, read through `mmap`.
+
+    The archive file holds a fixed header, then the serialized
+    `ReplayLog` of each game, back to back. A sidecar index file
+    (archive path + ".idx") holds a fixed header with the number of
+    games, then the end offset of each game. Game N is read without
+    scanning: its bytes are a zero-copy `memoryview` slice of the
+    mapped archive, served from the page cache.
+
+    Games are committed by the game count of the index header, written
+    last: a crash while appending leaves the archive readable, the
+    partial game being ignored and overwritten by the next append.
+
+    Attributes
+    ----------
+    path (str):
+        Path of the archive file.
+    mode (Literal["r", "a"]):
+        "r" to read, "a" to read and append.
+
+    Methods
+    ----------
+    append(replay: bytes) -> int:
+        Appends a serialized replay log.
+    extend(replays: Iterable[bytes]) -> None:
+        Appends serialized replay logs, committed at once.
+    get_log(index: int) -> ReplayLog:
+        Returns the replay log of a game.
+    get_seed(index: int) -> int:
+        Returns the seed of a game, without decoding its records.
+    iter_records(index: int) -> Iterator[Tuple[int, int, int, int]]:
+        Yields the raw records of a game.
+    close() -> None:
+        Closes the files of the archive.
+
+    Private Methods
+    ----------
+    _open_file(path: str, magic: bytes) -> BinaryIO:
+        Opens a file of the archive, creating it if needed.
+    _commit(offsets: List[int]) -> None:
+        Writes the offsets of new games in the index.
+    _mapped() -> memoryview:
+        Returns the mapped archive, mapped again if it grew.
+    _release() -> None:
+        Drops the maps of the archive and of the index.
+    _bounds(index: int) -> Tuple[int, int]:
+        Returns the start and end offsets of a game.
+    """
+
+    def __init__(self, path: str, mode: Literal["r", "a"] = "r") -> None:
+        """
+        Opens an archive. In "a" mode, the archive is created if it
+        does not exist.
+
+        Args:
+            path (str): Path of the archive file
+            mode (Literal["r", "a"], optional):
+                "r" to read, "a" to read and append. Defaults to "r".
+
+        Raises:
+            ValueError: If the mode is unknown
+            ValueError: If a file is not a replay archive
+        """
+        if mode not in ["r", "a"]:
+            raise ValueError(f"Unknown archive mode: {mode}.")
+
+        self.path = path
+        self.mode = mode
+        self._archive = self._open_file(path, ARCHIVE_MAGIC)
+        self._index = self._open_file(path + ".idx", INDEX_MAGIC)
+        self._count = ARCHIVE_HEADER.unpack(
+            self._index.read(ARCHIVE_HEADER.size))[2]
+        self._mmap: Optional[mmap.mmap] = None
+        self._index_mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._mapped_count = 0
+        self._end = (self._bounds(-1)[1] if self._count
+                    else ARCHIVE_HEADER.size)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> memoryview:
+        """
+        Returns the serialized replay log of a game, as a zero-copy
+        view of the mapped archive.
+
+        Args:
+            index (int): Index of the game, negative from the end
+
+        Returns:
+            memoryview: The serialized replay log
+
+        Raises:
+            IndexError: If there is no such game
+        """
+        start, end = self._bounds(index)
+        return self._mapped()[start:end]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(self._count):
+            yield self[index]
+
+    def __enter__(self) -> "ReplayArchive":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def append(self, replay: bytes) -> int:
+        """
+        Appends a serialized replay log, see `ReplayLog.to_bytes`.
+
+        Args:
+            replay (bytes): The serialized replay log
+
+        Returns:
+            int: Index of the game in the archive
+
+        Raises:
+            ValueError: If the archive is not opened in "a" mode
+        """
+        self.extend([replay])
+        return self._count - 1
+
+    def extend(self, replays: Iterable[bytes]) -> None:
+        """
+        Appends serialized replay logs. They are committed at once, at
+        the end.
+
+        Args:
+            replays (Iterable[bytes]): The serialized replay logs
+
+        Raises:
+            ValueError: If the archive is not opened in "a" mode
+        """
+        if self.mode != "a":
+            raise ValueError("Archive not opened in append mode.")
+
+        self._archive.seek(self._end)
+        offsets = []
+        for replay in replays:
+            self._archive.write(replay)
+            self._end += len(replay)
+            offsets.append(self._end)
+        self._archive.flush()
+        self._commit(offsets)
+
+    def get_log(self, index: int) -> ReplayLog:
+        """
+        Returns the replay log of a game.
+
+        Args:
+            index (int): Index of the game
+
+        Returns:
+            ReplayLog: The replay log
+
+        Raises:
+            IndexError: If there is no such game
+        """
+        return ReplayLog.from_bytes(self[index])
+
+    def get_seed(self, index: int) -> int:
+        """
+        Returns the seed of a game, read from the header of its log
+        without decoding its records.
+
+        Args:
+            index (int): Index of the game
+
+        Returns:
+            int: The seed
+
+        Raises:
+            IndexError: If there is no such game
+        """
+        return HEADER.unpack_from(self[index])[2]
+
+    def iter_records(self, index: int
+                    ) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Yields the raw records of a game, unpacked straight from the
+        mapped archive: operation and rotation byte, tile, target tile
+        and hex. See `ReplayLog` for their meaning.
+
+        Args:
+            index (int): Index of the game
+
+        Returns:
+            Iterator[Tuple[int, int, int, int]]: The raw records
+
+        Raises:
+            IndexError: If there is no such game
+        """
+        view = self[index]
+        names_size = HEADER.unpack_from(view)[4]
+        return RECORD.iter_unpack(view[HEADER.size + names_size:])
+
+    def close(self) -> None:
+        """Closes the files of the archive."""
+        self._release()
+        self._archive.close()
+        self._index.close()
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _open_file(self, path: str, magic: bytes) -> BinaryIO:
+        """
+        Opens a file of the archive and checks its header. In "a" mode,
+        a missing file is created with its header.
+
+        Args:
+            path (str): Path of the file
+            magic (bytes): Magic bytes of the file
+
+        Returns:
+            BinaryIO: The opened file
+
+        Raises:
+            ValueError: If the file is not a file of a replay archive
+        """
+        if self.mode == "a" and not os.path.exists(path):
+            with open(path, "wb") as file:
+                file.write(ARCHIVE_HEADER.pack(magic, ARCHIVE_VERSION, 0))
+
+        file = open(path, "r+b" if self.mode == "a" else "rb")
+        header = file.read(ARCHIVE_HEADER.size)
+        if (len(header) < ARCHIVE_HEADER.size
+                or ARCHIVE_HEADER.unpack(header)[:2]
+                    != (magic, ARCHIVE_VERSION)):
+            file.close()
+            raise ValueError(f"{path} is not a replay archive file.")
+        file.seek(0)
+        return file
+
+    def _commit(self, offsets: List[int]) -> None:
+        """
+        Writes the end offsets of new games in the index, then their
+        number in the header: the games are then readable.
+
+        Args:
+            offsets (List[int]): End offsets of the new games
+        """
+        self._index.seek(ARCHIVE_HEADER.size + self._count * OFFSET.size)
+        self._index.write(b"".join(OFFSET.pack(x) for x in offsets))
+        self._index.flush()
+        self._count += len(offsets)
+        self._index.seek(0)
+        self._index.write(ARCHIVE_HEADER.pack(INDEX_MAGIC,
+                                            ARCHIVE_VERSION,
+                                            self._count))
+        self._index.flush()
+
+    def _mapped(self) -> memoryview:
+        """
+        Returns the mapped archive, and maps the index. Both are mapped
+        again if games were appended since.
+
+        Returns:
+            memoryview: View of the whole archive
+        """
+        if self._view is None or self._mapped_count != self._count:
+            self._release()
+            self._mmap = mmap.mmap(self._archive.fileno(),
+                                0,
+                                access=mmap.ACCESS_READ)
+            self._index_mmap = mmap.mmap(self._index.fileno(),
+                                        0,
+                                        access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+            self._mapped_count = self._count
+        return self._view
+
+    def _release(self) -> None:
+        """
+        Drops the maps of the archive and of the index. They are unmapped
+        once the views returned to the callers are released.
+        """
+        self._view = None
+        self._mmap = self._index_mmap = None
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Returns the start and end offsets of a game in the archive, read
+        in the mapped index.
+
+        Args:
+            index (int): Index of the game, negative from the end
+
+        Returns:
+            Tuple[int, int]: Start and end offsets
+
+        Raises:
+            IndexError: If there is no such game
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"No game {index} in the archive.")
+        self._mapped()
+        if index == 0:
+            return (ARCHIVE_HEADER.size,
+                    OFFSET.unpack_from(self._index_mmap, # type: ignore
+                                    ARCHIVE_HEADER.size)[0])
+        return BOUNDS.unpack_from(self._index_mmap, # type: ignore
+                                ARCHIVE_HEADER.size
+                                + (index - 1) * OFFSET.size)
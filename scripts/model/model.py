@@ -1,146 +1,758 @@
+import os
+import pickle
 import random
+import hashlib
 import importlib
-from dataclasses import dataclass, field
+import importlib.util
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+
+from typing import (Any, Callable, List, Literal, Tuple, Optional, Dict,
+                    Iterable, Iterator, Mapping, NamedTuple, Sequence)
+
+from scripts.utils.config import (CUBE_DIRECTION_VECTORS,
+                                BATTLE_MODULE_EFFECTS,
+                                PRIORITY_MODULE_EFFECTS,
+                                ACTIVE_MODULE_EFFECTS
+                            )
+from scripts.utils.functions import (raise_wrong_cube_coordinate,
+                                    get_board_hexes,
+                                    get_hex_index,
+                                    get_free_hexes,
+                                    get_neighbor_position,
+                                    get_zobrist_key,
+                                    get_zobrist_table,
+                                    next_element
+                                )
+
+
+Direction = Tuple[int, int, int]
+ModuleEffects = Tuple[Mapping[str, Optional[Tuple[Direction, ...]]], ...]
+
+
+def _direction_positive_rotation(direction: Direction) -> Direction:
+    """Return the rotated direction with a angle of +60°
+
+    Args:
+        direction (Tuple[int, int, int]): 
+            Direction coordinnates to rotate. 
+            Cube coordinnates define on the hexaboard
+
+    Returns:
+        Tuple: direction rotated
+    """
+    q, r, s = direction
+    return (-r, -s, -q)
+
+
+def _direction_negative_rotation(direction: Direction) -> Direction:
+    """Return the rotated direction with a angle of -60°
+
+    Args:
+        direction (Tuple[int, int, int]):
+            Direction to rotate. 
+            Cube coordinnates define on the hexaboard
+
+    Returns:
+        Tuple: direction rotated
+    """
+    q, r, s = direction
+    return (-s, -q, -r)
+
+
+def _directions_rotation(directions: Optional[Sequence[Direction]],
+                        rotation_diff: int
+                        ) -> Optional[Tuple[Direction, ...]]:
+    """
+    Rotate a list of direction by a speficied number of step 
+    (+60° or -60°)
+
+    Args:
+        directions (Optional[Sequence[Tuple[int, int, int]]]): 
+            The cube coordinates representing the directions to be
+            rotated. None or empty if the tile has no such direction.
+        rotation_diff (int): 
+            The number of rotation steps. 
+            A positive value indicates clockwise rotation,
+            while a negative value indicates
+            counterclockwise rotation.
+
+    Returns:
+        Optional[Tuple[Tuple[int, int, int], ...]]:
+            The directions after applying the rotation.
+    """
+    if directions is None:
+        return None
+
+    rotated_directions = tuple(tuple(direction) for direction in directions)
+    for _ in range(abs(rotation_diff)):
+        rotated_directions = tuple(
+            _direction_positive_rotation(direction)
+            if rotation_diff > 0
+            else _direction_negative_rotation(direction)
+            for direction in rotated_directions
+        )
+    return rotated_directions # type: ignore
+
+
+def _rotate_module(module: Optional[ModuleEffects], rotation_diff: int
+                ) -> Optional[ModuleEffects]:
+    """
+    Rotate module directions by a speficied number of step.
+
+    Args:
+        module (Optional[ModuleEffects]): Module effects to rotate
+        rotation_diff (int): The number of rotation steps.
+
+    Returns:
+        Optional[ModuleEffects]: Read-only rotated module effects
+    """
+    if module is None:
+        return None
+    return tuple(
+        MappingProxyType({
+            effect_name: _directions_rotation(effect_directions,
+                                            rotation_diff)
+            if effect_directions else effect_directions
+            for effect_name, effect_directions in effect.items()
+        })
+        for effect in module
+    )
+
+
+def _rotation_signature(rotation: "TileRotation",
+                        range_attacks_power: Optional[Tuple[int, ...]],
+                        cac_attacks_power: Optional[Tuple[int, ...]]
+                        ) -> Tuple:
+    """
+    Returns a value equal for two rotations of a tile having the same
+    effect on the board: same attacks with the same powers, nets,
+    shields and module effects, in any order.
+
+    Args:
+        rotation (TileRotation): Directions of the rotation
+        range_attacks_power (Optional[Tuple[int, ...]]):
+            Powers of the ranged attacks
+        cac_attacks_power (Optional[Tuple[int, ...]]):
+            Powers of the close-combat attacks
+
+    Returns:
+        Tuple: Signature of the rotation
+    """
+    return (
+        tuple(sorted(zip(rotation.range_attacks_direction or (),
+                        range_attacks_power or ()))),
+        tuple(sorted(zip(rotation.cac_attacks_direction or (),
+                        cac_attacks_power or ()))),
+        tuple(sorted(rotation.net_directions or ())),
+        tuple(sorted(rotation.shields_directions or ())),
+        tuple(sorted((effect_name, tuple(sorted(effect_directions or ())))
+                    for effect in rotation.module or ()
+                    for effect_name, effect_directions in effect.items()))
+    )
+
+
+class TileRotation(NamedTuple):
+    """
+    Directions of a tile template for one rotation index, computed once.
+    """
+    range_attacks_direction: Optional[Tuple[Direction, ...]]
+    cac_attacks_direction: Optional[Tuple[Direction, ...]]
+    net_directions: Optional[Tuple[Direction, ...]]
+    shields_directions: Optional[Tuple[Direction, ...]]
+    module: Optional[ModuleEffects]
+
+
+@dataclass(frozen=True, eq=False)
+class TileTemplate:
+    """
+    Static data of a kind of tile, shared by all identical tiles of all
+    games (e.g. `borgo-mutant1` to `borgo-mutant4`). Templates are
+    immutable: directions, powers and modules are tuples or read-only
+    mappings.
+
+    The directions of the 6 rotations are computed once, in
+    `rotations`, as well as the rotations giving different tiles, in
+    `distinct_rotations`.
+
+    Attributes
+    ----------
+        army_name (str): 
+            Name of the army the tile belongs to.
+        kind (Literal['base', 'unite', 'module', 'action']): 
+            Type of the tile.
+        initiative (Optional[Tuple[int, ...]]): 
+            Initiative values of the tile.
+        range_attacks_direction (Optional[Tuple[Direction, ...]]): 
+            Directions of the ranged attacks, for rotation index 0.
+        range_attacks_power (Optional[Tuple[int, ...]]): 
+            Powers of the ranged attacks.
+        cac_attacks_direction (Optional[Tuple[Direction, ...]]): 
+            Directions of the close-combat attacks, for rotation
+            index 0.
+        cac_attacks_power (Optional[Tuple[int, ...]]): 
+            Powers of the close-combat attacks.
+        net_directions (Optional[Tuple[Direction, ...]]): 
+            Directions of the nets, for rotation index 0.
+        life_point (Optional[int]): 
+            Initial life points of the tile.
+        shields_directions (Optional[Tuple[Direction, ...]]): 
+            Directions of the shields, for rotation index 0.
+        special_capacities (Tuple[str, ...]): 
+            Special abilities of the tile.
+        module (Optional[ModuleEffects]): 
+            Module effects of the tile, for rotation index 0.
+        action (Optional[str]): 
+            Action of the tile if kind is "action".
+        url_image (str): 
+            URL of the tile's image.
+        catalog_index (int, default=-1):
+            Index of the template among the templates of its army
+            catalog, keying its fixed Zobrist keys. -1 outside a
+            catalog.
+        rotations (Tuple[TileRotation, ...]):
+            Directions of the tile for each rotation index.
+        distinct_rotations (Tuple[int, ...]):
+            Rotation indexes giving different tiles, the others are
+            equivalent under the symmetry of the tile (e.g. (0,) for
+            a HQ).
+
+    Methods
+    ----------
+        from_dict(dict_tile: dict) -> TileTemplate:
+            Builds a template from a tile of `scripts/armies`.
+        with_attacks(rotational_index: int,\
+                    range_attacks_direction: Sequence[Direction],\
+                    range_attacks_power: Sequence[int],\
+                    cac_attacks_direction: Sequence[Direction],\
+                    cac_attacks_power: Sequence[int]) -> TileTemplate:
+            Returns a template with other attacks.
+    """
+
+    army_name: str
+    kind: Literal['base', 'unite', 'module', 'action']
+    initiative: Optional[Tuple[int, ...]]
+    range_attacks_direction: Optional[Tuple[Direction, ...]]
+    range_attacks_power: Optional[Tuple[int, ...]]
+    cac_attacks_direction: Optional[Tuple[Direction, ...]]
+    cac_attacks_power: Optional[Tuple[int, ...]]
+    net_directions: Optional[Tuple[Direction, ...]]
+    life_point: Optional[int]
+    shields_directions: Optional[Tuple[Direction, ...]]
+    special_capacities: Tuple[str, ...]
+    module: Optional[ModuleEffects]
+    action: Optional[str]
+    url_image: str
+    catalog_index: int = -1
+    rotations: Tuple[TileRotation, ...] = field(init=False, repr=False)
+    distinct_rotations: Tuple[int, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "rotations", tuple(
+            TileRotation(
+                range_attacks_direction=_directions_rotation(
+                    self.range_attacks_direction, rotational_index),
+                cac_attacks_direction=_directions_rotation(
+                    self.cac_attacks_direction, rotational_index),
+                net_directions=_directions_rotation(
+                    self.net_directions, rotational_index),
+                shields_directions=_directions_rotation(
+                    self.shields_directions, rotational_index),
+                module=_rotate_module(self.module, rotational_index)
+            )
+            for rotational_index in range(6)
+        ))
+        signatures: Dict[Tuple, int] = {}
+        for rotational_index, rotation in enumerate(self.rotations):
+            signatures.setdefault(
+                _rotation_signature(rotation,
+                                    self.range_attacks_power,
+                                    self.cac_attacks_power),
+                rotational_index)
+        object.__setattr__(self, "distinct_rotations",
+                        tuple(signatures.values()))
+
+    def __reduce__(self):
+        # Read-only mappings can not be pickled, modules are saved as
+        # dicts. Rotations are saved too, they are not computed again.
+        state = {name: getattr(self, name)
+                for name in self.__dataclass_fields__}
+        state["module"] = _module_to_dicts(self.module)
+        state["rotations"] = tuple(
+            rotation._replace(module=_module_to_dicts(rotation.module))
+            for rotation in self.rotations
+        )
+        return (_template_from_state, (state,))
+
+    @classmethod
+    def from_dict(cls, dict_tile: dict) -> "TileTemplate":
+        """
+        Builds a template from a tile of `scripts/armies`.
+
+        Args:
+            dict_tile (dict): 
+                dict containing information for Tile initialisation
+        Raises:
+            TypeError: If the provided dict_tile is not a dictionary.
+        """
+        if not isinstance(dict_tile, dict):
+            raise TypeError("Expected a dictionary for dict_tile, got "
+                            f"{type(dict_tile).__name__}.")
+
+        def to_tuple(values: Optional[Sequence]) -> Optional[Tuple]:
+            return None if values is None else tuple(values)
+
+        return cls(
+            army_name=dict_tile['army_name'],
+            kind=dict_tile['kind'],
+            initiative=to_tuple(dict_tile['initiative']),
+            range_attacks_direction=_directions_rotation(
+                dict_tile['range_attacks_direction'], 0),
+            range_attacks_power=to_tuple(dict_tile['range_attacks_power']),
+            cac_attacks_direction=_directions_rotation(
+                dict_tile['cac_attacks_direction'], 0),
+            cac_attacks_power=to_tuple(dict_tile['cac_attacks_power']),
+            net_directions=_directions_rotation(
+                dict_tile['net_directions'], 0),
+            life_point=dict_tile['life_point'],
+            shields_directions=_directions_rotation(
+                dict_tile['shields_directions'], 0),
+            special_capacities=tuple(dict_tile['special_capacities'] or ()),
+            module=_rotate_module(dict_tile['module'], 0),
+            action=dict_tile['action'],
+            url_image=dict_tile['url_image']
+        )
+
+    def with_attacks(self,
+                    rotational_index: int,
+                    range_attacks_direction: Sequence[Direction],
+                    range_attacks_power: Sequence[int],
+                    cac_attacks_direction: Sequence[Direction],
+                    cac_attacks_power: Sequence[int]
+                ) -> "TileTemplate":
+        """
+        Returns a template with other attacks, the other data being
+        the same.
+
+        Args:
+            rotational_index (int):
+                Rotation index in which the directions are given.
+            range_attacks_direction (Sequence[Direction]):
+                Directions of the ranged attacks.
+            range_attacks_power (Sequence[int]):
+                Powers of the ranged attacks.
+            cac_attacks_direction (Sequence[Direction]):
+                Directions of the close-combat attacks.
+            cac_attacks_power (Sequence[int]):
+                Powers of the close-combat attacks.
 
-from typing import List, Literal, Tuple, Optional, Dict
+        Returns:
+            TileTemplate: The new template
+        """
+        return replace(
+            self,
+            range_attacks_direction=_directions_rotation(
+                range_attacks_direction, -rotational_index),
+            range_attacks_power=tuple(range_attacks_power),
+            cac_attacks_direction=_directions_rotation(
+                cac_attacks_direction, -rotational_index),
+            cac_attacks_power=tuple(cac_attacks_power)
+        )
+
+
+def _module_to_dicts(module: Optional[ModuleEffects]
+                    ) -> Optional[Tuple[Dict, ...]]:
+    """Returns module effects with dicts instead of read-only mappings.
+    """
+    if module is None:
+        return None
+    return tuple(dict(effect) for effect in module)
+
+
+def _template_from_state(state: Dict) -> TileTemplate:
+    """
+    Rebuilds a pickled template, without computing its rotations again.
+
+    Args:
+        state (Dict): Attributes of the template, by name
+
+    Returns:
+        TileTemplate: The template
+    """
+    template = object.__new__(TileTemplate)
+    for name, value in state.items():
+        object.__setattr__(template, name, value)
+    object.__setattr__(template, "module", _rotate_module(state["module"], 0))
+    object.__setattr__(template, "rotations", tuple(
+        rotation._replace(module=_rotate_module(rotation.module, 0))
+        for rotation in state["rotations"]
+    ))
+    return template
+
+
+class ChangeJournal:
+    """
+    Journal of the changes of a game, to undo them. It lets a search
+    play an action in place (make) and revert it (unmake), without
+    copying the game.
+
+    The model records the inverse of each change it makes while a
+    journal is attached (`GameEngine.attach_journal`,
+    `HexBoard.attach_journal`, `Player.attach_journal`): only the tile
+    attributes that changed, the tiles entering or leaving a hand, a
+    deck or a discard pile, and the entries of the board indexes.
+    Changes made by the `restore` methods of the snapshots are not
+    recorded.
+
+    Attributes
+    ----------
+        entries (List[Tuple]):
+            Undo operations, in the order of the changes. Each one is a
+            function followed by its arguments.
+
+    Methods
+    ----------
+        mark() -> int:
+            Returns a mark of the current state, to undo to.
+        undo(mark: int = 0) -> None:
+            Undoes the changes recorded after a mark.
+        record(undo_function: Callable, *arguments: Any) -> None:
+            Records the undo operation of a change.
+        record_attribute(obj: Any, name: str) -> None:
+            Records the value of an attribute before it changes.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[Tuple] = []
+
+    def mark(self) -> int:
+        """
+        Returns a mark of the current state, to undo to.
+
+        Returns:
+            int: The mark
+        """
+        return len(self.entries)
+
+    def undo(self, mark: int = 0) -> None:
+        """
+        Undoes the changes recorded after a mark, the last one first.
+
+        Args:
+            mark (int, optional): Mark returned by `mark`. Defaults to
+                0, all the changes.
+        """
+        entries = self.entries
+        while len(entries) > mark:
+            undo_function, *arguments = entries.pop()
+            undo_function(*arguments)
+
+    def record(self, undo_function: Callable, *arguments: Any) -> None:
+        """
+        Records the undo operation of a change.
+
+        Args:
+            undo_function (Callable): Function undoing the change
+            *arguments (Any): Arguments of the function
+        """
+        self.entries.append((undo_function, *arguments))
 
-from scripts.utils.config import CUBE_DIRECTION_VECTORS
-from scripts.utils.functions import raise_wrong_cube_coordinate
+    def record_attribute(self, obj: Any, name: str) -> None:
+        """
+        Records the value of an attribute before it changes.
+
+        Args:
+            obj (Any): Object of the attribute
+            name (str): Name of the attribute
+        """
+        self.entries.append((object.__setattr__, obj, name,
+                            getattr(obj, name)))
+
+
+# State of a tile saved by snapshots
+TILE_STATE_ATTRIBUTES = ("template",
+                        "board_position",
+                        "rotational_index",
+                        "life_point",
+                        "is_netted",
+                        "module_effects"
+                    )
+_get_tile_state = attrgetter(*TILE_STATE_ATTRIBUTES)
+# Attributes of a tile saved by pickle. The journal and the board are
+# links to the game, set again by the board (see HexBoard.__setstate__)
+PICKLED_TILE_ATTRIBUTES = ("id_tile",
+                        "army_name",
+                        "template",
+                        "board_position",
+                        "rotational_index",
+                        "life_point",
+                        "is_netted",
+                        "module_effects"
+                    )
+# Attributes of a tile on the board covered by the board hash
+HASHED_TILE_ATTRIBUTES = frozenset(["template",
+                                    "board_position",
+                                    "rotational_index",
+                                    "life_point",
+                                    "is_netted"
+                                ])
+# Life points with a fixed Zobrist key on each hex. The keys of other
+# life points are derived when needed.
+ZOBRIST_LIFE_POINTS = range(-32, 32)
+# Attributes of a board binding the Zobrist keys, not pickled
+ZOBRIST_KEYS_ATTRIBUTES = frozenset(["_hex_index",
+                                    "_template_keys",
+                                    "_life_keys",
+                                    "_netted_keys"
+                                ])
 
 
-@dataclass
 class Tile:
     """
     Represents a tile in a hexagonal grid-based game.
 
-    The `Tile` class models a game tile with attributes for its type,
-    position, combat characteristics, and special effects.
+    The static data of a tile (type, combat characteristics, modules,
+    image) are read from its shared `TileTemplate`. A `Tile` only holds
+    the state of the tile in a game, in `__slots__`, so that games are
+    light and cheap to clone.
     The tile's orientation can be rotated, which affects its attack,
-    defense, and other directional properties.
+    defense, and other directional properties. The rotated directions
+    are precomputed by the template.
 
     Attributes
     ----------
-        army_name (str): 
-            Name of the army the tile belongs to.
         id_tile (str): 
             Unique identifier for the tile.
-        kind (Literal['base', 'unite', 'module', 'fondation']): 
-            Type of the tile, which determines its role and behavior. 
-            Must be one of "base", "unite", "module", or "fondation".
-        initiative (Optional[List[int]]): 
-            List of initiative values for the tile,
-            determining turn order. 
-            None for tiles that do not participate in initiative-based
-            actions.
-        range_attacks_direction (List[tuple]): 
-            List of directions for ranged attacks in cube coordinates.
-        range_attacks_power (List[int]): 
-            Corresponding power values for ranged attacks. 
-            Each index aligns with `range_attacks_direction`.
-        cac_attacks_direction (List[tuple]): 
-            List of directions for close-combat (melee) attacks in cube
-            coordinates.
-        cac_attacks_power (List[int]): 
-            Corresponding power values for close-combat attacks. 
-            Each index aligns with `cac_attacks_direction`.
-        net_directions (Optional[List[tuple]]): 
-            Directions in which the tile can apply a "net" effect,
-            if applicable.
+        template (TileTemplate): 
+            Static data of the tile.
+        board_position (Tuple[int, int, int]): 
+            The tile's position on the game board in cube coordinates.
+        rotational_index (Literal[0, 1, 2, 3, 4, 5], default=0): 
+            Current rotation of the tile, represented as an index from
+            0 to 5, corresponding to 60° increments on the hexagonal
+            grid.
         life_point (Optional[int]): 
             Number of life points the tile has. None for tiles that are
             not damageable.
-        shields_directions (Optional[List[tuple]]): 
-            Directions of shields for the tile in cube coordinates,
-            if applicable.
-        special_capacities (List[str]): 
-            List of special abilities or effects the tile possesses.
-        module (Optional[List[dict]]): 
-            List of module effects of the tile, where each module effect
-            has a name.
-            Only if kind tile is "module".
-            (key) and associated directional effects (values).
-        action (Optional[str]): 
-            Describes special action associated with the tile.
-            Only if kind tile is "action".
-        board_position (Tuple[int, int, int]): 
-            The tile's position on the game board in cube coordinates.
-        url_image (str): 
-            URL of the tile's image for display in the game interface.
         is_netted (bool, default=False): 
             Indicates whether the tile is currently under a "net" effect
             , disabling some of its abilities.
         module_effects (List, default_factory=list): 
             Stores additional effects applied to the tile via modules.
-            Applicable if tile kind not action
-        rotational_index (Literal[0, 1, 2, 3, 4, 5], default=0): 
-            Current rotation of the tile, represented as an index from
-            0 to 5, corresponding to 60° increments on the hexagonal
-            grid.
+            Applicable if tile kind not action. Kept up to date by the
+            `HexBoard` while the tile is on the board. The list is
+            replaced, never modified in place: snapshots and journals
+            share it.
+        journal (Optional[ChangeJournal]):
+            Journal recording the changes made by `set_attribute`. None
+            if not recorded.
+        board (Optional[HexBoard]):
+            Board the tile is on. Its hash is updated when
+            `set_attribute` changes an attribute of
+            HASHED_TILE_ATTRIBUTES. None if the tile is not on a board.
+            The journal and the board are not pickled, the board links
+            its tiles again.
+        army_name (str):
+            Army key of the player of the tile (see `get_army_keys`).
+            Defaults to the army of the template.
+
+    Read-only attributes, from the template
+    ----------
+        kind, initiative, range_attacks_power,
+        cac_attacks_power, action, url_image.
+        range_attacks_direction, cac_attacks_direction, net_directions,
+        shields_directions, module:
+            Directions for the current rotation index.
+        special_capacities:
+            Special capacities of the template, plus "movement" under a
+            "transport" effect.
 
     Methods
     ----------
+        set_attribute(name: str, value: Any) -> None:
+                Changes an attribute of the state, journaled and
+                hashed.
         rotate_tile(new_rotation_index: Literal[0, 1, 2, 3, 4, 5]
                 ) -> None:
                 Rotates the tile to a specified orientation.
                 This updates all directional attributes (e.g., attacks,
                 shields) to match the new orientation.
+        effective_initiative -> Optional[List[int]]:
+                Initiatives with the module effects applied.
+        effective_cac_attacks_power -> Optional[List[int]]:
+                Close-combat powers with the module effects applied.
+        effective_range_attacks_power -> Optional[List[int]]:
+                Ranged powers with the module effects applied.
+        copy() -> Tile:
+                Returns a copy of the tile sharing its template.
+        to_dict() -> Dict:
+                Returns the attributes of the tile in a dict.
+        snapshot() -> Tuple:
+                Returns the state of the tile.
+        restore(state: Tuple) -> None:
+                Restores a state returned by `snapshot`.
+        reset() -> None:
+                Restores the state of a tile never placed.
+    """
 
-    Private Methods
-    ----------
-        _direction_positive_rotation(direction: Tuple[int, int, int]
-                                ) -> Tuple[int, int, int]:
-            Rotates a direction vector 60° clockwise.
-
-        _direction_negative_rotation(direction: Tuple[int, int, int]
-                                ) -> Tuple[int, int, int]:
-            Rotates a direction vector 60° counterclockwise.
-
-        _directions_rotation(directions: List[Tuple[int, int, int]],
-                            rotation_diff: int) 
-                        -> List[Tuple[int, int, int]]:
-            Rotates a list of direction vectors by a specified number of
-            steps.
-
-        _rotate_shield(rotation_diff: int) -> None:
-            Rotates the shield directions of the tile.
-
-        _rotate_attacks(rotation_diff: int) -> None:
-            Rotates the attack directions (both ranged and melee) of the
-            tile.
+    __slots__ = ("id_tile",
+                "template",
+                "board_position",
+                "rotational_index",
+                "life_point",
+                "is_netted",
+                "module_effects",
+                "journal",
+                "board",
+                "army_name"
+            )
 
-        _rotate_net(rotation_diff: int) -> None:
-            Rotates the net effect directions of the tile.
+    def __init__(self,
+                id_tile: str,
+                template: TileTemplate,
+                board_position: Tuple[int, int, int] = (-1, -1, -1),
+                rotational_index: Literal[0, 1, 2, 3, 4, 5] = 0,
+                life_point: Optional[int] = None,
+                is_netted: bool = False,
+                module_effects: Optional[List[str]] = None,
+                army_name: Optional[str] = None
+            ) -> None:
+        """
+        Initializes the state of a tile.
 
-        _rotate_module(rotation_diff: int) -> None:
-            Rotates the directional effects of modules applied to the
-            tile.
-    """
+        Args:
+            id_tile (str): Unique identifier for the tile.
+            template (TileTemplate): Static data of the tile.
+            board_position (Tuple[int, int, int], optional):
+                Position on the board. Defaults to (-1, -1, -1), not on
+                the board.
+            rotational_index (Literal[0, 1, 2, 3, 4, 5], optional):
+                Rotation index. Defaults to 0.
+            life_point (Optional[int], optional):
+                Life points. Defaults to the life points of the
+                template.
+            is_netted (bool, optional): Defaults to False.
+            module_effects (Optional[List[str]], optional):
+                Module effects applied on the tile. Defaults to none.
+            army_name (Optional[str], optional):
+                Army key of the player. Defaults to the army of the
+                template.
+        """
+        self.journal: Optional[ChangeJournal] = None
+        self.board: Optional[HexBoard] = None
+        self.id_tile = id_tile
+        self.template = template
+        self.board_position = board_position
+        self.rotational_index: Literal[0, 1, 2, 3, 4, 5] = rotational_index
+        self.life_point = (template.life_point
+                        if life_point is None else life_point)
+        self.is_netted = is_netted
+        self.module_effects: List[str] = (
+            [] if module_effects is None else module_effects)
+        self.army_name = (template.army_name
+                        if army_name is None else army_name)
+
+    def __repr__(self) -> str:
+        return (f"Tile(id_tile={self.id_tile!r}, "
+                f"board_position={self.board_position}, "
+                f"rotational_index={self.rotational_index}, "
+                f"life_point={self.life_point})")
+
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, name) for name in PICKLED_TILE_ATTRIBUTES)
+
+    def __setstate__(self, state: Tuple) -> None:
+        self.journal = None
+        self.board = None
+        for name, value in zip(PICKLED_TILE_ATTRIBUTES, state):
+            setattr(self, name, value)
+
+    def __deepcopy__(self, memo: dict) -> "Tile":
+        # The template is immutable, it is shared by the copy
+        return self.copy()
+
+    @property
+    def kind(self) -> Literal['base', 'unite', 'module', 'action']:
+        return self.template.kind
+
+    @property
+    def initiative(self) -> Optional[Tuple[int, ...]]:
+        return self.template.initiative
+
+    @property
+    def range_attacks_direction(self) -> Optional[Tuple[Direction, ...]]:
+        return self.template.rotations[
+            self.rotational_index].range_attacks_direction
+
+    @property
+    def range_attacks_power(self) -> Optional[Tuple[int, ...]]:
+        return self.template.range_attacks_power
+
+    @property
+    def cac_attacks_direction(self) -> Optional[Tuple[Direction, ...]]:
+        return self.template.rotations[
+            self.rotational_index].cac_attacks_direction
+
+    @property
+    def cac_attacks_power(self) -> Optional[Tuple[int, ...]]:
+        return self.template.cac_attacks_power
+
+    @property
+    def net_directions(self) -> Optional[Tuple[Direction, ...]]:
+        return self.template.rotations[self.rotational_index].net_directions
+
+    @property
+    def shields_directions(self) -> Optional[Tuple[Direction, ...]]:
+        return self.template.rotations[
+            self.rotational_index].shields_directions
+
+    @property
+    def module(self) -> Optional[ModuleEffects]:
+        return self.template.rotations[self.rotational_index].module
+
+    @property
+    def special_capacities(self) -> List[str]:
+        special_capacities = list(self.template.special_capacities)
+        if "transport" in self.module_effects:
+            special_capacities.append("movement")
+        return special_capacities
+
+    @property
+    def action(self) -> Optional[str]:
+        return self.template.action
+
+    @property
+    def url_image(self) -> str:
+        return self.template.url_image
+
+    def set_attribute(self, name: str, value: Any) -> None:
+        """
+        Changes an attribute of the state of the tile. The old value is
+        recorded in the journal, and the hash of the board is updated
+        for an attribute of HASHED_TILE_ATTRIBUTES. Attributes changed
+        directly are neither journaled nor hashed.
 
-    army_name: str
-    id_tile: str
-    kind: Literal['base', 'unite', 'module', 'fondation']
-    initiative: Optional[List[int]]
-    range_attacks_direction: List[tuple]
-    range_attacks_power: List[int]
-    cac_attacks_direction: List[tuple]
-    cac_attacks_power: List[int]
-    net_directions: Optional[List[tuple]]
-    life_point: Optional[int]
-    shields_directions: Optional[List[tuple]]
-    special_capacities: List[str]
-    module: Optional[List[dict]]
-    action: Optional[str]
-    board_position: Tuple[int, int, int]
-    url_image: str
-    is_netted: bool = False
-    module_effects: List = field(default_factory=list)
-    rotational_index: Literal[0, 1, 2, 3, 4, 5] = 0
+        Args:
+            name (str): Name of the attribute
+            value (Any): New value
+        """
+        board = self.board
+        is_hashed = board is not None and name in HASHED_TILE_ATTRIBUTES
+        if is_hashed and getattr(self, name) == value:
+            return
+        if self.journal is not None:
+            self.journal.record_attribute(self, name)
+        setattr(self, name, value)
+        if is_hashed:
+            board._rehash_tile(self)
 
     def rotate_tile(self, new_rotation_index: Literal[0, 1, 2, 3, 4, 5]
                     ) -> None:
         """
-        generate all the rotation (attacks, shields) of a tile 
-        according to a new rotation direction.
+        Rotates the tile (attacks, shields, nets, modules) according to
+        a new rotation direction.
 
         Args:
             new_rotation_direction (int): New rotation index of the 
@@ -148,160 +760,385 @@ class Tile:
         """
         if not 0 <= new_rotation_index <= 5:
             raise ValueError("new_rotation_direction must be between 0 and 5.")
+        self.set_attribute("rotational_index", new_rotation_index)
 
-        rotation_diff = new_rotation_index - self.rotational_index
-        if rotation_diff == 0:
-            return
-
-        self._rotate_attacks(new_rotation_index)
-        self._rotate_shield(new_rotation_index)
-        self._rotate_net(new_rotation_index)
-        self._rotate_module(new_rotation_index)
-        self.rotational_index = new_rotation_index
-
-    # --- MÉTHODES PRIVÉES ---
-    def _direction_positive_rotation(
-        self, direction: Tuple[int, int, int]
-    ) -> Tuple[int, int, int]:
-        """Return the rotated direction with a angle of +60°
-
-        Args:
-            direction (Tuple[int, int, int]): 
-                Direction coordinnates to rotate. 
-                Cube coordinnates define on the hexaboard
+    @property
+    def effective_initiative(self) -> Optional[List[int]]:
+        """
+        Initiatives of the tile with the module effects applied on it.
+        Negative initiatives are dropped.
 
         Returns:
-            Tuple: direction rotated
+            Optional[List[int]]: Initiatives. None if the tile has no
+                initiative.
+        """
+        if not self.initiative:
+            return None if self.initiative is None else []
+
+        bonus = (self.module_effects.count("initiative_augment")
+                - self.module_effects.count("saboteur"))
+        initiatives = [initiative + bonus for initiative in self.initiative]
+        for _ in range(self.module_effects.count("double_initiative")):
+            initiatives.append(min(initiatives) - 1)
+        return [initiative for initiative in initiatives if initiative >= 0]
+
+    @property
+    def effective_cac_attacks_power(self) -> Optional[List[int]]:
         """
-        q, r, s = direction
-        return (-r, -s, -q)
+        Close-combat attack powers with the module effects applied on
+        the tile.
 
-    def _direction_negative_rotation(
-        self, direction: Tuple[int, int, int]
-    ) -> Tuple[int, int, int]:
-        """Return the rotated direction with a angle of -60°
+        Returns:
+            Optional[List[int]]: Attack powers, aligned with
+                `cac_attacks_direction`. None if no cac attack.
+        """
+        if self.cac_attacks_power is None:
+            return None
+        bonus = self.module_effects.count("cac_augment")
+        return [power + bonus for power in self.cac_attacks_power]
 
-        Args:
-            direction (Tuple[int, int, int]):
-                Direction to rotate. 
-                Cube coordinnates define on the hexaboard
+    @property
+    def effective_range_attacks_power(self) -> Optional[List[int]]:
+        """
+        Ranged attack powers with the module effects applied on the
+        tile.
 
         Returns:
-            Tuple: direction rotated
+            Optional[List[int]]: Attack powers, aligned with
+                `range_attacks_direction`. None if no ranged attack.
         """
-        q, r, s = direction
-        return (-s, -q, -r)
+        if self.range_attacks_power is None:
+            return None
+        bonus = self.module_effects.count("range_augment")
+        return [power + bonus for power in self.range_attacks_power]
 
-    def _directions_rotation(self,
-                            directions: List[Tuple[int, int, int]],
-                            rotation_diff: int
-                            ) -> List[Tuple[int, int, int]]:
+    def copy(self) -> "Tile":
         """
-        Rotate a list of direction by a speficied number of step 
-        (+60° or -60°)
-
-        Args:
-            directions (List[Tuple[int, int, int]]): 
-                A list of cube coordinates representing
-                the directions to be rotated.
-            rotation_diff (int): 
-                The number of rotation steps. 
-                A positive value indicates clockwise rotation,
-                while a negative value indicates
-                counterclockwise rotation.
+        Returns a copy of the tile state, sharing the same template.
 
         Returns:
-            List[Tuple[int, int, int]]:
-                A new list of directions after applying the rotation.
-        """
-        return [
-            (
-                self._direction_positive_rotation(direction)
-                if rotation_diff > 0
-                else self._direction_negative_rotation(direction)
-            )
-            for _ in range(abs(rotation_diff))
-            for direction in directions
-        ]
+            Tile: The copy
+        """
+        return Tile(self.id_tile,
+                    self.template,
+                    self.board_position,
+                    self.rotational_index,
+                    self.life_point,
+                    self.is_netted,
+                    list(self.module_effects),
+                    self.army_name
+                )
 
-    def _rotate_shield(self, rotation_diff: int) -> None:
+    def snapshot(self) -> Tuple:
         """
-        Rotate shields directions of a tile by a speficied number of
-        step.
+        Returns the state of the tile, the template included (tiles
+        converted by a quartiermaitre change of template).
 
-        Args:
-            rotation_diff (int): 
-                The number of rotation steps. 
-                A positive value indicates clockwise rotation,
-                while a negative value indicates
-                counterclockwise rotation.
+        Returns:
+            Tuple: State of the tile, for `restore`
         """
-        if self.shields_directions:
-            self.shields_directions = self._directions_rotation(
-                self.shields_directions,
-                rotation_diff
-            )
+        return _get_tile_state(self)
 
-    def _rotate_attacks(self, rotation_diff: int) -> None:
+    def restore(self, state: Tuple) -> None:
         """
-        Rotate attack directions of a tile by a speficied number of
-        step.
+        Restores a state returned by `snapshot`. The change is neither
+        journaled nor hashed: the board restores its own hash.
 
         Args:
-            rotation_diff (int): 
-                The number of rotation steps. 
-                A positive value indicates clockwise rotation,
-                while a negative value indicates
-                counterclockwise rotation.
+            state (Tuple): State of the tile
         """
-        if self.range_attacks_direction:
-            self.range_attacks_direction = self._directions_rotation(
-                self.range_attacks_direction,
-                rotation_diff
-            )
-        if self.cac_attacks_direction:
-            self.cac_attacks_direction = self._directions_rotation(
-                self.cac_attacks_direction,
-                rotation_diff
-            )
+        # In the order of TILE_STATE_ATTRIBUTES
+        (self.template, self.board_position, self.rotational_index,
+        self.life_point, self.is_netted, self.module_effects) = state
 
-    def _rotate_net(self, rotation_diff: int) -> None:
+    def reset(self) -> None:
+        """
+        Restores the state of a tile never placed on the board. The
+        change is neither journaled nor hashed.
+        """
+        self.restore((self.template,
+                    (-1, -1, -1),
+                    0,
+                    self.template.life_point,
+                    False,
+                    []))
+        self.board = None
+
+    def to_dict(self) -> Dict:
         """
-        Rotate net directions of a tile by a speficied number of step.
+        Returns the attributes of the tile in a dict, the template data
+        included.
 
-        Args:
-            rotation_diff (int): 
-                The number of rotation steps. 
-                A positive value indicates clockwise rotation,
-                while a negative value indicates
-                counterclockwise rotation.
+        Returns:
+            Dict: Attributes of the tile, keys are the attribute names
         """
-        if self.net_directions:
-            self.net_directions = self._directions_rotation(
-                self.net_directions,
-                rotation_diff
+        return {
+            "army_name": self.army_name,
+            "id_tile": self.id_tile,
+            "kind": self.kind,
+            "initiative": self.initiative,
+            "range_attacks_direction": self.range_attacks_direction,
+            "range_attacks_power": self.range_attacks_power,
+            "cac_attacks_direction": self.cac_attacks_direction,
+            "cac_attacks_power": self.cac_attacks_power,
+            "net_directions": self.net_directions,
+            "life_point": self.life_point,
+            "shields_directions": self.shields_directions,
+            "special_capacities": self.special_capacities,
+            "module": self.module,
+            "action": self.action,
+            "board_position": self.board_position,
+            "url_image": self.url_image,
+            "is_netted": self.is_netted,
+            "module_effects": list(self.module_effects),
+            "rotational_index": self.rotational_index,
+        }
+
+
+# Version of the army catalog cache files. To increment when the
+# templates change, so that old caches are rebuilt.
+CATALOG_VERSION = 3
+ARMY_TILE_KEYS = ("army_name", "id_tile", "kind", "initiative",
+                "range_attacks_direction", "range_attacks_power",
+                "cac_attacks_direction", "cac_attacks_power",
+                "net_directions", "life_point", "shields_directions",
+                "special_capacities", "module", "action", "url_image")
+TILE_KINDS = ("base", "unite", "module", "action")
+
+
+@lru_cache(maxsize=None)
+def get_army_templates(army_name: str) -> Mapping[str, TileTemplate]:
+    """
+    Returns the catalog of an army: the templates of its tiles. The
+    catalog is built once per process, and saved in a binary cache next
+    to the army module (`scripts/armies/__pycache__/<army>.catalog`).
+    The cache is rebuilt when the army module changes, so the army
+    module is only imported and converted after a change.
+    Identical tiles share the same template.
+
+    Args:
+        army_name (str): Name of the army
+
+    Returns:
+        Mapping[str, TileTemplate]:
+            Read-only mapping of the tile IDs to their template, in the
+            order of the army module.
+
+    Raises:
+        ValueError: If the army module or attribute is not found.
+        ValueError: If the army tiles are not valid.
+    """
+    try:
+        spec = importlib.util.find_spec(f"scripts.armies.{army_name}")
+    except ModuleNotFoundError:
+        spec = None
+    if spec is None or spec.origin is None:
+        raise ValueError(
+            f"Army module '{army_name}' not found."
+        )
+
+    with open(spec.origin, "rb") as source:
+        source_hash = hashlib.sha256(source.read()).hexdigest()
+    cache_path = os.path.join(os.path.dirname(spec.origin),
+                            "__pycache__", f"{army_name}.catalog")
+
+    templates = _read_catalog_cache(cache_path, source_hash)
+    if templates is None:
+        try:
+            module = importlib.import_module(f"scripts.armies.{army_name}")
+            army = getattr(module, army_name)
+        except AttributeError:
+            raise ValueError(
+                f"Army '{army_name}' not defined in the module."
             )
+        templates = _compile_army(army_name, army)
+        _write_catalog_cache(cache_path, source_hash, templates)
+    return MappingProxyType(templates)
 
-    def _rotate_module(self, rotation_diff: int) -> None:
-        """
-        Rotate module directions of a tile by a speficied number of
-        step.
 
-        Args:
-            rotation_diff (int): 
-                The number of rotation steps. 
-                A positive value indicates clockwise rotation,
-                while a negative value indicates
-                counterclockwise rotation.
-        """
-        if self.module:
-            for index, effect in enumerate(self.module):
-                effect_name = list(effect.keys())[0]
-                self.module[index][effect_name] = \
-                    self._directions_rotation(
-                    list(effect.values())[0],
-                    rotation_diff
-                )
+def get_army_keys(armies: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Returns the keys of the armies of a game: the army name, numbered
+    from 2 when the army is played more than once ("borgo", "borgo2").
+    The state of the players is keyed by their army key, and the tile
+    IDs of a numbered army start with the key ("borgo2-qg"), so that
+    both players can play the same army.
+
+    Args:
+        armies (Sequence[str]): Army names of the players
+
+    Returns:
+        Tuple[str, ...]: Army keys, in the order of the armies
+    """
+    keys: List[str] = []
+    for army in armies:
+        count = armies[:len(keys) + 1].count(army)
+        keys.append(army if count == 1 else f"{army}{count}")
+    return tuple(keys)
+
+
+def _compile_army(army_name: str, army: List[dict]
+                ) -> Dict[str, TileTemplate]:
+    """
+    Validates the tiles of an army module and builds their templates.
+    Attacks of a tile that can not be fired (a single direction instead
+    of a list of directions, directions without powers) are left out.
+
+    Args:
+        army_name (str): Name of the army
+        army (List[dict]): Tiles of the army module
+
+    Returns:
+        Dict[str, TileTemplate]: Templates of the tiles, by tile ID
+
+    Raises:
+        ValueError: If the army tiles are not valid.
+    """
+    if not army or army[0].get("kind") != "base":
+        raise ValueError(f"Army '{army_name}': base tile not in first "
+                        "position.")
+
+    templates: Dict[str, TileTemplate] = {}
+    shared_templates: Dict[str, TileTemplate] = {}
+    for dict_tile in army:
+        missing_keys = [key for key in ARMY_TILE_KEYS if key not in dict_tile]
+        if missing_keys:
+            raise ValueError(f"Army '{army_name}': tile "
+                            f"{dict_tile.get('id_tile')} misses "
+                            f"{missing_keys}.")
+        id_tile = dict_tile["id_tile"]
+        if dict_tile["army_name"] != army_name:
+            raise ValueError(f"Army '{army_name}': tile {id_tile} belongs "
+                            f"to {dict_tile['army_name']}.")
+        if dict_tile["kind"] not in TILE_KINDS:
+            raise ValueError(f"Army '{army_name}': tile {id_tile} has an "
+                            f"unknown kind {dict_tile['kind']}.")
+        if id_tile in templates:
+            raise ValueError(f"Army '{army_name}': tile {id_tile} is "
+                            "defined twice.")
+        for attack in ("range_attacks", "cac_attacks"):
+            directions = dict_tile[f"{attack}_direction"] or []
+            powers = dict_tile[f"{attack}_power"] or []
+            # Attacks that the game can not fire, a single direction
+            # instead of a list or directions without any power, are
+            # left out.
+            if (directions and not powers) or not all(
+                    isinstance(x, (tuple, list)) for x in directions):
+                dict_tile = {**dict_tile,
+                            f"{attack}_direction": None,
+                            f"{attack}_power": None}
+                continue
+            if len(directions) != len(powers):
+                raise ValueError(f"Army '{army_name}': tile {id_tile} "
+                                f"has {len(directions)} {attack} "
+                                f"directions for {len(powers)} powers.")
+
+        # Tiles only differing by their ID share their template
+        key = repr({key: value for key, value in dict_tile.items()
+                    if key != "id_tile"})
+        if key not in shared_templates:
+            shared_templates[key] = replace(
+                TileTemplate.from_dict(dict_tile),
+                catalog_index=len(shared_templates))
+        templates[id_tile] = shared_templates[key]
+    return templates
+
+
+def _read_catalog_cache(cache_path: str, source_hash: str
+                        ) -> Optional[Dict[str, TileTemplate]]:
+    """
+    Reads an army catalog from its cache file.
+
+    Args:
+        cache_path (str): Path of the cache file
+        source_hash (str): SHA-256 of the army module source
+
+    Returns:
+        Optional[Dict[str, TileTemplate]]:
+            Templates of the tiles, by tile ID. None if there is no
+            valid cache for this version of the army module.
+    """
+    try:
+        with open(cache_path, "rb") as cache:
+            version, cache_hash, templates = pickle.load(cache)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, TypeError, ValueError):
+        return None
+    if version != CATALOG_VERSION or cache_hash != source_hash:
+        return None
+    return dict(templates)
+
+
+def _write_catalog_cache(cache_path: str,
+                        source_hash: str,
+                        templates: Dict[str, TileTemplate]
+                        ) -> None:
+    """
+    Writes an army catalog in its cache file. The file is replaced
+    atomically, so concurrent processes never read a partial cache.
+    Nothing is written if the directory is read-only.
+
+    Args:
+        cache_path (str): Path of the cache file
+        source_hash (str): SHA-256 of the army module source
+        templates (Dict[str, TileTemplate]): Templates to save
+    """
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temporary_path, "wb") as cache:
+            pickle.dump((CATALOG_VERSION, source_hash,
+                        tuple(templates.items())),
+                        cache,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+@lru_cache(maxsize=None)
+def get_template_zobrist_keys(army_name: str,
+                            catalog: str,
+                            board_limit: int
+                        ) -> Tuple[int, ...]:
+    """
+    Returns the fixed Zobrist keys of the templates of an army on a
+    board: one key per template, hex and rotation, at index
+    `(6 * catalog_index + rotational_index) * hexes + hex_index`.
+    Identical tiles share their template, so they share their keys.
+    The table is built once per process.
+
+    Args:
+        army_name (str): Army key of the player (see `get_army_keys`)
+        catalog (str): Army of the templates
+        board_limit (int): Size of the board
+
+    Returns:
+        Tuple[int, ...]: The keys
+    """
+    templates = set(get_army_templates(catalog).values())
+    return get_zobrist_table(f"{army_name}/{catalog}/{board_limit}",
+                            6 * len(templates)
+                            * len(get_board_hexes(board_limit)))
+
+
+def _tiles_zobrist_hash(place: str, tiles: Sequence[Tile]) -> int:
+    """
+    Returns the Zobrist hash of tiles in a deck or a hand, whatever
+    their order.
+
+    Args:
+        place (str): "deck" or "hand"
+        tiles (Sequence[Tile]): The tiles
+
+    Returns:
+        int: The hash
+    """
+    zobrist_hash = 0
+    for tile in tiles:
+        zobrist_hash ^= get_zobrist_key(place, tile.id_tile)
+    return zobrist_hash
 
 
 class Deck:
@@ -310,8 +1147,18 @@ class Deck:
     Attributes
     ----------
         army_name (str): The name of the army associated with this deck.
+            Army key of the player when both players play the same
+            army (see `get_army_keys`).
+        catalog (str): Army of the tiles of the deck.
         tiles (List[Tile]): The list of tiles in the deck.
         defausse (List[Tile]): The discard pile for removed tiles
+        rng (random.Random): Random generator shuffling the deck.
+        journal (Optional[ChangeJournal]):
+            Journal recording the changes of the deck. None if not
+            recorded.
+        zobrist_hash (int):
+            Zobrist hash of the tiles in the deck, whatever their
+            order, kept up to date incrementally.
 
     Methods
     ----------
@@ -319,17 +1166,20 @@ class Deck:
         remove_top_deck_tile(self) -> Optional[Tile]:
             Removes and returns the top tile from the deck.
 
-    Private Methods
-    ----------
-    _get_army(self) -> List[dict]:
-        Dynamically imports the army data module and return a list of
-        dict representing the army's tiles.
+        remove_tile(self, tile: Tile) -> None:
+            Removes a given tile from the deck.
+
+        discard_tiles(self, tiles: List[Tile]) -> None:
+            Adds tiles to the discard pile.
 
+        snapshot(self) -> Tuple:
+            Returns the state of the deck.
 
-    _dict_to_tile(self, dict_tile: dict) -> Tile:
-        Converts a dictionary representation of a tile into a Tile
-        object.
+        restore(self, state: Tuple) -> None:
+            Restores a state returned by `snapshot`.
 
+    Private Methods
+    ----------
     _init_deck(self) -> None:
         Initializes the deck tiles list.
 
@@ -338,16 +1188,39 @@ class Deck:
 
     _init_hq_tile(self) -> None:
         Save hq tile player in a Deck attribut.
+
+    _toggle_tile_hash(self, tile: Tile) -> None:
+        Adds or removes a tile from the hash of the deck.
     """
 
-    def __init__(self, army_name: str):
+    def __init__(self,
+                army_name: str,
+                rng: Optional[random.Random] = None,
+                catalog: Optional[str] = None
+            ) -> None:
+        """
+        Initializes and shuffles the deck of an army.
+
+        Args:
+            army_name (str): Army key of the deck (see `get_army_keys`)
+            rng (Optional[random.Random], optional):
+                Random generator shuffling the deck. The same seed
+                gives the same deck. Defaults to None, a generator
+                seeded by the system.
+            catalog (Optional[str], optional):
+                Army of the tiles. Defaults to the army name.
+        """
         self.tiles: List[Tile] = []  # Main deck
         self.army_name = army_name
+        self.catalog = catalog if catalog is not None else army_name
         self.defausse: List[Tile] = []  # Discard pile
+        self.rng = rng if rng is not None else random.Random()
         self.hq_tile: Tile
+        self.journal: Optional[ChangeJournal] = None
         self._init_deck()
         self._init_hq_tile()
         self._shuffle_deck()
+        self.zobrist_hash = _tiles_zobrist_hash("deck", self.tiles)
 
     def remove_top_deck_tile(self) -> Optional[Tile]:
         """Removes and returns the top tile from the deck.
@@ -356,88 +1229,117 @@ class Deck:
             Optional[Tile]:
                 The removed tile, or None if the deck is empty.
         """
-        return self.tiles.pop(0) if self.tiles else None
+        if not self.tiles:
+            return None
+        tile = self.tiles.pop(0)
+        if self.journal is not None:
+            self.journal.record(list.insert, self.tiles, 0, tile)
+        self._toggle_tile_hash(tile)
+        return tile
 
-    # --- MÉTHODES PRIVÉES ---
+    def remove_tile(self, tile: Tile) -> None:
+        """Removes a given tile from the deck, wherever it is.
 
-    def _init_hq_tile(self) -> None:
-        """Save hq tile player in a Deck attribut
+        Args:
+            tile (Tile): Tile to remove
+
+        Raises:
+            ValueError: If the tile is not in the deck
         """
-        tile = self.tiles[0]
-        if tile.kind == "base":
-            self.hq_tile = tile
-            self.tiles.remove(tile)
-        else:
-            raise ValueError("Base tile not in first position")
+        if tile not in self.tiles:
+            raise ValueError(f"Tile {tile.id_tile} not found in deck.")
+        index = self.tiles.index(tile)
+        del self.tiles[index]
+        if self.journal is not None:
+            self.journal.record(list.insert, self.tiles, index, tile)
+        self._toggle_tile_hash(tile)
+
+    def discard_tiles(self, tiles: List[Tile]) -> None:
+        """Adds tiles to the discard pile.
 
-    def _get_army(self) -> List[dict]:
+        Args:
+            tiles (List[Tile]): Tiles to discard
+        """
+        nb_discarded_tiles = len(self.defausse)
+        self.defausse.extend(tiles)
+        if self.journal is not None:
+            self.journal.record(list.__delitem__,
+                                self.defausse,
+                                slice(nb_discarded_tiles, None))
+
+    def snapshot(self) -> Tuple:
         """
-        Dynamically imports the army data module and return a list of
-        dict representing the army's tiles.
+        Returns the state of the deck: the order of its tiles, the
+        discard pile, the HQ state and the hash. Tiles of the deck are
+        never placed, their state is not saved.
 
         Returns:
-            List[dict]: List of dictionaries representing the army's
-            tiles.
-
-        Raises:
-            ValueError: If the army module or attribute is not found.
+            Tuple: State of the deck, for `restore`
         """
-        try:
-            module = importlib.import_module(f"scripts.armies.{self.army_name}")
-            army = getattr(module, self.army_name)
-        except ModuleNotFoundError:
-            raise ValueError(
-                f"Army module '{self.army_name}' not found."
+        return (tuple(self.tiles),
+                tuple(self.defausse),
+                self.hq_tile.snapshot(),
+                self.zobrist_hash
             )
-        except AttributeError:
-            raise ValueError(
-                f"Army '{self.army_name}' not defined in the module."
-            )
-        return army
 
-    def _dict_to_tile(self, dict_tile: dict) -> Tile:
+    def restore(self, state: Tuple) -> None:
         """
-        Converts a dictionary representation of a tile into a Tile
-        object.
+        Restores a state returned by `snapshot`. Tiles placed since the
+        snapshot are reset.
+
         Args:
-            dict_tile (dict): 
-                dict containing information for Tile initialisation
-        Raises:.
-            TypeError: If the provided dict_tile is not a dictionary.
+            state (Tuple): State of the deck
         """
+        tiles, defausse, hq_state, self.zobrist_hash = state
+        self.tiles = list(tiles)
+        self.defausse = list(defausse)
+        self.hq_tile.restore(hq_state)
+        for tile in tiles:
+            if tile.board_position != (-1, -1, -1):
+                tile.reset()
 
-        # Ensure the input is a dictionary
-        if not isinstance(dict_tile, dict):
-            raise TypeError("Expected a dictionary for dict_tile, got "
-                            f"{type(dict_tile).__name__}.")
+    # --- MÉTHODES PRIVÉES ---
 
-        return Tile(
-            kind=dict_tile['kind'],
-            army_name=dict_tile['army_name'],
-            id_tile=dict_tile['id_tile'],
-            initiative=dict_tile['initiative'],
-            range_attacks_direction=dict_tile['range_attacks_direction'],
-            range_attacks_power=dict_tile['range_attacks_power'],
-            cac_attacks_direction=dict_tile['cac_attacks_direction'],
-            cac_attacks_power=dict_tile['cac_attacks_power'],
-            net_directions=dict_tile['net_directions'],
-            life_point=dict_tile['life_point'],
-            shields_directions=dict_tile['shields_directions'],
-            special_capacities=dict_tile['special_capacities'],
-            module=dict_tile['module'],
-            action=dict_tile['action'],
-            url_image=dict_tile['url_image'],
-            board_position=(-1, -1, -1)  # Default invalid position
-        )
+    def _init_hq_tile(self) -> None:
+        """Save hq tile player in a Deck attribut
+        """
+        tile = self.tiles[0]
+        if tile.kind == "base":
+            self.hq_tile = tile
+            self.tiles.remove(tile)
+        else:
+            raise ValueError("Base tile not in first position")
 
     def _init_deck(self) -> None:
-        """Initializes the deck tiles list."""
-        army = self._get_army()
-        self.tiles = [self._dict_to_tile(tile_dict) for tile_dict in army]
+        """
+        Initializes the deck tiles list from the army templates. The
+        tile IDs start with the army name of the deck.
+        """
+        templates = get_army_templates(self.catalog)
+        if self.army_name == self.catalog:
+            self.tiles = [Tile(id_tile, template)
+                        for id_tile, template in templates.items()]
+            return
+        prefix = len(self.catalog)
+        self.tiles = [Tile(self.army_name + id_tile[prefix:],
+                        template,
+                        army_name=self.army_name)
+                    for id_tile, template in templates.items()]
 
     def _shuffle_deck(self) -> None:
         """Shuffles the tiles list deck."""
-        random.shuffle(self.tiles)
+        self.rng.shuffle(self.tiles)
+
+    def _toggle_tile_hash(self, tile: Tile) -> None:
+        """
+        Adds or removes a tile from the hash of the deck.
+
+        Args:
+            tile (Tile): Tile entering or leaving the deck
+        """
+        if self.journal is not None:
+            self.journal.record_attribute(self, "zobrist_hash")
+        self.zobrist_hash ^= get_zobrist_key("deck", tile.id_tile)
 
 class Hand:
     """
@@ -448,6 +1350,12 @@ class Hand:
     ----------
         hand_tiles (List[Tile] = []):
             The tiles currently in the player's hand.
+        journal (Optional[ChangeJournal]):
+            Journal recording the changes of the hand. None if not
+            recorded.
+        zobrist_hash (int):
+            Zobrist hash of the tiles in hand, whatever their order,
+            kept up to date incrementally.
 
     Methods
     ----------
@@ -459,10 +1367,23 @@ class Hand:
 
         get_tile_by_id(self, id_tile : str) -> Tile:
             Return a tile from the hand according to the id tile
+
+        snapshot(self) -> Tuple[Tuple[Tile, ...], int]:
+            Returns the tiles in hand and their hash.
+
+        restore(self, state: Tuple[Tuple[Tile, ...], int]) -> None:
+            Restores a state returned by `snapshot`.
+
+    Private Methods
+    ----------
+        _toggle_tile_hash(self, tile: Tile) -> None:
+            Adds or removes a tile from the hash of the hand.
     """
 
     def __init__(self):
         self.hand_tiles: List[Tile] = []
+        self.journal: Optional[ChangeJournal] = None
+        self.zobrist_hash = 0
 
     def add_tile(self, tile: Tile) -> None:
         """
@@ -476,6 +1397,9 @@ class Hand:
         if len(self.hand_tiles) > 3:
             raise ValueError("Cannot add more than 3 tiles to the hand.")
         self.hand_tiles.append(tile)
+        if self.journal is not None:
+            self.journal.record(list.pop, self.hand_tiles)
+        self._toggle_tile_hash(tile)
 
     def discard_tile(self, tiles: List[Tile]) -> None:
         """
@@ -489,12 +1413,18 @@ class Hand:
         """
         for tile in tiles:
             if tile in self.hand_tiles:
-                self.hand_tiles.remove(tile)
+                index = self.hand_tiles.index(tile)
+                del self.hand_tiles[index]
+                if self.journal is not None:
+                    self.journal.record(list.insert,
+                                        self.hand_tiles,
+                                        index,
+                                        tile)
+                self._toggle_tile_hash(tile)
             else:
                 raise ValueError(f"Tile {tile.id_tile} not found in hand.")
 
     def get_tile_by_id(self, id_tile: str) -> Tile:
-        # Non used, maybe delete this methos
         """
         Return a tile from the hand according to the id tile
 
@@ -510,8 +1440,46 @@ class Hand:
         for tile in self.hand_tiles:
             if tile.id_tile == id_tile:
                 return tile
-        else:
-            raise ValueError(f"Tile {tile.id_tile} not found in hand.")
+        raise ValueError(f"Tile {id_tile} not found in hand.")
+
+    def snapshot(self) -> Tuple[Tuple[Tile, ...], int]:
+        """
+        Returns the tiles in hand and their hash. They are not placed
+        yet, their state is not saved.
+
+        Returns:
+            Tuple[Tuple[Tile, ...], int]: State of the hand, for
+                `restore`
+        """
+        return (tuple(self.hand_tiles), self.zobrist_hash)
+
+    def restore(self, state: Tuple[Tuple[Tile, ...], int]) -> None:
+        """
+        Restores a state returned by `snapshot`. Tiles placed since the
+        snapshot are reset.
+
+        Args:
+            state (Tuple[Tuple[Tile, ...], int]): Tiles in hand and
+                their hash
+        """
+        tiles, self.zobrist_hash = state
+        self.hand_tiles = list(tiles)
+        for tile in tiles:
+            if tile.board_position != (-1, -1, -1):
+                tile.reset()
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _toggle_tile_hash(self, tile: Tile) -> None:
+        """
+        Adds or removes a tile from the hash of the hand.
+
+        Args:
+            tile (Tile): Tile entering or leaving the hand
+        """
+        if self.journal is not None:
+            self.journal.record_attribute(self, "zobrist_hash")
+        self.zobrist_hash ^= get_zobrist_key("hand", tile.id_tile)
 
 
 class Player:
@@ -528,13 +1496,24 @@ class Player:
         discard_tiles_hand(self, id_tiles_to_keep: List = []):
             Discard tiles from Hand player but keep in hand some tiles
             if the player wants.
+        snapshot(self) -> Tuple:
+            Returns the state of the deck and of the hand.
+        restore(self, state: Tuple) -> None:
+            Restores a state returned by `snapshot`.
+        attach_journal(self, journal: Optional[ChangeJournal]) -> None:
+            Records the changes of the deck and of the hand.
 
     """
 
-    def __init__(self, name: str, army_name: str):
+    def __init__(self,
+                name: str,
+                army_name: str,
+                rng: Optional[random.Random] = None,
+                catalog: Optional[str] = None
+            ) -> None:
         self.name = name
         self.hand = Hand()
-        self.deck = Deck(army_name)
+        self.deck = Deck(army_name, rng, catalog)
 
     def get_tiles(self, number_tiles_wanted: Literal[1, 2, 3]) -> None:
         """
@@ -578,7 +1557,39 @@ class Player:
         ]
 
         self.hand.discard_tile(tiles_to_discard)
-        self.deck.defausse.extend(tiles_to_discard)
+        self.deck.discard_tiles(tiles_to_discard)
+
+    def snapshot(self) -> Tuple:
+        """
+        Returns the state of the deck and of the hand of the player.
+
+        Returns:
+            Tuple: State of the player, for `restore`
+        """
+        return (self.deck.snapshot(), self.hand.snapshot())
+
+    def restore(self, state: Tuple) -> None:
+        """
+        Restores a state returned by `snapshot`.
+
+        Args:
+            state (Tuple): State of the player
+        """
+        deck_state, hand_state = state
+        self.deck.restore(deck_state)
+        self.hand.restore(hand_state)
+
+    def attach_journal(self, journal: Optional[ChangeJournal]) -> None:
+        """
+        Records the changes of the deck and of the hand of the player
+        in a journal. The tiles are attached by the board.
+
+        Args:
+            journal (Optional[ChangeJournal]):
+                The journal. None to stop recording.
+        """
+        self.deck.journal = journal
+        self.hand.journal = journal
 
 
 class HexBoard():
@@ -606,10 +1617,35 @@ class HexBoard():
         occupied (Dict[str,List[Tuple[int, int, int]]]):
             Tracks occupied positions for each army. Keys are army
             names, and values are lists of occupied positions.
-        position_index (Dict[str,Dict[Tuple[int, int, int],Tile]]):
-            Maps positions to tiles for each army. Keys are army names,
-            and values are dictionaries with positions as keys and
-            `Tile` objects as values.
+        hex_tiles (List[Optional[Tile]]):
+            Tile on each position of the board, any army, at the index
+            of the position in `hexes`. None for a free position.
+        module_auras (Dict[str,Dict[Tuple[int, int, int],\
+                List[Tuple[str, str]]]]):
+            Module effects reaching each position, for the tiles of
+            each army. Keys are army names, then positions, values are
+            lists of (effect type, module ID). Updated incrementally
+            when a module is added, moved, rotated or removed. The
+            effects of the tiles are the ones the upstream
+            `ModuleEvaluator` applied before each battle round.
+        tile_registry (Dict[str, Tile]):
+            Maps the ID of each tile of the game to the tile.
+        board_positions (Dict[str, Tuple[int, int, int]]):
+            Maps the ID of each tile on the board to its position.
+        initiative_index (Dict[int, List[Tile]]):
+            Tiles on the board acting at each initiative, with the
+            module effects applied. Only non-empty initiatives are
+            keys.
+        journal (Optional[ChangeJournal]):
+            Journal recording the changes of the board. None if not
+            recorded.
+        zobrist_hash (int):
+            64-bit Zobrist hash of the board: tile templates (and so
+            owners), positions, rotations, life points and nets. Updated
+            incrementally, it keys the `TranspositionTable`.
+        occupied_mask (int):
+            Positions occupied by any army, bit i set if the position
+            of index i in `hexes` is occupied.
 
     Methods
     ----------
@@ -620,6 +1656,30 @@ class HexBoard():
         remove_tile_from_board(self, id_tile: str) -> None:
             Removes a tile from the board by its ID. If the tile is not
             found, raises an exception.
+        move_tile_on_board(self, tile: Tile,\
+                            position: Tuple[int, int, int]) -> None:
+            Moves a tile already on the board to a new position.
+            If the position is invalid or occupied raises an exception.
+        rotate_tile_on_board(self, tile: Tile,\
+                            new_rotation_index: Literal[0, 1, 2, 3, 4, 5]\
+                            ) -> None:
+            Rotates a tile, updating the module effects if the tile is
+            a module on the board.
+        refresh_module_effects(self) -> None:
+            Recomputes all module effects on the board.
+        set_module_effects(self, tile: Tile, module_effects: List[str]\
+                        ) -> None:
+            Sets the module effects of a tile on the board.
+        get_initiative_tiles(self, initiative: int) -> List[Tile]:
+            Returns the tiles acting at an initiative.
+        next_initiative(self, below: Optional[int] = None\
+                        ) -> Optional[int]:
+            Returns the highest initiative at which a tile acts, below
+            a given initiative.
+        get_tile(self, id_tile: str) -> Tile:
+            Returns a tile of the game by its ID.
+        is_tile_on_board(self, id_tile: str) -> bool:
+            Checks if a tile is on the board.
         find_army_tile_at_position(self,\
                                     army_name: str,
                                     position: Tuple[int, int, int]
@@ -630,6 +1690,27 @@ class HexBoard():
                                     ) -> Optional[Tile]:
             Finds and returns a tile from any army at the specified
             position. Returns `None` if no tile is found.
+        get_controlling_army(self, tile: Tile) -> str:
+            Returns the army a tile fights for in a battle.
+        find_battle_tile_at_position(self, army_name: str,\
+                                    position: Tuple[int, int, int]\
+                                    ) -> Optional[Tile]:
+            Finds the tile fighting for an army at a position.
+        snapshot(self) -> Tuple:
+            Returns the state of the board and of its tiles.
+        restore(self, state: Tuple) -> None:
+            Restores a state returned by `snapshot`.
+        attach_journal(self, journal: Optional[ChangeJournal]) -> None:
+            Records the changes of the board and of all tiles.
+        compute_zobrist_hash(self) -> int:
+            Computes the hash of the board from scratch.
+        get_free_positions(self) -> Tuple[Tuple[int, int, int], ...]:
+            Returns the positions without any tile.
+        is_free(self, position: Tuple[int, int, int]) -> bool:
+            Checks if a position of the board has no tile.
+        legal_placements(self, tile: Tile) -> Iterator[Tuple[\
+                Tuple[int, int, int], int]]:
+            Yields every legal (position, rotation) of a tile.
 
     Private Methods
     ----------
@@ -637,7 +1718,43 @@ class HexBoard():
             Initializes the board by generating all valid positions
             based on the `board_limit`.
         _init_all_tiles(players) -> None:
-            Initializes the list `all_tiles`
+            Initializes the list `all_tiles` and the `tile_registry`
+        _init_zobrist_keys(self) -> None:
+            Binds the fixed Zobrist keys of the board.
+        _register_module(self, tile: Tile) -> None:
+            Adds the effects of a module to `module_auras`.
+        _unregister_module(self, tile: Tile) -> None:
+            Removes the effects of a module from `module_auras`.
+        _sync_tiles_at(self, positions: Iterable[Tuple[int, int, int]]\
+                    ) -> None:
+            Updates the module effects of the tiles at some positions.
+        _sync_tile_effects(self, tile: Tile) -> None:
+            Updates the module effects of a tile from `module_auras`.
+        _is_priority_module(self, tile: Tile) -> bool:
+            Checks if the effects of a module are applied first.
+        _index_initiative(self, tile: Tile) -> None:
+            Updates the initiatives of a tile in `initiative_index`.
+        _unindex_initiative(self, tile: Tile) -> None:
+            Removes a tile from `initiative_index`.
+        _append(self, values: List, value: Any) -> None:
+            Appends a value to a list of the board.
+        _remove(self, values: List, value: Any) -> None:
+            Removes a value from a list of the board.
+        _set_item(self, mapping: Dict, key: Any, value: Any) -> None:
+            Sets an item of a dict of the board.
+        _pop_item(self, mapping: Dict, key: Any, default: Any = None\
+                ) -> Any:
+            Removes an item from a dict of the board.
+        _set_attribute(self, name: str, value: Any) -> None:
+            Sets an attribute of the board.
+        _tile_zobrist_key(self, tile: Tile) -> int:
+            Returns the part of the board hash of a tile.
+        _rehash_tile(self, tile: Tile) -> None:
+            Updates the board hash after a change of a tile.
+        _set_hex_tile(self, position: Tuple[int, int, int],\
+                    tile: Optional[Tile]) -> None:
+            Sets the tile of a position in `hex_tiles` and
+            `occupied_mask`.
     """
 
     def __init__(self,
@@ -655,15 +1772,32 @@ class HexBoard():
         self.cube_direction_vectors: List[Tuple] = CUBE_DIRECTION_VECTORS
         self.armies = armies
         self.all_tile: List[Tile] = []
+        self.tile_registry: Dict[str, Tile] = {}
+        self.board_positions: Dict[str, Tuple[int, int, int]] = {}
         self.tiles: Dict[str, List[Tile]]\
             = {army: [] for army in armies}
         self.hexes: List[Tuple[int, int, int]] = []
         self.occupied: Dict[str, List[Tuple[int, int, int]]]\
             = {army: [] for army in armies}
-        self.position_index: Dict[str, Dict[Tuple[int, int, int], Tile]]\
+        self.module_auras: Dict[str, Dict[Tuple[int, int, int],
+                                        List[Tuple[str, str]]]]\
             = {army: {} for army in self.armies}
+        self.initiative_index: Dict[int, List[Tile]] = {}
+        # Initiatives under which each tile is indexed
+        self._tile_initiatives: Dict[str, List[int]] = {}
+        # Entries (army, position, effect type) added by each module
+        self._module_aura_entries: Dict[str, List[Tuple[str,
+                                                    Tuple[int, int, int],
+                                                    str]]] = {}
+        self.journal: Optional[ChangeJournal] = None
+        self.zobrist_hash: int = 0
+        self.occupied_mask: int = 0
+        # Part of the hash of each tile on the board
+        self._tile_hashes: Dict[str, int] = {}
         self._create_board()
+        self.hex_tiles: List[Optional[Tile]] = [None] * len(self.hexes)
         self._init_all_tiles(players)
+        self._init_zobrist_keys()
 
     def add_tile_to_board(self, tile: Tile) -> None:
         """
@@ -688,17 +1822,28 @@ class HexBoard():
                 f"tile position not on the board: {tile.board_position}"
             )
 
-        if tile in self.tiles[tile.army_name]:
+        if tile.id_tile in self.board_positions:
             return
 
-        if tile.board_position in self.occupied[tile.army_name]:
+        if not self.is_free(tile.board_position):
             raise ValueError(
                 f"Position {tile.board_position} is already occupied."
             )
 
-        self.occupied[tile.army_name].append(tile.board_position)
-        self.tiles[tile.army_name].append(tile)
-        self.position_index[tile.army_name][tile.board_position] = tile
+        self._set_item(self.tile_registry, tile.id_tile, tile)
+        self._set_item(self.board_positions,
+                    tile.id_tile,
+                    tile.board_position)
+        self._append(self.occupied[tile.army_name], tile.board_position)
+        self._append(self.tiles[tile.army_name], tile)
+        self._set_hex_tile(tile.board_position, tile)
+        tile_hash = self._tile_zobrist_key(tile)
+        self._set_item(self._tile_hashes, tile.id_tile, tile_hash)
+        self._set_attribute("zobrist_hash", self.zobrist_hash ^ tile_hash)
+        tile.set_attribute("board", self)
+        self._sync_tile_effects(tile)
+        if tile.module:
+            self._register_module(tile)
 
     def remove_tile_from_board(self, id_tile: str) -> None:
         """
@@ -709,14 +1854,174 @@ class HexBoard():
         Raises:
             ValueError: If the tile with the given ID is not found.
         """
+        if id_tile not in self.board_positions:
+            raise ValueError(
+                f"No tile with ID '{id_tile}' found on the board.")
+
+        tile = self.tile_registry[id_tile]
+        position = self._pop_item(self.board_positions, id_tile)
+        self._remove(self.occupied[tile.army_name], position)
+        self._remove(self.tiles[tile.army_name], tile)
+        self._set_hex_tile(position, None)
+        tile.set_attribute("board", None)
+        self._set_attribute(
+            "zobrist_hash",
+            self.zobrist_hash ^ self._pop_item(self._tile_hashes,
+                                            tile.id_tile))
+        if tile.module:
+            self._unregister_module(tile)
+        self._unindex_initiative(tile)
+        tile.set_attribute("module_effects", [])
+
+    def move_tile_on_board(self,
+                        tile: Tile,
+                        position: Tuple[int, int, int]
+                        ) -> None:
+        """
+        Moves a tile already on the board to a new position.
+
+        Args:
+            tile (Tile): Tile to move
+            position (Tuple[int, int, int]): New position of the tile.
+                Cubique coordinates
+        Raises:
+            ValueError: If the tile is not on the board
+            ValueError: If wrong board position
+            ValueError: If the position is already occupied
+        """
+        if tile.id_tile not in self.board_positions:
+            raise ValueError(f"Tile {tile.id_tile} is not on the board.")
+
+        if position not in self.hexes:
+            raise ValueError(f"tile position not on the board: {position}")
+
+        old_position = tile.board_position
+        if position == old_position:
+            return
+
+        if not self.is_free(position):
+            raise ValueError(f"Position {position} is already occupied.")
+
+        if tile.module:
+            self._unregister_module(tile)
+        self._remove(self.occupied[tile.army_name], old_position)
+        self._append(self.occupied[tile.army_name], position)
+        self._set_hex_tile(old_position, None)
+        self._set_hex_tile(position, tile)
+        self._set_item(self.board_positions, tile.id_tile, position)
+        tile.set_attribute("board_position", position)
+        self._sync_tile_effects(tile)
+        if tile.module:
+            self._register_module(tile)
+
+    def rotate_tile_on_board(self,
+                            tile: Tile,
+                            new_rotation_index: Literal[0, 1, 2, 3, 4, 5]
+                            ) -> None:
+        """
+        Rotates a tile. The effects of a module on the board follow its
+        new directions.
+
+        Args:
+            tile (Tile): Tile to rotate
+            new_rotation_index (Literal[0, 1, 2, 3, 4, 5]):
+                New rotation index of the tile
+        Raises:
+            ValueError: If the rotation index is not between 0 and 5
+        """
+        is_module_on_board = (tile.module is not None
+                            and tile.id_tile in self.board_positions)
+        if is_module_on_board:
+            self._unregister_module(tile)
+        tile.rotate_tile(new_rotation_index)
+        if is_module_on_board:
+            self._register_module(tile)
+
+    def refresh_module_effects(self) -> None:
+        """
+        Recomputes all module effects on the board. Only needed if tiles
+        on the board were modified without the board methods.
+        """
+        self._set_attribute("module_auras",
+                            {army: {} for army in self.armies})
+        self._set_attribute("_module_aura_entries", {})
+        self._set_attribute("initiative_index", {})
+        self._set_attribute("_tile_initiatives", {})
         for army in self.armies:
-            for index, tile in enumerate(self.tiles[army]):
-                if tile.id_tile == id_tile:
-                    self.occupied[army].remove(tile.board_position)
-                    self.tiles[army].pop(index)
-                    del self.position_index[army][tile.board_position]
-                    return
-        raise ValueError(f"No tile with ID '{id_tile}' found on the board.")
+            for tile in self.tiles[army]:
+                self._sync_tile_effects(tile)
+        for army in self.armies:
+            for tile in self.tiles[army]:
+                if tile.module and tile.id_tile not in \
+                        self._module_aura_entries:
+                    self._register_module(tile)
+
+    def set_module_effects(self, tile: Tile, module_effects: List[str]
+                        ) -> None:
+        """
+        Sets the module effects of a tile on the board, updating its
+        initiatives in `initiative_index`.
+
+        Args:
+            tile (Tile): Tile on the board
+            module_effects (List[str]): New module effects
+        """
+        tile.set_attribute("module_effects", module_effects)
+        self._index_initiative(tile)
+
+    def get_initiative_tiles(self, initiative: int) -> List[Tile]:
+        """
+        Returns the tiles acting at an initiative.
+
+        Args:
+            initiative (int): The initiative
+
+        Returns:
+            List[Tile]: Tiles acting at this initiative
+        """
+        return list(self.initiative_index.get(initiative, []))
+
+    def next_initiative(self, below: Optional[int] = None
+                        ) -> Optional[int]:
+        """
+        Returns the highest initiative at which a tile acts, below a
+        given initiative.
+
+        Args:
+            below (Optional[int], optional):
+                Initiatives greater or equal are ignored. None for the
+                highest initiative of the board.
+
+        Returns:
+            Optional[int]: The initiative. None if no tile acts below.
+        """
+        return max((initiative
+                    for initiative in self.initiative_index
+                    if below is None or initiative < below),
+                default=None)
+
+    def get_tile(self, id_tile: str) -> Tile:
+        """
+        Returns a tile of the game by its ID.
+
+        Args:
+            id_tile (str): ID of the tile
+        Raises:
+            ValueError: If no tile of the game has this ID
+        """
+        tile = self.tile_registry.get(id_tile)
+        if tile is None:
+            raise ValueError(f"No tile found with ID '{id_tile}'.")
+        return tile
+
+    def is_tile_on_board(self, id_tile: str) -> bool:
+        """
+        Checks if a tile is on the board.
+
+        Args:
+            id_tile (str): ID of the tile
+        """
+        return id_tile in self.board_positions
 
     def find_army_tile_at_position(self,
                                 army_name: str,
@@ -733,8 +2038,10 @@ class HexBoard():
             ValueError : if position not good
         """
         raise_wrong_cube_coordinate(position)
-        tile = self.position_index[army_name].get(position)
-        return tile
+        tile = self.get_tile_at(position)
+        if tile is not None and tile.army_name == army_name:
+            return tile
+        return None
 
     def find_any_tile_at_position(self,  position: Tuple[int, int, int]
                                 ) -> Optional[Tile]:
@@ -748,40 +2055,224 @@ class HexBoard():
             ValueError : if position not good
         """
         raise_wrong_cube_coordinate(position)
-        for army_name in self.armies:
-            tile = self.position_index[army_name].get(position)
-            if tile:
-                return tile
+        return self.get_tile_at(position)
+
+    def get_tile_at(self, position: Optional[Tuple[int, int, int]]
+                    ) -> Optional[Tile]:
+        """
+        Returns the tile on a position, any army, in O(1) from
+        `hex_tiles`. Returns `None` if the position is free or not on
+        the board.
+
+        Args:
+            position (Optional[Tuple[int, int, int]]): Position of the
+                tile. Cubique coordinates
+
+        Returns:
+            Optional[Tile]: The tile
+        """
+        index = self._hex_index.get(position) # type: ignore
+        if index is None:
+            return None
+        return self.hex_tiles[index]
+
+    def get_controlling_army(self, tile: Tile) -> str:
+        """
+        Returns the army a tile fights for in a battle: its army, or the
+        next army for a module under a "scoper" effect.
+
+        Args:
+            tile (Tile): Tile on the board
+
+        Returns:
+            str: Name of the army
+        """
+        if tile.kind == "module" and "scoper" in tile.module_effects:
+            return next_element(self.armies, tile.army_name)
+        return tile.army_name
+
+    def find_battle_tile_at_position(self,
+                                    army_name: str,
+                                    position: Tuple[int, int, int]
+                                    ) -> Optional[Tile]:
+        """
+        Finds the tile fighting for an army at a position, see
+        `get_controlling_army`. Returns `None` if no tile is found.
+
+        Args:
+            army_name (str): Name of the army
+            position (Tuple[int, int, int]): Position of the tile.
+                Cubique coordinates
+
+        Returns:
+            Optional[Tile]: The tile
+        """
+        tile = self.get_tile_at(position)
+        if tile is not None and self.get_controlling_army(tile) == army_name:
+            return tile
         return None
 
-    def _create_board(self) -> None:
+    def snapshot(self) -> Tuple:
         """
-        Initializes the board by generating all valid positions
-        based on the `board_limit`.
+        Returns the state of the board: the tiles on the board with
+        their state, and the indexes. Values are copied, so the
+        snapshot is not modified by the next moves.
+
+        Returns:
+            Tuple: State of the board, for `restore`
+        """
+        tiles = tuple([tuple(self.tiles[army]) for army in self.armies])
+        return (
+            tiles,
+            tuple([tuple(map(_get_tile_state, army_tiles))
+                for army_tiles in tiles]),
+            self.zobrist_hash,
+            self._tile_hashes.copy(),
+            self.occupied_mask,
+            self.board_positions.copy(),
+            tuple([tuple(self.occupied[army]) for army in self.armies]),
+            tuple(self.hex_tiles),
+            tuple([{position: tuple(auras)
+                    for position, auras in self.module_auras[army].items()
+                    if auras}
+                for army in self.armies]),
+            {initiative: tuple(initiative_tiles) for initiative,
+                initiative_tiles in self.initiative_index.items()},
+            self._tile_initiatives.copy(),
+            self._module_aura_entries.copy()
+        )
+
+    def restore(self, state: Tuple) -> None:
+        """
+        Restores a state returned by `snapshot`. Tiles placed since the
+        snapshot were in a hand or a deck, the players restore them.
+
+        Args:
+            state (Tuple): State of the board
+        """
+        (tiles, tiles_states, self.zobrist_hash, tile_hashes,
+        self.occupied_mask, board_positions, occupied, hex_tiles,
+        module_auras, initiative_index, tile_initiatives,
+        module_aura_entries) = state
+        # Tiles are linked to the board by the board, not by their state
+        for army_tiles in self.tiles.values():
+            for tile in army_tiles:
+                tile.board = None
+        for army, army_tiles, army_states in zip(self.armies,
+                                                tiles,
+                                                tiles_states):
+            for tile, tile_state in zip(army_tiles, army_states):
+                tile.restore(tile_state)
+                tile.board = self
+            self.tiles[army] = list(army_tiles)
+        self.board_positions = board_positions.copy()
+        self.occupied = {army: list(positions)
+                        for army, positions in zip(self.armies, occupied)}
+        self.hex_tiles = list(hex_tiles)
+        self.module_auras = {
+            army: {position: list(auras)
+                for position, auras in army_auras.items()}
+            for army, army_auras in zip(self.armies, module_auras)
+        }
+        self.initiative_index = {initiative: list(initiative_tiles)
+            for initiative, initiative_tiles in initiative_index.items()}
+        self._tile_initiatives = tile_initiatives.copy()
+        self._module_aura_entries = module_aura_entries.copy()
+        self._tile_hashes = tile_hashes.copy()
+
+    def attach_journal(self, journal: Optional[ChangeJournal]) -> None:
+        """
+        Records the changes of the board and of all tiles of the game
+        in a journal.
+
+        Args:
+            journal (Optional[ChangeJournal]):
+                The journal. None to stop recording.
+        """
+        self.journal = journal
+        for tile in self.tile_registry.values():
+            tile.journal = journal
+
+    def __getstate__(self) -> Dict:
+        # The Zobrist keys are shared by the boards of the process
+        return {name: value for name, value in self.__dict__.items()
+                if name not in ZOBRIST_KEYS_ATTRIBUTES}
+
+    def __setstate__(self, state: Dict) -> None:
+        # Tiles are pickled without their links to the board and to the
+        # journal
+        self.__dict__.update(state)
+        for tile in self.tile_registry.values():
+            tile.journal = self.journal
+        for army in self.armies:
+            for tile in self.tiles[army]:
+                tile.board = self
+        self._init_zobrist_keys()
+
+    def compute_zobrist_hash(self) -> int:
         """
-        self.hexes = []
-        index = 0
+        Computes the hash of the board from scratch. It is equal to
+        `zobrist_hash`, kept up to date incrementally.
 
-        for r in range(self.board_limit):
-            x = 0
-            y = -r
-            z = +r
+        Returns:
+            int: The hash
+        """
+        zobrist_hash = 0
+        for army in self.armies:
+            for tile in self.tiles[army]:
+                zobrist_hash ^= self._tile_zobrist_key(tile)
+        return zobrist_hash
+
+    def get_free_positions(self) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Returns the positions without any tile, in the order of
+        `hexes`. The tuple is shared, do not modify it.
+
+        Returns:
+            Tuple[Tuple[int, int, int], ...]: Free positions
+        """
+        return get_free_hexes(self.board_limit, self.occupied_mask)
+
+    def is_free(self, position: Tuple[int, int, int]) -> bool:
+        """
+        Checks if a position of the board has no tile.
+
+        Args:
+            position (Tuple[int, int, int]): Position on the board
+        Raises:
+            ValueError: If the position is not on the board
+        """
+        index = get_hex_index(self.board_limit).get(position)
+        if index is None:
+            raise ValueError(f"Position not on the board: {position}")
+        return not self.occupied_mask >> index & 1
+
+    def legal_placements(self, tile: Tile
+                        ) -> Iterator[Tuple[Tuple[int, int, int], int]]:
+        """
+        Yields every legal (position, rotation) of a tile of a hand:
+        the free positions, with the rotations giving different tiles.
+        Action tiles are not placed, nothing is yielded.
 
-            self.hexes.append((x, y, z))
-            index += 1
+        Args:
+            tile (Tile): Tile to place
 
-            for j in range(6):
-                if j == 5:
-                    num_of_hexes_in_edge = r-1
-                else:
-                    num_of_hexes_in_edge = r
-                for _ in range(num_of_hexes_in_edge):
-                    x = x+self.cube_direction_vectors[j][0]
-                    y = y+self.cube_direction_vectors[j][1]
-                    z = z+self.cube_direction_vectors[j][2]
+        Yields:
+            Tuple[Tuple[int, int, int], int]: Position and rotation
+        """
+        if tile.kind == "action":
+            return
+        rotations = tile.template.distinct_rotations
+        for position in get_free_hexes(self.board_limit, self.occupied_mask):
+            for rotation in rotations:
+                yield position, rotation
 
-                    self.hexes.append((x, y, z))
-                    index += 1
+    def _create_board(self) -> None:
+        """
+        Initializes the board by generating all valid positions
+        based on the `board_limit`.
+        """
+        self.hexes = list(get_board_hexes(self.board_limit))
 
     def _init_all_tiles(self, players:List[Player]) -> None:
         """Initializes the list `all_tiles`
@@ -792,4 +2283,348 @@ class HexBoard():
         for player in players:
             tiles = player.deck.tiles
             self.all_tile.extend(tiles)
-            self.all_tile.append(player.deck.hq_tile)
\ No newline at end of file
+            self.all_tile.append(player.deck.hq_tile)
+        self.tile_registry.update(
+            (tile.id_tile, tile) for tile in self.all_tile)
+
+    def _init_zobrist_keys(self) -> None:
+        """
+        Binds the fixed Zobrist keys of the board, shared by all boards
+        of the process: the keys of the templates of each army, and
+        the keys of the life points and of the nets on each hex.
+        """
+        hexes = len(self.hexes)
+        self._hex_index = get_hex_index(self.board_limit)
+        self._template_keys = {
+            tile.army_name: get_template_zobrist_keys(tile.army_name,
+                                                    tile.template.army_name,
+                                                    self.board_limit)
+            for tile in self.all_tile}
+        self._life_keys = get_zobrist_table(
+            "life", hexes * len(ZOBRIST_LIFE_POINTS))
+        self._netted_keys = get_zobrist_table("netted", hexes)
+
+    def _register_module(self, tile: Tile) -> None:
+        """
+        Adds the effects of a module to `module_auras` and updates the
+        tiles reached.
+
+        The effects apply on the tiles of the army of the module, in the
+        order of the upstream `ModuleEvaluator`: army after army, the
+        priority modules of an army first. A module under a "scoper"
+        effect fights for the next army: its effects apply on the tiles
+        of that army if it comes later in `armies`, else they are never
+        applied.
+
+        Args:
+            tile (Tile): Module on the board
+        """
+        target_army: Optional[str] = tile.army_name
+        if (not self._is_priority_module(tile)
+                and "scoper" in tile.module_effects):
+            target_army = self.get_controlling_army(tile)
+            if (self.armies.index(target_army)
+                    < self.armies.index(tile.army_name)):
+                target_army = None
+
+        entries = []
+        for effect in tile.module or []:
+            effect_type, effect_directions = next(iter(effect.items()))
+            if (target_army is None or not effect_directions
+                    or effect_type not in BATTLE_MODULE_EFFECTS):
+                continue
+            for direction in effect_directions:
+                position = get_neighbor_position(tile.board_position,
+                                                tuple(direction),
+                                                self.board_limit)
+                if position is None:
+                    continue
+                auras = self.module_auras[target_army].get(position)
+                if auras is None:
+                    auras = []
+                    self._set_item(self.module_auras[target_army],
+                                position,
+                                auras)
+                self._append(auras, (effect_type, tile.id_tile))
+                entries.append((target_army, position, effect_type))
+
+        self._set_item(self._module_aura_entries, tile.id_tile, entries)
+        self._sync_tiles_at({x[1] for x in entries})
+
+    def _unregister_module(self, tile: Tile) -> None:
+        """
+        Removes the effects of a module from `module_auras` and updates
+        the tiles reached.
+
+        Args:
+            tile (Tile): Module on the board
+        """
+        entries = self._pop_item(self._module_aura_entries,
+                                tile.id_tile,
+                                [])
+        for target_army, position, effect_type in entries:
+            self._remove(self.module_auras[target_army][position],
+                        (effect_type, tile.id_tile))
+        self._sync_tiles_at({x[1] for x in entries})
+
+    def _sync_tiles_at(self, positions: Iterable[Tuple[int, int, int]]
+                    ) -> None:
+        """
+        Updates the module effects of the tiles at some positions. A
+        tile under a "scoper" effect reads the effects of two armies,
+        the tile of any army is updated.
+
+        Args:
+            positions (Iterable[Tuple[int, int, int]]): Positions
+        """
+        for position in positions:
+            tile = self.get_tile_at(position)
+            if tile is not None:
+                self._sync_tile_effects(tile)
+
+    def _sync_tile_effects(self, tile: Tile) -> None:
+        """
+        Updates the module effects of a tile on the board from
+        `module_auras`, as the upstream `ModuleEvaluator` applied them.
+        The active effects are kept.
+
+        A module under a "scoper" effect gets the priority effects of
+        its army only, then fights for the next army: it gets the
+        effects of that army if it comes later in `armies`. A module
+        starting or ending under a "scoper" effect changes of
+        controlling army.
+
+        Args:
+            tile (Tile): Tile on the board
+        """
+        was_scoped = "scoper" in tile.module_effects
+        auras = self.module_auras[tile.army_name].get(tile.board_position, [])
+        is_scoped = tile.kind == "module" and any(
+            effect_type == "scoper" for effect_type, _ in auras)
+        if not is_scoped:
+            module_effects = [effect_type for effect_type, _ in auras
+                            if effect_type != "scoper"]
+        else:
+            module_effects = [
+                effect_type for effect_type, id_module in auras
+                if self._is_priority_module(self.tile_registry[id_module])]
+            controlling_army = next_element(self.armies, tile.army_name)
+            if (self.armies.index(controlling_army)
+                    > self.armies.index(tile.army_name)):
+                module_effects.extend(
+                    effect_type for effect_type, _ in
+                    self.module_auras[controlling_army].get(
+                        tile.board_position, []))
+        tile.set_attribute("module_effects", module_effects + [
+            effect_type
+            for effect_type in tile.module_effects
+            if effect_type in ACTIVE_MODULE_EFFECTS])
+
+        self._index_initiative(tile)
+
+        if (tile.module and tile.id_tile in self._module_aura_entries
+                and was_scoped != is_scoped):
+            self._unregister_module(tile)
+            self._register_module(tile)
+
+    def _is_priority_module(self, tile: Tile) -> bool:
+        """
+        Checks if the effects of a module are applied before the other
+        modules of its army, it has a PRIORITY_MODULE_EFFECTS effect.
+
+        Args:
+            tile (Tile): Module
+
+        Returns:
+            bool: True for a priority module
+        """
+        return any(effect_type in PRIORITY_MODULE_EFFECTS
+                for effect in tile.module or []
+                for effect_type in effect)
+
+    def _append(self, values: List, value: Any) -> None:
+        """
+        Appends a value to a list of the board, recording it in the
+        journal.
+
+        Args:
+            values (List): The list
+            value (Any): Value to append
+        """
+        values.append(value)
+        if self.journal is not None:
+            self.journal.record(list.pop, values)
+
+    def _remove(self, values: List, value: Any) -> None:
+        """
+        Removes a value from a list of the board, recording it in the
+        journal.
+
+        Args:
+            values (List): The list
+            value (Any): Value to remove
+        """
+        index = values.index(value)
+        del values[index]
+        if self.journal is not None:
+            self.journal.record(list.insert, values, index, value)
+
+    def _set_item(self, mapping: Dict, key: Any, value: Any) -> None:
+        """
+        Sets an item of a dict of the board, recording it in the
+        journal.
+
+        Args:
+            mapping (Dict): The dict
+            key (Any): Key of the item
+            value (Any): New value
+        """
+        if self.journal is not None:
+            if key in mapping:
+                self.journal.record(dict.__setitem__,
+                                    mapping,
+                                    key,
+                                    mapping[key])
+            else:
+                self.journal.record(dict.pop, mapping, key)
+        mapping[key] = value
+
+    def _pop_item(self, mapping: Dict, key: Any, default: Any = None
+                ) -> Any:
+        """
+        Removes an item from a dict of the board, recording it in the
+        journal.
+
+        Args:
+            mapping (Dict): The dict
+            key (Any): Key of the item
+            default (Any, optional): Returned if the key is missing.
+
+        Returns:
+            Any: Value of the removed item
+        """
+        if key not in mapping:
+            return default
+        value = mapping.pop(key)
+        if self.journal is not None:
+            self.journal.record(dict.__setitem__, mapping, key, value)
+        return value
+
+    def _set_attribute(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute of the board, recording it in the journal.
+
+        Args:
+            name (str): Name of the attribute
+            value (Any): New value
+        """
+        if self.journal is not None:
+            self.journal.record_attribute(self, name)
+        setattr(self, name, value)
+
+    def _tile_zobrist_key(self, tile: Tile) -> int:
+        """
+        Returns the part of the board hash of a tile: its template at
+        its position and rotation, its life points and its net.
+        Identical tiles share their template, so swapping them keeps
+        the hash. There is one tile per hex, so the life points and the
+        net are keyed by the hex only. Keys are read from fixed tables.
+
+        Args:
+            tile (Tile): Tile on the board
+
+        Returns:
+            int: Zobrist key of the tile
+        """
+        hexes = len(self.hexes)
+        hex_index = self._hex_index[tile.board_position]
+        tile_hash = self._template_keys[tile.army_name][
+            (6 * tile.template.catalog_index + tile.rotational_index)
+            * hexes + hex_index]
+        life_index = (tile.life_point or 0) - ZOBRIST_LIFE_POINTS.start
+        if 0 <= life_index < len(ZOBRIST_LIFE_POINTS):
+            tile_hash ^= self._life_keys[life_index * hexes + hex_index]
+        else:
+            tile_hash ^= get_zobrist_key("life", hex_index, tile.life_point)
+        if tile.is_netted:
+            tile_hash ^= self._netted_keys[hex_index]
+        return tile_hash
+
+    def _rehash_tile(self, tile: Tile) -> None:
+        """
+        Updates the board hash after a change of a tile on the board,
+        in O(1). Called by the tile itself.
+
+        Args:
+            tile (Tile): Tile on the board
+        """
+        old_hash = self._tile_hashes[tile.id_tile]
+        new_hash = self._tile_zobrist_key(tile)
+        if new_hash != old_hash:
+            self._set_item(self._tile_hashes, tile.id_tile, new_hash)
+            self._set_attribute("zobrist_hash",
+                                self.zobrist_hash ^ old_hash ^ new_hash)
+
+    def _set_hex_tile(self,
+                    position: Tuple[int, int, int],
+                    tile: Optional[Tile]
+                    ) -> None:
+        """
+        Sets the tile of a position in `hex_tiles` and its bit in
+        `occupied_mask`, recording them in the journal.
+
+        Args:
+            position (Tuple[int, int, int]): Position on the board
+            tile (Optional[Tile]): The tile. None to free the position
+        """
+        index = self._hex_index[position]
+        if self.journal is not None:
+            self.journal.record(list.__setitem__,
+                                self.hex_tiles,
+                                index,
+                                self.hex_tiles[index])
+        self.hex_tiles[index] = tile
+        if tile is None:
+            occupied_mask = self.occupied_mask & ~(1 << index)
+        else:
+            occupied_mask = self.occupied_mask | 1 << index
+        self._set_attribute("occupied_mask", occupied_mask)
+
+    def _index_initiative(self, tile: Tile) -> None:
+        """
+        Updates the initiatives of a tile on the board in
+        `initiative_index`.
+
+        Args:
+            tile (Tile): Tile on the board
+        """
+        initiatives = sorted(set(tile.effective_initiative or []))
+        if self._tile_initiatives.get(tile.id_tile, []) == initiatives:
+            return
+
+        self._unindex_initiative(tile)
+        for initiative in initiatives:
+            initiative_tiles = self.initiative_index.get(initiative)
+            if initiative_tiles is None:
+                initiative_tiles = []
+                self._set_item(self.initiative_index,
+                            initiative,
+                            initiative_tiles)
+            self._append(initiative_tiles, tile)
+        self._set_item(self._tile_initiatives, tile.id_tile, initiatives)
+
+    def _unindex_initiative(self, tile: Tile) -> None:
+        """
+        Removes a tile from `initiative_index`.
+
+        Args:
+            tile (Tile): Tile to remove
+        """
+        for initiative in self._pop_item(self._tile_initiatives,
+                                        tile.id_tile,
+                                        []):
+            tiles = self.initiative_index[initiative]
+            self._remove(tiles, tile)
+            if not tiles:
+                self._pop_item(self.initiative_index, initiative)
+
@@ -0,0 +1,259 @@
+import struct
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
+
+from scripts.model.model import get_army_keys, get_army_templates
+from scripts.utils.config import BOARD_LIMIT
+from scripts.utils.functions import get_board_hexes, get_hex_index
+
+
+# Operations of the records
+SET_UP, PLACE_HQ, DRAW, DRAW_TILE, DISCARD, PLACE, ACTION, BATTLE, \
+    END_TURN = range(9)
+# Value of an empty field of a record
+NONE = 0xFF
+# Rotation of an action record without rotation
+NO_ROTATION = 0xF
+
+MAGIC = b"NSR"
+VERSION = 1
+# Magic, version, seed, board limit, length of the army names
+HEADER = struct.Struct("<3sBQBB")
+# Operation and rotation, tile, target tile, hex
+RECORD = struct.Struct("<4B")
+
+# Decoded record: operation, tile ID, target tile ID, position, rotation
+Record = Tuple[int,
+            Optional[str],
+            Optional[str],
+            Optional[Tuple[int, int, int]],
+            Optional[int]]
+
+
+class ReplayLog:
+    """
+    Compact binary log of a game: the seed of the game, then one
+    fixed-size record per action of the players. The `GameEngine`
+    records its game in a log, and replays it with `from_replay`.
+
+    A record is 4 bytes: the operation in the low nibble and the
+    rotation in the high nibble, then the tile, the target tile and the
+    hex. Tiles are their index in the army catalog, with the player
+    index in the high bit, so that both players can play the same army. Hexes are their index on the board. A game takes a
+    few hundred bytes.
+
+    Attributes
+    ----------
+    armies (Tuple[str, str]):
+        Army names of the two players, as given to the engine.
+    seed (int):
+        Seed of the random generator of the game.
+    board_limit (int):
+        Size of the board.
+    records (bytearray):
+        The encoded records.
+
+    Methods
+    ----------
+    record(operation: int, id_tile: Optional[str] = None,\
+            id_target: Optional[str] = None,\
+            position: Optional[Tuple[int, int, int]] = None,\
+            rotation: Optional[int] = None) -> None:
+        Appends a record.
+    to_bytes() -> bytes:
+        Returns the log serialized.
+    from_bytes(data: bytes) -> ReplayLog:
+        Reads a log serialized by `to_bytes`.
+
+    Private Methods
+    ----------
+    _encode_tile(id_tile: Optional[str]) -> int:
+        Returns the byte of a tile.
+    _decode_tile(value: int) -> Optional[str]:
+        Returns the tile ID of a byte.
+    """
+
+    def __init__(self,
+                armies: Tuple[str, str],
+                seed: int,
+                board_limit: int = BOARD_LIMIT
+            ) -> None:
+        """
+        Initializes an empty log.
+
+        Args:
+            armies (Tuple[str, str]): Army names of the two players
+            seed (int): Seed of the game, from 0 to 2**64 - 1
+            board_limit (int, optional):
+                Size of the board. Defaults to BOARD_LIMIT.
+
+        Raises:
+            ValueError: If the seed does not fit in 64 bits
+        """
+        if not 0 <= seed < 1 << 64:
+            raise ValueError(f"Seed {seed} does not fit in 64 bits.")
+
+        self.armies = tuple(armies)
+        self.seed = seed
+        self.board_limit = board_limit
+        self.records = bytearray()
+        self._army_keys = get_army_keys(self.armies)
+        self._army_indexes = {key: i for i, key in enumerate(self._army_keys)}
+
+    def __len__(self) -> int:
+        return len(self.records) // RECORD.size
+
+    def __iter__(self) -> Iterator[Record]:
+        hexes = get_board_hexes(self.board_limit)
+        for code, tile, target, hex_index in RECORD.iter_unpack(
+                self.records):
+            yield (code & 0xF,
+                self._decode_tile(tile),
+                self._decode_tile(target),
+                None if hex_index == NONE else hexes[hex_index],
+                None if code >> 4 == NO_ROTATION else code >> 4)
+
+    def record(self,
+            operation: int,
+            id_tile: Optional[str] = None,
+            id_target: Optional[str] = None,
+            position: Optional[Tuple[int, int, int]] = None,
+            rotation: Optional[int] = None
+        ) -> None:
+        """
+        Appends a record.
+
+        Args:
+            operation (int): Operation of the record
+            id_tile (Optional[str], optional):
+                ID of the tile played. Defaults to None.
+            id_target (Optional[str], optional):
+                ID of the tile targeted. Defaults to None.
+            position (Optional[Tuple[int, int, int]], optional):
+                Position played. Defaults to None.
+            rotation (Optional[int], optional):
+                Rotational index. Defaults to None.
+
+        Raises:
+            ValueError: If the position is not on the board
+        """
+        hex_index = NONE
+        if position is not None:
+            hex_index = get_hex_index(self.board_limit).get(position, NONE)
+            if hex_index == NONE:
+                raise ValueError(f"Position not on the board: {position}")
+        self.records += RECORD.pack(
+            operation | (NO_ROTATION if rotation is None else rotation) << 4,
+            self._encode_tile(id_tile),
+            self._encode_tile(id_target),
+            hex_index
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the log serialized: a header with the seed, the board
+        size and the army names, then the records.
+
+        Returns:
+            bytes: The serialized log
+        """
+        names = ",".join(self.armies).encode()
+        return (HEADER.pack(MAGIC, VERSION, self.seed, self.board_limit,
+                            len(names))
+                + names
+                + self.records)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ReplayLog":
+        """
+        Reads a log serialized by `to_bytes`.
+
+        Args:
+            data (bytes): The serialized log, or a memoryview of it
+
+        Returns:
+            ReplayLog: The log
+
+        Raises:
+            ValueError: If the data is not a replay log
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Data too short for a replay log.")
+        magic, version, seed, board_limit, names_size = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Data is not a replay log of this version.")
+        start = HEADER.size + names_size
+        if (len(data) - start) % RECORD.size:
+            raise ValueError("Replay log truncated.")
+
+        armies = bytes(data[HEADER.size:start]).decode().split(",")
+        log = cls((armies[0], armies[1]), seed, board_limit)
+        log.records = bytearray(data[start:])
+        return log
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _encode_tile(self, id_tile: Optional[str]) -> int:
+        """
+        Returns the byte of a tile: the player index in the high bit,
+        then the index of the tile in the army catalog.
+
+        Args:
+            id_tile (Optional[str]): ID of the tile
+
+        Returns:
+            int: The byte. NONE for no tile.
+
+        Raises:
+            ValueError: If the tile is not in the catalogs of the armies
+        """
+        if id_tile is None:
+            return NONE
+        for key, army_index in self._army_indexes.items():
+            if id_tile.startswith(key + "-"):
+                army = self.armies[army_index]
+                index = get_tile_indexes(army)[0].get(
+                    army + id_tile[len(key):])
+                if index is not None:
+                    return army_index << 7 | index
+        raise ValueError(f"Tile {id_tile} not in armies {self.armies}.")
+
+    def _decode_tile(self, value: int) -> Optional[str]:
+        """
+        Returns the tile ID of a byte made by `_encode_tile`.
+
+        Args:
+            value (int): The byte
+
+        Returns:
+            Optional[str]: ID of the tile. None for no tile.
+        """
+        if value == NONE:
+            return None
+        army = self.armies[value >> 7]
+        id_tile = get_tile_indexes(army)[1][value & 0x7F]
+        return self._army_keys[value >> 7] + id_tile[len(army):]
+
+
+@lru_cache(maxsize=None)
+def get_tile_indexes(army: str
+                ) -> Tuple[Dict[str, int], Tuple[str, ...]]:
+    """
+    Returns the index of each tile of an army catalog, and the tile IDs
+    by index.
+
+    Args:
+        army (str): Army name
+
+    Returns:
+        Tuple[Dict[str, int], Tuple[str, ...]]:
+            Index by tile ID, tile IDs by index
+
+    Raises:
+        ValueError: If the army has too many tiles to fit in 7 bits
+    """
+    id_tiles = tuple(get_army_templates(army))
+    if len(id_tiles) >= 0x7F:
+        raise ValueError(f"Army {army} has too many tiles to replay.")
+    return {id_tile: i for i, id_tile in enumerate(id_tiles)}, id_tiles
@@ -0,0 +1,149 @@
+from typing import Any, List, Optional
+
+
+class TranspositionTable:
+    """
+    Bounded cache of results computed for game positions, keyed by a
+    64-bit hash such as `HexBoard.zobrist_hash`. Positions recurring in
+    other search branches, or in other games, reuse the stored result
+    (battle outcome, evaluation...) instead of computing it again.
+
+    The table has a fixed number of slots, a power of 2. A hash goes in
+    the slot given by its low bits, so two positions can compete for a
+    slot. The stored entry is replaced when it belongs to an older
+    generation (a previous search), or when the new entry was computed
+    with a depth at least as high: deep results are the most expensive
+    to recompute.
+
+    Attributes
+    ----------
+        size (int):
+            Number of slots.
+        generation (int):
+            Current generation, incremented by `new_generation`.
+        hits (int):
+            Number of successful lookups.
+        misses (int):
+            Number of failed lookups.
+
+    Methods
+    ----------
+        get(key: int, depth: int = 0) -> Optional[Any]:
+            Returns the value stored for a hash.
+        store(key: int, value: Any, depth: int = 0) -> bool:
+            Stores a value for a hash, if it replaces the stored entry.
+        new_generation() -> None:
+            Makes the stored entries replaceable by the next search.
+        clear() -> None:
+            Removes all entries.
+
+    Private Methods
+    ----------
+        _slot(key: int) -> int:
+            Returns the slot of a hash.
+    """
+
+    def __init__(self, size: int = 1 << 16) -> None:
+        """
+        Initializes an empty table.
+
+        Args:
+            size (int, optional):
+                Number of slots, a power of 2. Defaults to 65536.
+
+        Raises:
+            ValueError: If size is not a positive power of 2
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError("size must be a positive power of 2.")
+
+        self.size = size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._mask = size - 1
+        self._keys: List[Optional[int]] = [None] * size
+        self._values: List[Any] = [None] * size
+        self._depths: List[int] = [0] * size
+        self._generations: List[int] = [0] * size
+
+    def __len__(self) -> int:
+        return self.size - self._keys.count(None)
+
+    def get(self, key: int, depth: int = 0) -> Optional[Any]:
+        """
+        Returns the value stored for a hash.
+
+        Args:
+            key (int): Hash of the position
+            depth (int, optional):
+                Minimum depth of the stored result. Defaults to 0.
+
+        Returns:
+            Optional[Any]: The value. None if the hash is not stored, or
+                was stored with a lower depth.
+        """
+        slot = self._slot(key)
+        if self._keys[slot] == key and self._depths[slot] >= depth:
+            self.hits += 1
+            return self._values[slot]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, value: Any, depth: int = 0) -> bool:
+        """
+        Stores a value for a hash, if it replaces the entry of its slot:
+        empty slot, same hash, entry of an older generation or entry
+        computed with a lower or equal depth.
+
+        Args:
+            key (int): Hash of the position
+            value (Any): Value to store
+            depth (int, optional): Depth of the result. Defaults to 0.
+
+        Returns:
+            bool: True if the value is stored
+        """
+        slot = self._slot(key)
+        stored_key = self._keys[slot]
+        if (stored_key is not None
+                and stored_key != key
+                and self._generations[slot] == self.generation
+                and self._depths[slot] > depth):
+            return False
+
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._depths[slot] = depth
+        self._generations[slot] = self.generation
+        return True
+
+    def new_generation(self) -> None:
+        """
+        Makes the stored entries replaceable by the next search. They
+        can still be read until they are replaced.
+        """
+        self.generation += 1
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._keys = [None] * self.size
+        self._values = [None] * self.size
+        self._depths = [0] * self.size
+        self._generations = [0] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _slot(self, key: int) -> int:
+        """
+        Returns the slot of a hash, from its low bits.
+
+        Args:
+            key (int): Hash of the position
+
+        Returns:
+            int: Index of the slot
+        """
+        return key & self._mask
@@ -0,0 +1,65 @@
+"""
+Monte-Carlo self-play tournament between two armies.
+
+Usage:
+    python -m scripts.sim borgo moloch --games 10000 --workers 64
+    python -m scripts.sim borgo moloch --archive games.nsra
+"""
+import argparse
+import os
+import time
+
+from scripts.model.archive import ReplayArchive
+from scripts.model.model import get_army_keys
+from scripts.sim.tournament import ARMIES, run_tournament, summarize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.sim",
+        description="Plays random games between two armies."
+    )
+    parser.add_argument("army", choices=ARMIES)
+    parser.add_argument("enemy_army", choices=ARMIES)
+    parser.add_argument("-n", "--games", type=int, default=1000,
+                        help="number of games (default: 1000)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: all CPUs)")
+    parser.add_argument("-c", "--chunksize", type=int, default=16,
+                        help="games sent to a worker at once (default: 16)")
+    parser.add_argument("-s", "--seed", type=int, default=0,
+                        help="seed of the first game (default: 0)")
+    parser.add_argument("-a", "--archive", default=None,
+                        help="replay archive the games are appended to")
+    args = parser.parse_args()
+
+    armies = (args.army, args.enemy_army)
+    start = time.perf_counter()
+    records = run_tournament(armies,
+                            args.games,
+                            workers=args.workers,
+                            chunksize=args.chunksize,
+                            seed=args.seed,
+                            record=args.archive is not None
+                        )
+    elapsed = time.perf_counter() - start
+    summary = summarize(armies, records)
+
+    workers = args.workers or os.cpu_count()
+    print(f"{args.games} games, {workers} workers, {elapsed:.2f}s "
+        f"({args.games / elapsed:.1f} games/sec)")
+    for army in get_army_keys(armies):
+        print(f"{army:>10}: {summary[f'{army}_wins']:.0f} wins, "
+            f"mean HQ life {summary[f'{army}_hq_life']:.2f}")
+    print(f"{'draws':>10}: {summary['draws']:.0f}")
+    print(f"mean turns {summary['turns']:.1f}, "
+        f"mean battles {summary['battles']:.2f}")
+
+    if args.archive is not None:
+        with ReplayArchive(args.archive, "a") as archive:
+            archive.extend(x.replay for x in records) # type: ignore
+            print(f"{len(archive)} games in {args.archive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import random
+from typing import List, Tuple, Dict, Optional, Any
+
+from scripts.model.model import Player, Tile
+from scripts.controllers.gameengine import GameEngine
+from scripts.utils.config import INNER_BOARD_CUBE_POSITIONS
+from scripts.utils.functions import get_neighbors_hex_positions
+
+
+class RandomPolicy:
+    """
+    Policy playing random legal moves with a `GameEngine`.
+
+    The policy discards a random tile when it has 3 tiles in hand, then
+    plays every remaining tile it can at a random legal place. It is
+    the baseline opponent of the simulations.
+
+    Attributes
+    ----------
+    rng (random.Random):
+        Random generator of the policy.
+
+    Methods
+    ----------
+    place_hq(engine: GameEngine, player: Player) -> None:
+        Places the HQ of the player on a random free position.
+    play_turn(engine: GameEngine) -> List[str]:
+        Plays the turn of the current player.
+
+    Private Methods
+    ----------
+    _play_tile(engine: GameEngine, tile: Tile) -> None:
+        Plays one tile of the hand at a random legal place.
+    _action_arguments(engine: GameEngine, tile: Tile) -> List[Dict]:
+        Returns the candidate arguments of an action tile.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initializes the random generator of the policy.
+
+        Args:
+            seed (Optional[int], optional):
+                Seed of the random generator. Defaults to None.
+        """
+        self.rng = random.Random(seed)
+
+    def place_hq(self, engine: GameEngine, player: Player) -> None:
+        """
+        Places the HQ of the player on a random free position.
+
+        Args:
+            engine (GameEngine): The game engine
+            player (Player): Player placing his HQ
+        """
+        engine.place_hq(player, self.rng.choice(engine.free_positions()))
+
+    def play_turn(self, engine: GameEngine) -> List[str]:
+        """
+        Plays the turn of the current player. Tiles must be drawn before.
+
+        Args:
+            engine (GameEngine): The game engine
+
+        Returns:
+            List[str]: IDs of the tiles kept in hand for the next turn
+        """
+        hand_tiles = engine.current_player.hand.hand_tiles
+        if len(hand_tiles) == 3:
+            engine.discard_tiles([self.rng.choice(hand_tiles).id_tile])
+
+        for tile in list(hand_tiles):
+            if engine.game_over:
+                break
+            self._play_tile(engine, tile)
+
+        return []
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _play_tile(self, engine: GameEngine, tile: Tile) -> None:
+        """
+        Plays one tile of the hand at a random legal place. The tile is
+        left in hand if it can not be played.
+
+        Args:
+            engine (GameEngine): The game engine
+            tile (Tile): Tile to play
+        """
+        if tile.kind in ["unite", "module"]:
+            free_positions = engine.free_positions()
+            if free_positions:
+                engine.place_tile(tile.id_tile,
+                                self.rng.choice(free_positions),
+                                self.rng.randint(0, 5) # type: ignore
+                            )
+            return
+
+        candidates = self._action_arguments(engine, tile)
+        self.rng.shuffle(candidates)
+        for arguments in candidates:
+            try:
+                engine.play_action_tile(tile.id_tile, **arguments)
+                return
+            except ValueError:
+                continue
+
+    def _action_arguments(self, engine: GameEngine, tile: Tile
+                        ) -> List[Dict[str, Any]]:
+        """
+        Returns the candidate arguments of an action tile. Some of them
+        may be illegal, the engine checks them.
+
+        Args:
+            engine (GameEngine): The game engine
+            tile (Tile): The action tile
+
+        Returns:
+            List[Dict[str, Any]]:
+                Keyword arguments for `GameEngine.play_action_tile`
+        """
+        army = engine.current_player.deck.army_name
+        own_tiles = engine.board.tiles[army]
+        enemy_tiles = [enemy_tile
+                    for enemy_army in engine.board.armies
+                    if enemy_army != army
+                    for enemy_tile in engine.board.tiles[enemy_army]
+                ]
+
+        if tile.action == "battle":
+            return [{}]
+        if tile.action in ["sniper", "grenade"]:
+            return [{"id_target": x.id_tile} for x in enemy_tiles]
+        if tile.action == "airstrike":
+            return [{"position": x} for x in INNER_BOARD_CUBE_POSITIONS]
+
+        moves: List[Tuple[Tile, Tuple[int, int, int]]] = []
+        if tile.action == "movement":
+            moves = [(x, position) for x in own_tiles
+                    for position in get_neighbors_hex_positions(
+                        x.board_position)]
+        elif tile.action == "push":
+            moves = [(x, position) for x in enemy_tiles
+                    for position in get_neighbors_hex_positions(
+                        x.board_position)]
+        return [{"id_target": x.id_tile,
+                "position": position,
+                "rotation": self.rng.randint(0, 5)
+                    if tile.action == "movement" else None}
+                for x, position in moves
+            ]
@@ -0,0 +1,171 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, List, Tuple, Dict, Optional
+
+from scripts.controllers.gameengine import GameEngine
+from scripts.model.model import get_army_keys
+from scripts.model.replay import ReplayLog
+from scripts.sim.policies import RandomPolicy
+from scripts.utils.functions import split_seed
+
+
+ARMIES = ["borgo", "moloch", "outpost"]
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """
+    Compact outcome of one simulated game, cheap to send back from a
+    worker process.
+
+    Attributes
+    ----------
+    seed (int):
+        Seed of the game. Replaying it gives the same game.
+    winner (Optional[str]):
+        Army key of the winner (see `get_army_keys`). None for a draw.
+    hq_life (Tuple[int, int]):
+        Final HQ life points, in the order of the tournament armies.
+    turns (int):
+        Number of player turns played.
+    battles (int):
+        Number of battles resolved.
+    replay (Optional[bytes]):
+        Binary replay log of the game, see `ReplayLog`. None if not
+        recorded.
+    """
+    seed: int
+    winner: Optional[str]
+    hq_life: Tuple[int, int]
+    turns: int
+    battles: int
+    replay: Optional[bytes] = None
+
+
+def play_game(armies: Tuple[str, str],
+            seed: int,
+            policies: Optional[Dict[str, Any]] = None,
+            record: bool = False
+        ) -> GameRecord:
+    """
+    Plays a complete game, by default between two random policies.
+
+    Args:
+        armies (Tuple[str, str]): Army names of the two players, the
+            same army for a mirror match
+        seed (int): Seed of the game
+        policies (Optional[Dict[str, Any]], optional):
+            Policies replacing the random ones, by army key (see
+            `get_army_keys`). They
+            need `place_hq` and `play_turn` methods. Defaults to None.
+        record (bool, optional):
+            True to record the replay log of the game. Defaults to
+            False.
+
+    Returns:
+        GameRecord: Outcome of the game
+    """
+    # Decks and players order only depend on the seed of the game
+    engine = GameEngine(armies, rng=random.Random(seed))
+    if record:
+        engine.replay = ReplayLog(armies, seed)
+    engine.set_up()
+    custom_policies = policies or {}
+    player_policies = {
+        player.name: custom_policies.get(player.deck.army_name,
+                                        RandomPolicy(split_seed(seed, i)))
+        for i, player in enumerate(engine.players)
+    }
+
+    for player in engine.players:
+        player_policies[player.name].place_hq(engine, player)
+
+    while not engine.game_over:
+        engine.draw_tiles()
+        policy = player_policies[engine.current_player.name]
+        engine.end_turn(policy.play_turn(engine))
+
+    hq_life = engine.get_hq_life()
+    keys = get_army_keys(armies)
+    return GameRecord(seed=seed,
+                    winner=engine.winner(),
+                    hq_life=(hq_life[keys[0]], hq_life[keys[1]]),
+                    turns=engine.round_iteration - 1,
+                    battles=len(engine.battles),
+                    replay=None if engine.replay is None
+                        else engine.replay.to_bytes()
+                )
+
+
+def run_tournament(armies: Tuple[str, str],
+                games: int,
+                workers: Optional[int] = None,
+                chunksize: int = 16,
+                seed: int = 0,
+                record: bool = False
+            ) -> List[GameRecord]:
+    """
+    Plays `games` games between two armies, spread over worker
+    processes. Game i is played with the seed `seed + i`, so results do
+    not depend on the number of workers.
+
+    Args:
+        armies (Tuple[str, str]): Army names of the two players, the
+            same army for a mirror match
+        games (int): Number of games
+        workers (Optional[int], optional):
+            Number of worker processes. Defaults to the number of CPUs.
+            With 1, games are played in the current process.
+        chunksize (int, optional):
+            Number of games sent to a worker at once. Defaults to 16.
+        seed (int, optional): Seed of the first game. Defaults to 0.
+        record (bool, optional):
+            True to record the replay log of each game. Defaults to
+            False.
+
+    Returns:
+        List[GameRecord]: Outcome of each game, in seed order
+
+    Raises:
+        ValueError: If an army is unknown
+    """
+    for army in armies:
+        if army not in ARMIES:
+            raise ValueError(f"Unknown army: {army}. Choose in {ARMIES}.")
+
+    seeds = range(seed, seed + games)
+    play = partial(play_game, tuple(armies), record=record)
+    if workers == 1:
+        return [play(game_seed) for game_seed in seeds]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play, seeds, chunksize=chunksize))
+
+
+def summarize(armies: Tuple[str, str], records: List[GameRecord]
+            ) -> Dict[str, float]:
+    """
+    Aggregates game records of a tournament.
+
+    Args:
+        armies (Tuple[str, str]): Army names of the two players
+        records (List[GameRecord]): Outcome of the games
+
+    Returns:
+        Dict[str, float]:
+            Wins of each army, draws, mean HQ life of each army, mean
+            turns and mean battles per game. Armies are keyed by their
+            army key (see `get_army_keys`).
+    """
+    nb_games = max(len(records), 1)
+    summary: Dict[str, float] = {}
+    for i, army in enumerate(get_army_keys(armies)):
+        summary[f"{army}_wins"] = sum(x.winner == army for x in records)
+        summary[f"{army}_hq_life"] = sum(
+            x.hq_life[i] for x in records) / nb_games
+    summary["draws"] = sum(x.winner is None for x in records)
+    summary["turns"] = sum(x.turns for x in records) / nb_games
+    summary["battles"] = sum(x.battles for x in records) / nb_games
+    return summary
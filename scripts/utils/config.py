@@ -46,6 +46,19 @@ ROTATIONS = {(0, -1, 1): 0,
             (-1, 1, 0): 4,
             (-1, 0, 1): 5}
 
+# Module effects applied for the battles. Other effects of the army
+# data are ignored, as by the upstream ModuleEvaluator.
+BATTLE_MODULE_EFFECTS = ["medic", "cac_augment", "range_augment",
+                        "initiative_augment", "double_initiative",
+                        "saboteur", "scoper", "quartiermaitre"]
+
+# Effects of the modules applied first, before the other modules of
+# their army (modules taking control of units).
+PRIORITY_MODULE_EFFECTS = ["scoper"]
+
+# Module effects applied outside the board auras (see ModuleEvaluator)
+ACTIVE_MODULE_EFFECTS = ["transport"]
+
 # Board limit.
 BOARD_LIMIT = 3
 
@@ -53,6 +66,7 @@ BOARD_LIMIT = 3
 ANGLES = {0: 0, 1: -60, 2: -120, 3: -180, 4: -240, 5: -300}
 DISPLAY_SIZE = (960, 720)
 TILE_HEIGHT = 70
+TILE_IMAGE_SIZE = (81, 70)
 PIXEL_POSITION_LIST = [(302, 241),
                     (301, 326),
                     (301, 411),
@@ -1,4 +1,7 @@
-from typing import Tuple, List, TypeVar
+from functools import lru_cache
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Tuple, List, Dict, Hashable, Mapping, Optional, TypeVar
 
 from scripts.utils.config import (BOARD_PIXEL_TO_CUBE,
                         CUBE_DIRECTION_VECTORS,
@@ -99,27 +102,15 @@ def get_neighbors_hex_positions(cube_coordinates: Tuple[int, int, int]
     Returns:
         List[Tuple[int, int, int]]:
             List of neighboring cube coordinates.
+
+    Raises:
+        ValueError: If the position is not on the board
     """
-    try: 
-        # Validate input types and lengths
-        raise_wrong_cube_coordinate(cube_coordinates)
-        # Not doing a loop because of pylint which is returning a
-        # ReturnTypeError if so.
-        neighbors = [(
-                cube_coordinates[0] + direction[0],
-                cube_coordinates[1] + direction[1],
-                cube_coordinates[2] + direction[2]
-            )
-            for direction in CUBE_DIRECTION_VECTORS
-        ]
-        neighbors = [position 
-                    for position in neighbors
-                    if all(abs(x) < BOARD_LIMIT for x in position)
-                ]
-        return neighbors
-    except ValueError as ve:
-        print(f"Error: {ve}")
-        raise
+    neighbors = get_neighbor_table().get(cube_coordinates)
+    if neighbors is None:
+        raise ValueError(f"The position {cube_coordinates} is outside \
+                    of the board")
+    return list(neighbors.values())
 
 
 def list_cubes_to_pixel(list_cube_coordinates: List[Tuple[int, int, int]]
@@ -254,3 +245,250 @@ def raise_wrong_pixel_coordinate(pixel_coordinate: Tuple[int, int]
     if not all(pixel_coordinate[i] <= DISPLAY_SIZE[i] for i in range(2)):
         raise ValueError("The pixel position must not exceed \
                         the display size.")
+
+
+@lru_cache(maxsize=1 << 12)
+def get_zobrist_key(*component: Hashable) -> int:
+    """
+    Returns the 64-bit Zobrist key of a component of a game state (e.g.
+    a tile in a deck). The key is derived from the repr of the
+    component, so it is the same in every process and every game. The
+    cache is bounded: the keys of the board are read from fixed tables
+    (see `get_zobrist_table`).
+
+    Args:
+        *component (Hashable): Values describing the component
+
+    Returns:
+        int: The key
+    """
+    digest = blake2b(repr(component).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_table(name: str, size: int) -> Tuple[int, ...]:
+    """
+    Returns a fixed table of Zobrist keys, built once per process: the
+    key at index i is derived from the name of the table and i, so a
+    smaller table of the same name is a prefix of a bigger one.
+
+    Args:
+        name (str): Name of the table
+        size (int): Number of keys
+
+    Returns:
+        Tuple[int, ...]: The keys
+    """
+    return tuple(
+        int.from_bytes(blake2b(f"{name}/{index}".encode(),
+                            digest_size=8).digest(), "little")
+        for index in range(size))
+
+
+def split_seed(seed: int, stream: int) -> int:
+    """
+    Derives the seed of an independent random stream from a game seed,
+    e.g. one per player policy. Unlike `seed + stream`, the derived
+    seeds of a game never meet the seeds of another game.
+
+    Args:
+        seed (int): Seed of the game
+        stream (int): Index of the stream
+
+    Returns:
+        int: The 64-bit seed of the stream
+    """
+    digest = blake2b(f"{seed}/{stream}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+@lru_cache(maxsize=None)
+def get_board_hexes(board_limit: int = BOARD_LIMIT
+                ) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Generates all positions of the board, ring by ring from the center.
+    The order gives the dense index of each hex.
+
+    Args:
+        board_limit (int, optional):
+            Number of hexagons from the center to the outermost edge.
+            Defaults to BOARD_LIMIT.
+
+    Returns:
+        Tuple[Tuple[int, int, int], ...]: Positions of the board
+    """
+    hexes = []
+    for r in range(board_limit):
+        x, y, z = 0, -r, r
+        hexes.append((x, y, z))
+
+        for j in range(6):
+            num_of_hexes_in_edge = r - 1 if j == 5 else r
+            for _ in range(num_of_hexes_in_edge):
+                x += CUBE_DIRECTION_VECTORS[j][0]
+                y += CUBE_DIRECTION_VECTORS[j][1]
+                z += CUBE_DIRECTION_VECTORS[j][2]
+                hexes.append((x, y, z))
+    return tuple(hexes)
+
+
+@lru_cache(maxsize=None)
+def get_hex_index(board_limit: int = BOARD_LIMIT
+                ) -> Dict[Tuple[int, int, int], int]:
+    """
+    Maps each position of the board to its dense index, from 0 to 18
+    (0 to 36 if board_limit is 4). The dict is shared, do not modify it.
+
+    Args:
+        board_limit (int, optional):
+            Number of hexagons from the center to the outermost edge.
+            Defaults to BOARD_LIMIT.
+
+    Returns:
+        Dict[Tuple[int, int, int], int]: Index of each position
+    """
+    return {position: index
+            for index, position in enumerate(get_board_hexes(board_limit))}
+
+
+@lru_cache(maxsize=1 << 14)
+def get_free_hexes(board_limit: int, occupied_mask: int
+                ) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Returns the free positions of a board, in the order of
+    `get_board_hexes`. Tuples are shared between calls, so asking
+    for the free positions does not allocate in a search.
+
+    Args:
+        board_limit (int):
+            Number of hexagons from the center to the outermost edge.
+        occupied_mask (int):
+            Occupied positions, bit i set if the position of index i is
+            occupied.
+
+    Returns:
+        Tuple[Tuple[int, int, int], ...]: Free positions
+    """
+    return tuple(position
+                for index, position in enumerate(get_board_hexes(board_limit))
+                if not occupied_mask >> index & 1)
+
+
+@lru_cache(maxsize=None)
+def get_ray_table(board_limit: int = BOARD_LIMIT
+                ) -> Dict[Tuple[int, Tuple[int, int, int]], Tuple[int, ...]]:
+    """
+    Precomputes the rays of the board: for each hex and each direction,
+    the indices of the hexes met moving in this direction, in order,
+    until the board edge. The dict is shared, do not modify it.
+
+    Args:
+        board_limit (int, optional):
+            Number of hexagons from the center to the outermost edge.
+            Defaults to BOARD_LIMIT.
+
+    Returns:
+        Dict[Tuple[int, Tuple[int, int, int]], Tuple[int, ...]]:
+            Hex indices of each ray. Keys are the index of the origin
+            hex and the direction vector.
+    """
+    hex_index = get_hex_index(board_limit)
+    ray_table = {}
+    for position, index in hex_index.items():
+        for direction in CUBE_DIRECTION_VECTORS:
+            ray = []
+            next_position = (position[0] + direction[0],
+                            position[1] + direction[1],
+                            position[2] + direction[2])
+            while next_position in hex_index:
+                ray.append(hex_index[next_position])
+                next_position = (next_position[0] + direction[0],
+                                next_position[1] + direction[1],
+                                next_position[2] + direction[2])
+            ray_table[(index, direction)] = tuple(ray)
+    return ray_table
+
+
+@lru_cache(maxsize=None)
+def get_adjacency_table(board_limit: int = BOARD_LIMIT
+                    ) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Precomputes the neighbors of each hex by index: the neighbor of the
+    hex i in the direction CUBE_DIRECTION_VECTORS[j] is at [i][j], -1
+    if outside the board.
+
+    Args:
+        board_limit (int, optional):
+            Number of hexagons from the center to the outermost edge.
+            Defaults to BOARD_LIMIT.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: Neighbor indices of each hex
+    """
+    hex_index = get_hex_index(board_limit)
+    return tuple(
+        tuple(hex_index.get((position[0] + direction[0],
+                            position[1] + direction[1],
+                            position[2] + direction[2]), -1)
+            for direction in CUBE_DIRECTION_VECTORS)
+        for position in get_board_hexes(board_limit)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_neighbor_table(board_limit: int = BOARD_LIMIT
+                    ) -> Mapping[Tuple[int, int, int],
+                                Mapping[Tuple[int, int, int],
+                                        Tuple[int, int, int]]]:
+    """
+    Precomputes the neighbors of each hex by cube coordinates: for each
+    position, the neighbor positions on the board keyed by direction,
+    in the order of CUBE_DIRECTION_VECTORS. The mappings are read-only.
+
+    Args:
+        board_limit (int, optional):
+            Number of hexagons from the center to the outermost edge.
+            Defaults to BOARD_LIMIT.
+
+    Returns:
+        Mapping[Tuple[int, int, int], Mapping[Tuple[int, int, int],\
+            Tuple[int, int, int]]]:
+            Neighbor positions of each position, keyed by direction
+    """
+    hexes = get_board_hexes(board_limit)
+    return MappingProxyType({
+        hexes[index]: MappingProxyType({
+            direction: hexes[neighbor_index]
+            for direction, neighbor_index in zip(CUBE_DIRECTION_VECTORS,
+                                                neighbor_indices)
+            if neighbor_index != -1
+        })
+        for index, neighbor_indices in enumerate(
+            get_adjacency_table(board_limit))
+    })
+
+
+def get_neighbor_position(position: Tuple[int, int, int],
+                        direction: Tuple[int, int, int],
+                        board_limit: int = BOARD_LIMIT
+                    ) -> Optional[Tuple[int, int, int]]:
+    """
+    Returns the neighbor of a position in a direction.
+
+    Args:
+        position (Tuple[int, int, int]): Position on the board
+        direction (Tuple[int, int, int]): Direction vector
+        board_limit (int, optional):
+            Number of hexagons from the center to the outermost edge.
+            Defaults to BOARD_LIMIT.
+
+    Returns:
+        Optional[Tuple[int, int, int]]:
+            Neighbor position. None if outside the board or if the
+            direction is not a unit direction.
+    """
+    neighbors = get_neighbor_table(board_limit).get(position)
+    if neighbors is None:
+        return None
+    return neighbors.get(direction)
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import pygame
+
+
+# Cache key: path, size, smooth scaling, per-pixel alpha
+AssetKey = Tuple[str, Optional[Tuple[int, int]], bool, bool]
+
+
+class AssetManager:
+    """
+    Bounded LRU cache of the images of the game. Each file is loaded
+    once, converted to the pixel format of the display and scaled once
+    per size; every sprite with the same image shares the surface, which
+    must not be modified.
+
+    Images are converted once the display mode is set. Those loaded
+    before are kept in the format of their file.
+
+    Attributes
+    ----------
+    max_size (int):
+        Maximum number of surfaces kept, the least recently used are
+        dropped first.
+    hits (int):
+        Number of images served from the cache.
+    misses (int):
+        Number of images loaded or scaled.
+
+    Methods
+    ----------
+    get_image(path: str, size: Optional[Tuple[int, int]] = None,\
+            smooth: bool = True, alpha: bool = True) -> pygame.Surface:
+        Returns an image, loaded and scaled on first use.
+    clear() -> None:
+        Empties the cache.
+
+    Private Methods
+    ----------
+    _load(path: str, alpha: bool) -> pygame.Surface:
+        Loads an image from disk and converts it.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int, optional):
+                Maximum number of surfaces kept. Defaults to 256.
+
+        Raises:
+            ValueError: If the size is not positive
+        """
+        if max_size <= 0:
+            raise ValueError("Asset cache size must be positive.")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: "OrderedDict[AssetKey, pygame.Surface]" = \
+            OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get_image(self,
+                path: str,
+                size: Optional[Tuple[int, int]] = None,
+                smooth: bool = True,
+                alpha: bool = True
+            ) -> pygame.Surface:
+        """
+        Returns an image, loaded from disk and scaled on first use. The
+        surface is shared: blit it, do not modify it.
+
+        Args:
+            path (str): Path of the image file
+            size (Optional[Tuple[int, int]], optional):
+                Size of the image. Defaults to None, the size of the
+                file.
+            smooth (bool, optional):
+                True to scale with `smoothscale`, else `scale`.
+                Defaults to True.
+            alpha (bool, optional):
+                True to keep per-pixel alpha, False for opaque images.
+                Defaults to True.
+
+        Returns:
+            pygame.Surface: The image
+        """
+        key = (path, size, smooth, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if size is None:
+            surface = self._load(path, alpha)
+        else:
+            source = self.get_image(path, alpha=alpha)
+            scale = (pygame.transform.smoothscale if smooth
+                    else pygame.transform.scale)
+            surface = scale(source, size)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Empties the cache."""
+        self._surfaces.clear()
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _load(self, path: str, alpha: bool) -> pygame.Surface:
+        """
+        Loads an image from disk, converted to the pixel format of the
+        display if its mode is set.
+
+        Args:
+            path (str): Path of the image file
+            alpha (bool): True to keep per-pixel alpha
+
+        Returns:
+            pygame.Surface: The image
+        """
+        image = pygame.image.load(path)
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+
+@lru_cache(maxsize=None)
+def get_assets() -> AssetManager:
+    """
+    Returns the asset manager of the process, shared by all the views.
+
+    Returns:
+        AssetManager: The asset manager
+    """
+    return AssetManager()
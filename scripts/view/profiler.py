@@ -0,0 +1,248 @@
+import csv
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import pygame
+from pygame.event import Event
+
+
+# Sections of a frame. Time not measured in another section is charged
+# to the controller logic.
+SECTIONS = ("input", "logic", "sprites", "blit", "flip", "tick")
+DEFAULT_SECTION = "logic"
+# Keys toggling the overlay and dumping the frames in a CSV file
+OVERLAY_KEY = pygame.K_F3
+DUMP_KEY = pygame.K_F4
+
+
+class FrameProfiler:
+    """
+    Breaks the time of each frame of the game loop down by section:
+    input handling, controller logic, sprite groups rebuild, blits,
+    `display.flip` and the clock tick. The times of the last frames are
+    kept to show their rolling p50/p99 in an on-screen overlay, and can
+    be dumped in a CSV file.
+
+    Times are exclusive: a section measured inside another one is not
+    charged to the outer one.
+
+    Attributes
+    ----------
+    frames (Deque[Tuple[float, ...]]):
+        Time of each section of the last frames, in seconds, in the
+        order of SECTIONS.
+    show (bool):
+        True to draw the overlay.
+    csv_path (str):
+        CSV file the frames are dumped in with the dump key.
+    refresh (int):
+        Number of frames between two updates of the overlay text.
+
+    Methods
+    ----------
+    start_frame() -> None:
+        Ends the current frame and starts a new one.
+    measure(section: str) -> Iterator[None]:
+        Context manager charging its time to a section.
+    handle_events(event_list: List[Event]) -> None:
+        Toggles the overlay and dumps the frames on key press.
+    percentiles() -> Dict[str, Tuple[float, float]]:
+        Returns the rolling p50 and p99 of each section.
+    dump_csv(path: str) -> None:
+        Writes the times of the last frames in a CSV file.
+    render(surface: pygame.Surface) -> None:
+        Draws the overlay if shown.
+
+    Private Methods
+    ----------
+    _switch(section: str) -> str:
+        Charges the elapsed time to the current section and switches
+        to another one.
+    _overlay_lines() -> List[str]:
+        Returns the text of the overlay.
+    """
+
+    def __init__(self,
+                window: int = 300,
+                csv_path: str = "frame_profile.csv",
+                refresh: int = 30
+            ) -> None:
+        """
+        Initializes the profiler, overlay hidden.
+
+        Args:
+            window (int, optional):
+                Number of frames of the rolling statistics. Defaults to
+                300.
+            csv_path (str, optional):
+                CSV file of the dump key. Defaults to
+                "frame_profile.csv".
+            refresh (int, optional):
+                Number of frames between two updates of the overlay
+                text. Defaults to 30.
+
+        Raises:
+            ValueError: If the window or the refresh is not positive
+        """
+        if window <= 0 or refresh <= 0:
+            raise ValueError("Window and refresh must be positive.")
+
+        self.frames: Deque[Tuple[float, ...]] = deque(maxlen=window)
+        self.show = False
+        self.csv_path = csv_path
+        self.refresh = refresh
+        self._times = dict.fromkeys(SECTIONS, 0.0)
+        self._section = DEFAULT_SECTION
+        self._last: Optional[float] = None
+        self._font: Optional[pygame.font.Font] = None
+        self._lines: List[str] = []
+        self._frame_count = 0
+
+    def start_frame(self) -> None:
+        """
+        Ends the current frame, keeping its times, and starts a new one
+        in the default section.
+        """
+        now = perf_counter()
+        if self._last is not None:
+            self._times[self._section] += now - self._last
+            self.frames.append(tuple(self._times.values()))
+            # The deque stops growing once full, frames are counted apart
+            self._frame_count += 1
+            if self.show and self._frame_count % self.refresh == 0:
+                self._lines = self._overlay_lines()
+        self._times = dict.fromkeys(SECTIONS, 0.0)
+        self._section = DEFAULT_SECTION
+        self._last = now
+
+    @contextmanager
+    def measure(self, section: str) -> Iterator[None]:
+        """
+        Charges the time spent in the block to a section, then returns
+        to the enclosing one.
+
+        Args:
+            section (str): Section of SECTIONS
+        """
+        previous = self._switch(section)
+        try:
+            yield
+        finally:
+            self._switch(previous)
+
+    def handle_events(self, event_list: List[Event]) -> None:
+        """
+        Toggles the overlay with the overlay key, and dumps the frames
+        in the CSV file with the dump key.
+
+        Args:
+            event_list (List[Event]): Pygame events list
+        """
+        for event in event_list:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == OVERLAY_KEY:
+                self.show = not self.show
+                self._lines = self._overlay_lines()
+            elif event.key == DUMP_KEY:
+                self.dump_csv(self.csv_path)
+
+    def percentiles(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Returns the rolling p50 and p99 of each section, and of the
+        whole frame, over the last frames.
+
+        Returns:
+            Dict[str, Tuple[float, float]]:
+                p50 and p99 in milliseconds, by section. "frame" is the
+                total. Empty before the first frame ends.
+        """
+        if not self.frames:
+            return {}
+        columns = list(zip(*self.frames))
+        columns.append(tuple(sum(frame) for frame in self.frames))
+        result = {}
+        for name, values in zip(SECTIONS + ("frame",), columns):
+            ordered = sorted(values)
+            result[name] = (ordered[len(ordered) // 2] * 1e3,
+                            ordered[min(len(ordered) - 1,
+                                        len(ordered) * 99 // 100)] * 1e3)
+        return result
+
+    def dump_csv(self, path: str) -> None:
+        """
+        Writes the times of the last frames in a CSV file, one row per
+        frame, in milliseconds.
+
+        Args:
+            path (str): Path of the CSV file
+        """
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame",) + SECTIONS + ("total",))
+            for index, frame in enumerate(self.frames):
+                writer.writerow([index]
+                                + [f"{x * 1e3:.3f}" for x in frame]
+                                + [f"{sum(frame) * 1e3:.3f}"])
+
+    def render(self, surface: pygame.Surface) -> None:
+        """
+        Draws the overlay in the top left corner of a surface, if
+        shown. Its time is charged to the blits.
+
+        Args:
+            surface (pygame.Surface): Surface of the display
+        """
+        if not self.show:
+            return
+        with self.measure("blit"):
+            if self._font is None:
+                self._font = pygame.font.Font(None, 18)
+            height = self._font.get_linesize()
+            background = pygame.Surface(
+                (230, height * len(self._lines) + 8))
+            background.set_alpha(180)
+            surface.blit(background, (0, 0))
+            for index, line in enumerate(self._lines):
+                surface.blit(self._font.render(line, True, (255, 255, 255)),
+                            (4, 4 + index * height))
+
+    # --- MÉTHODES PRIVÉES ---
+
+    def _switch(self, section: str) -> str:
+        """
+        Charges the time elapsed since the last switch to the current
+        section, then makes another section current.
+
+        Args:
+            section (str): The new current section
+
+        Returns:
+            str: The previous current section
+
+        Raises:
+            ValueError: If the section is unknown
+        """
+        if section not in self._times:
+            raise ValueError(f"Unknown frame section: {section}.")
+        now = perf_counter()
+        if self._last is not None:
+            self._times[self._section] += now - self._last
+        self._last = now
+        previous, self._section = self._section, section
+        return previous
+
+    def _overlay_lines(self) -> List[str]:
+        """
+        Returns the text of the overlay: the p50 and p99 of each
+        section.
+
+        Returns:
+            List[str]: Lines of the overlay
+        """
+        lines = [f"{'ms':<8}{'p50':>8}{'p99':>8}   n={len(self.frames)}"]
+        for name, (p50, p99) in self.percentiles().items():
+            lines.append(f"{name:<8}{p50:>8.2f}{p99:>8.2f}")
+        return lines
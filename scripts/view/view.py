@@ -2,11 +2,79 @@ from __future__ import annotations
 
 import random
 import math
-from typing import List, Tuple, Literal, Optional
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Literal, Optional
 import pygame
 from pygame.event import Event
 
-from scripts.utils.config import ANGLES, DISPLAY_SIZE, FPS, PIXEL_POSITION_LIST
+from scripts.utils.config import (ANGLES,
+                                DISPLAY_SIZE,
+                                FPS,
+                                PIXEL_POSITION_LIST,
+                                TILE_IMAGE_SIZE
+                            )
+from scripts.view.assets import get_assets
+from scripts.view.profiler import FrameProfiler
+
+
+@lru_cache(maxsize=None)
+def get_rotated_image(url_image: str,
+                    angle_index: int,
+                    size: Tuple[int, int] = TILE_IMAGE_SIZE
+                ) -> pygame.Surface:
+    """
+    Returns the image of a tile rotated and scaled. Each orientation of
+    an image is rendered once per process and shared by every tile with
+    this image: the surface must not be modified.
+
+    Args:
+        url_image (str): URL path of the image
+        angle_index (int): Rotational index, from 0 to 5
+        size (Tuple[int, int], optional):
+            Size of the tile image. Defaults to TILE_IMAGE_SIZE.
+
+    Returns:
+        pygame.Surface: The rotated image
+    """
+    rotated_image = pygame.transform.rotate(
+                get_assets().get_image(url_image),
+                angle = ANGLES[angle_index]
+                )
+
+    #Reshape image to avoid weird transfo. The image is not a square
+    if angle_index not in [0,3]:
+        rotated_image = rotated_image.subsurface((25, 42,200,173))
+
+    return pygame.transform.smoothscale(rotated_image, size)
+
+
+def get_tile_image_url(id_tile: str) -> str:
+    """
+    Returns the URL path of the image of a tile sprite, from its ID.
+
+    Args:
+        id_tile (str): ID of the tile
+
+    Returns:
+        str: URL path
+    """
+    for number in range(1, 8):
+        id_tile = id_tile.replace(str(number), "")
+    return "image/armies/"+id_tile+".png"
+
+
+def preload_rotated_images(id_tiles: Iterable[str]) -> None:
+    """
+    Renders the six orientations of the tile images in the cache of
+    `get_rotated_image`. Called at start-up, so that the first rotation
+    of a tile does not stall a frame.
+
+    Args:
+        id_tiles (Iterable[str]): IDs of the tiles
+    """
+    for url_image in set(map(get_tile_image_url, id_tiles)):
+        for angle_index in ANGLES:
+            get_rotated_image(url_image, angle_index)
 
 
 class TileManipulator:
@@ -79,24 +147,14 @@ class TileManipulator:
 
     def _preload_rotated_image(self) -> pygame.Surface:
         """
-        Preloads rotated image of the sprite image.
+        Returns the rotated image of the sprite image, rendered once
+        per process (see `get_rotated_image`).
         
         Return:
-            _ (List[pygame.Surface]): Rotated image
+            _ (pygame.Surface): Rotated image
         """
-        #Rotate image
-        rotated_image = pygame.transform.rotate(
-                    pygame.image.load(self.sprite.url_image),
-                    angle = ANGLES[self.sprite.angle_index]
-                    )
-
-        #Reshape image to avoid weird transfo. The image is not a square
-        if self.sprite.angle_index not in [0,3]:
-            rotated_image = rotated_image.subsurface((25, 42,200,173))
-
-        #Resize image
-        rotated_image = pygame.transform.smoothscale(rotated_image, (81,70))
-        return rotated_image
+        return get_rotated_image(self.sprite.url_image,
+                                self.sprite.angle_index)
 
     def _update_angle(self, event_list: List[Event]) -> None:
         """
@@ -231,14 +289,13 @@ class TileView(pygame.sprite.Sprite):
         Returns:
             str: URL path 
         """
-        for number in range(1, 8):
-            id_tile = id_tile.replace(str(number), "")
-        return "image/armies/"+id_tile+".png"
+        return get_tile_image_url(id_tile)
 
     def _load_and_scale_image(self, url_image: str) -> pygame.Surface:
         """
         Loads the image from the provided URL and scales it to fit
-        the tile dimensions.
+        the tile dimensions. The surface is shared by the tiles with
+        the same image.
 
         Args:
             url_image (str): URL path of the image
@@ -246,8 +303,7 @@ class TileView(pygame.sprite.Sprite):
         Returns:
             pygame.Surface: Pygame Surface
         """
-        image = pygame.image.load(url_image)
-        return pygame.transform.smoothscale(image, (81, 70))
+        return get_assets().get_image(url_image, TILE_IMAGE_SIZE)
 
     def _clean_postition(self) -> None:
         """
@@ -513,7 +569,8 @@ class EndButton(pygame.sprite.Sprite):
                 The surface on which the button is rendered.
         """
         super().__init__()
-        self.image: pygame.Surface = pygame.image.load("image/endbutton.png")
+        self.image: pygame.Surface = get_assets().get_image(
+                                                    "image/endbutton.png")
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.topleft = (700, 585)
         self.surface = surface
@@ -578,7 +635,7 @@ class DiscardZone(pygame.sprite.Sprite):
                 The surface on which the button is rendered.e.
         """
         super().__init__()
-        self.image = pygame.image.load("image/discardzone.png")
+        self.image = get_assets().get_image("image/discardzone.png")
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.topleft = (150, 150)
         self.surface = surface
@@ -625,7 +682,8 @@ class KeepZone(pygame.sprite.Sprite):
                 The surface on which the button is rendered.e.
         """
         super().__init__()
-        self.image: pygame.Surface = pygame.image.load("image/keepzone.png")
+        self.image: pygame.Surface = get_assets().get_image(
+                                                    "image/keepzone.png")
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.topleft = (745, 150)
         self.surface = surface
@@ -678,7 +736,8 @@ class RerollButton(pygame.sprite.Sprite):
                 Defaults to True.
         """
         super().__init__()
-        self.image: pygame.Surface= pygame.image.load("image/rerollbutton.png")
+        self.image: pygame.Surface= get_assets().get_image(
+                                                "image/rerollbutton.png")
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.topleft = (800, 585)
         self.surface: pygame.Surface = surface
@@ -871,7 +930,7 @@ class BoardZone():
         Renders a green transparent layer over the entire board.
         """
         self.drawsurf.fill(pygame.Color('#00000000'))
-        border = pygame.image.load("image/boardgreenboarder.png")
+        border = get_assets().get_image("image/boardgreenboarder.png")
         for hexagone in self.hexagones:
             hexagone.render(self.drawsurf,
                             (0,255,0,50),
@@ -1068,8 +1127,9 @@ class Button(pygame.sprite.Sprite):
             Default is `False`.
         """
         super().__init__()
-        self.image = pygame.image.load(f"image/{image}.png")
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = get_assets().get_image(f"image/{image}.png",
+                                            tuple(size),
+                                            smooth=False)
         self.rect = self.image.get_rect()
         self.rect.topleft = position
         self.validated = False
@@ -1158,12 +1218,20 @@ class View():
     allsprite (pygame.sprite.Group):
         A master sprite group containing all elements of the game
         (board, tiles, buttons, etc.).
+    rng (random.Random):
+        Random generator of the display, apart from the one of the
+        game.
+    profiler (FrameProfiler):
+        Times the sections of each frame, shown in a toggleable
+        overlay.
 
     Methods
     -------
     display_screen() -> None:
-        Renders the background image and updates the screen at a 
-        consistent frame rate.
+        Renders the background image.
+    end_frame() -> None:
+        Draws the profiler overlay, updates the screen and regulates
+        the frame rate.
     hand_tile_to_board() -> List[str]:
         Moves tiles from the player's hand to the board and returns their tile IDs.
     get_tile_to_discard() -> None:
@@ -1213,7 +1281,8 @@ class View():
         self.fps: int = FPS
         self.framepersec = pygame.time.Clock()
         self.displaysurf = pygame.display.set_mode(DISPLAY_SIZE)
-        self.background = pygame.image.load("image/board.jpg")
+        self.background = get_assets().get_image("image/board.jpg",
+                                                alpha=False)
         self.tiles_hand = pygame.sprite.Group()
         self.tiles_board = pygame.sprite.Group()
         self.tiles_deck = pygame.sprite.Group()
@@ -1224,15 +1293,27 @@ class View():
         self.keepzone = KeepZone(self.displaysurf)
         self.boardzone = BoardZone()
         self.allsprite = pygame.sprite.Group()
+        self.rng = random.Random()
+        self.profiler = FrameProfiler()
         pygame.display.set_caption("Neuroshima")
 
     def display_screen(self) -> None:
         """
-        Renders the background image and updates the screen at a
-        consistent frame rate.
+        Renders the background image.
         """
-        self.displaysurf.blit(self.background, (0,0))
-        self.framepersec.tick(144)
+        with self.profiler.measure("blit"):
+            self.displaysurf.blit(self.background, (0,0))
+
+    def end_frame(self) -> None:
+        """
+        Draws the profiler overlay, updates the screen and waits to
+        keep a consistent frame rate. Called once per frame.
+        """
+        self.profiler.render(self.displaysurf)
+        with self.profiler.measure("flip"):
+            pygame.display.flip()
+        with self.profiler.measure("tick"):
+            self.framepersec.tick(self.fps)
 
     def hand_tile_to_board(self)-> List[str]:
         """
@@ -1283,13 +1364,14 @@ class View():
         Args:
             id_tiles (List[str]): A list of tile IDs to add to the hand.
         """
-        self.tiles_hand.clear(self.displaysurf, self.displaysurf)
-        self.tiles_hand.empty()
-        i = 0
-        for id_tile in id_tiles:
-            tile = TileView(id_tile=id_tile, position=(150,240 + i*85))
-            self.tiles_hand.add(tile)
-            i+=1
+        with self.profiler.measure("sprites"):
+            self.tiles_hand.clear(self.displaysurf, self.displaysurf)
+            self.tiles_hand.empty()
+            i = 0
+            for id_tile in id_tiles:
+                tile = TileView(id_tile=id_tile, position=(150,240 + i*85))
+                self.tiles_hand.add(tile)
+                i+=1
 
     def get_tiles_deck(self, deck_size: int) -> None:
         """
@@ -1301,36 +1383,39 @@ class View():
             deck_size (int): The actual number of tiles in deck during
             the game.
         """
-        self.tiles_deck.clear(self.displaysurf, self.displaysurf)
-        self.tiles_deck.empty()
-        i=0
-        for i in range (0,deck_size):
-            tile = TileView(id_tile="borgo-qg",
-                            position=(
-                                10+ i*15 +random.randint(-5, 5), 
-                                600 + random.randint(-10, 10)
+        with self.profiler.measure("sprites"):
+            self.tiles_deck.clear(self.displaysurf, self.displaysurf)
+            self.tiles_deck.empty()
+            i=0
+            for i in range (0,deck_size):
+                tile = TileView(id_tile="borgo-qg",
+                                position=(
+                                    10+ i*15 +self.rng.randint(-5, 5), 
+                                    600 + self.rng.randint(-10, 10)
+                                    )
                                 )
-                            )
-            self.tiles_deck.add(tile)
+                self.tiles_deck.add(tile)
 
     def generate_all_sprite_group(self) -> None:
         """Compiles all game elements into single sprite groups for
         easier rendering and updating.
         """
-        self.allsprite.clear(self.displaysurf, self.displaysurf)
-        self.allsprite.empty()
-        self.allsprite.add(self.tiles_board)
-        self.allsprite.add(self.tiles_board_moving)
-        self.allsprite.add(self.tiles_hand)
-        self.allsprite.add(self.tiles_deck)
-        self.allsprite.add(self.endbutton)
-        self.allsprite.add(self.discardzone)
-        self.allsprite.add(self.keepzone)
+        with self.profiler.measure("sprites"):
+            self.allsprite.clear(self.displaysurf, self.displaysurf)
+            self.allsprite.empty()
+            self.allsprite.add(self.tiles_board)
+            self.allsprite.add(self.tiles_board_moving)
+            self.allsprite.add(self.tiles_hand)
+            self.allsprite.add(self.tiles_deck)
+            self.allsprite.add(self.endbutton)
+            self.allsprite.add(self.discardzone)
+            self.allsprite.add(self.keepzone)
 
     def display_all_sprite(self) -> None:
         """Renders the all sprite groups to the display surface.
         """
-        self.allsprite.draw(self.displaysurf)
+        with self.profiler.measure("blit"):
+            self.allsprite.draw(self.displaysurf)
 
     def move_tile_hand(self, event_list: List[Event]) -> None:
         """Handles moving tiles of the player's hand sprite group.
@@ -1340,7 +1425,8 @@ class View():
         """
         self.tiles_hand.update(event_list)
         self.display_screen()
-        self.tiles_hand.draw(self.displaysurf)
+        with self.profiler.measure("blit"):
+            self.tiles_hand.draw(self.displaysurf)
 
 
     def move_tile_board(self, event_list: List[Event]) -> None:
@@ -1351,7 +1437,8 @@ class View():
         """
         self.tiles_board_moving.update(event_list)
         self.display_screen()
-        self.tiles_board_moving.draw(self.displaysurf)
+        with self.profiler.measure("blit"):
+            self.tiles_board_moving.draw(self.displaysurf)
 
     def remove_tiles_board_moving(self) -> None:
         """Move tiles from tile_board_moving group the tiles_board group